@@ -5,14 +5,21 @@ A smart automation tool that uses AI to generate and execute comprehensive test
 for APIs based on OpenAPI (Swagger) specifications.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "AI-Powered API Auto-Tester Team"
 
-from .core.parser import OpenAPIParser
-from .core.generator import TestCaseGenerator
-from .core.executor import TestExecutor
-from .core.validator import ResponseValidator
-from .core.reporter import TestReporter
+# Public classes are imported on first access, so importing any submodule
+# (or running a CLI command that needs none of them) does not pull in
+# openai, jinja2, jsonschema and requests
+_EXPORTS = {
+    "OpenAPIParser": ".core.parser",
+    "TestCaseGenerator": ".core.generator",
+    "TestExecutor": ".core.executor",
+    "ResponseValidator": ".core.validator",
+    "TestReporter": ".core.reporter",
+}
 
 __all__ = [
     "OpenAPIParser",
@@ -20,4 +27,12 @@ __all__ = [
     "TestExecutor",
     "ResponseValidator",
     "TestReporter"
-] 
\ No newline at end of file
+] 
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,16 @@
 Core modules for the API Auto-Tester.
 """
 
-from .parser import OpenAPIParser
-from .generator import TestCaseGenerator
-from .executor import TestExecutor
-from .validator import ResponseValidator
-from .reporter import TestReporter
+import importlib
+
+# Imported on first access; see api_tester/__init__.py
+_EXPORTS = {
+    "OpenAPIParser": ".parser",
+    "TestCaseGenerator": ".generator",
+    "TestExecutor": ".executor",
+    "ResponseValidator": ".validator",
+    "TestReporter": ".reporter",
+}
 
 __all__ = [
     "OpenAPIParser",
@@ -14,4 +19,12 @@ __all__ = [
     "TestExecutor", 
     "ResponseValidator",
     "TestReporter"
-] 
\ No newline at end of file
+] 
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,23 @@
+"""
+Canonical serialization and hashing helpers.
+"""
+
+import hashlib
+import json
+from typing import Dict, Any, Optional
+
+
+def canonical_json(data: Any) -> str:
+    """Serialize data to a stable, compact JSON string (sorted keys, no whitespace)."""
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), default=str, ensure_ascii=False)
+
+
+def stable_hash(data: Any) -> str:
+    """Return a SHA-256 hex digest of the canonical JSON form of data."""
+    return hashlib.sha256(canonical_json(data).encode('utf-8')).hexdigest()
+
+
+def request_key(method: str, url: str, headers: Optional[Dict[str, Any]] = None, body: Any = None) -> str:
+    """Return a hash identifying an HTTP request independent of header case and key order."""
+    normalized_headers = {str(key).lower(): str(value) for key, value in (headers or {}).items()}
+    return stable_hash([method.upper(), url, normalized_headers, body])
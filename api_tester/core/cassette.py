@@ -0,0 +1,160 @@
+"""
+Record/replay cassettes for HTTP traffic.
+
+A cassette is a JSONL file with one request/response pair per line. Entries
+are keyed by a canonical hash of the request (method, URL, headers and body),
+so a replay only needs an in-memory index of byte offsets and reads response
+bodies from disk on demand. The generated test cases of each endpoint are
+stored alongside the traffic so a replayed run sends the exact same requests.
+"""
+
+import base64
+import json
+import threading
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..models.schemas import Endpoint, TestCase
+from .canonical import request_key
+
+
+class CassetteMissError(LookupError):
+    """Raised when a replayed request has no recorded response."""
+
+
+class Cassette:
+    """Records HTTP exchanges to a JSONL file and replays them offline."""
+
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[int]] = {}
+        self._replay_counts: Dict[str, int] = {}
+        self.entry_count = 0
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Line-buffered so every entry reaches disk whole even if the run is interrupted
+            self._file = open(self.path, 'w', encoding='utf-8', buffering=1)
+        else:
+            if not self.path.exists():
+                raise FileNotFoundError(f"Cassette file not found: {path}")
+            self._file = open(self.path, 'rb')
+            self._build_index()
+
+    @property
+    def is_replay(self) -> bool:
+        """Whether the cassette serves responses instead of recording them."""
+        return self.mode == "replay"
+
+    def _build_index(self):
+        """Scan the cassette once and index entry offsets by request key."""
+        offset = 0
+        for line in self._file:
+            if line.strip():
+                key = json.loads(line)['key']
+                self._index.setdefault(key, []).append(offset)
+                if not key.startswith('test_cases '):
+                    self.entry_count += 1
+            offset += len(line)
+
+    def record(self, method: str, url: str, headers: Dict[str, str], data: Optional[Any],
+               response: requests.Response, send_time: float):
+        """Append a request/response pair to the cassette."""
+        entry = {
+            'key': request_key(method, url, headers, data),
+            'method': method.upper(),
+            'url': url,
+            'request_headers': headers,
+            'request_body': data,
+            'status': response.status_code,
+            'headers': dict(response.headers),
+            'elapsed': response.elapsed.total_seconds(),
+            'send_time': send_time
+        }
+        try:
+            entry['body'] = response.content.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['body_b64'] = base64.b64encode(response.content).decode('ascii')
+
+        line = json.dumps(entry, separators=(',', ':'), default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self.entry_count += 1
+
+    def _test_cases_key(self, endpoint: Endpoint) -> str:
+        return f"test_cases {endpoint.method.value.upper()} {endpoint.path}"
+
+    def record_test_cases(self, endpoint: Endpoint, test_cases: List[TestCase]):
+        """Store the test cases generated for an endpoint."""
+        entry = {
+            'key': self._test_cases_key(endpoint),
+            'test_cases': [test_case.model_dump(mode='json') for test_case in test_cases]
+        }
+        line = json.dumps(entry, separators=(',', ':'), default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+
+    def replay_test_cases(self, endpoint: Endpoint) -> Optional[List[TestCase]]:
+        """Return the recorded test cases for an endpoint, if any."""
+        offsets = self._index.get(self._test_cases_key(endpoint))
+        if not offsets:
+            return None
+
+        with self._lock:
+            self._file.seek(offsets[-1])
+            entry = json.loads(self._file.readline())
+
+        return [TestCase.model_validate(data) for data in entry['test_cases']]
+
+    def replay(self, method: str, url: str, headers: Dict[str, str], data: Optional[Any]) -> Tuple[requests.Response, float]:
+        """Return the recorded response and send time for a request.
+
+        Repeated identical requests are served the recorded responses in
+        order, cycling back to the first once all of them have been used.
+        """
+        key = request_key(method, url, headers, data)
+        offsets = self._index.get(key)
+        if not offsets:
+            raise CassetteMissError(f"No recorded response for {method.upper()} {url}")
+
+        with self._lock:
+            count = self._replay_counts.get(key, 0)
+            self._replay_counts[key] = count + 1
+            self._file.seek(offsets[count % len(offsets)])
+            entry = json.loads(self._file.readline())
+
+        return self._build_response(entry), entry['send_time']
+
+    def _build_response(self, entry: Dict[str, Any]) -> requests.Response:
+        """Rebuild a requests.Response from a cassette entry."""
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.url = entry['url']
+        response.elapsed = timedelta(seconds=entry['elapsed'])
+        if 'body_b64' in entry:
+            response._content = base64.b64decode(entry['body_b64'])
+        else:
+            response._content = entry['body'].encode('utf-8')
+            response.encoding = 'utf-8'
+        return response
+
+    def close(self):
+        """Flush and close the cassette file."""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
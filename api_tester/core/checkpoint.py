@@ -0,0 +1,221 @@
+"""
+Run checkpoints for resuming interrupted test runs.
+
+Each run gets a directory under ``.runs/<run-id>`` holding append-only JSONL
+logs of generated test cases and validated results. Appends are flushed
+periodically, and a partially written last line (from a crash mid-write) is
+skipped on load, so a killed run loses at most the unflushed tail.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..models.schemas import Endpoint, TestCase, TestResult
+from .metrics import endpoint_key
+
+DEFAULT_RUNS_DIR = ".runs"
+
+
+def new_run_id() -> str:
+    """Return a sortable, unique run identifier."""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+class RunCheckpoint:
+    """Persists generated test cases and results of a run as it progresses."""
+
+    def __init__(self, run_id: Optional[str] = None, directory: str = DEFAULT_RUNS_DIR,
+                 flush_every: int = 50, flush_interval: float = 5.0, read_only: bool = False):
+        self.run_id = run_id or new_run_id()
+        self.path = Path(directory) / self.run_id
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+
+        self.metadata: Dict[str, Any] = {}
+        self._test_cases: Dict[str, List[TestCase]] = {}
+        self._results: Dict[Tuple[str, int], TestResult] = {}
+        self._pending_writes = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+
+        self.read_only = read_only
+        self._cases_file = None
+        self._results_file = None
+
+        if read_only:
+            self._load()
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._load()
+        self._cases_file = self._open_append(self.path / "test_cases.jsonl")
+        self._results_file = self._open_append(self.path / "results.jsonl")
+
+    @classmethod
+    def resume(cls, run_id: str, directory: str = DEFAULT_RUNS_DIR, **kwargs) -> "RunCheckpoint":
+        """Open the checkpoint of an earlier run."""
+        if not (Path(directory) / run_id).is_dir():
+            raise FileNotFoundError(f"No checkpoint found for run '{run_id}' in {directory}")
+        return cls(run_id, directory, **kwargs)
+
+    @classmethod
+    def recent_runs(cls, directory: str = DEFAULT_RUNS_DIR, spec: Optional[str] = None,
+                    exclude: Optional[str] = None) -> List[Tuple[Path, Dict[str, Any]]]:
+        """Return ``(run directory, metadata)`` of earlier runs, most recently updated first.
+
+        When ``spec`` is given, only runs started with that spec file qualify.
+        """
+        runs_dir = Path(directory)
+        if not runs_dir.is_dir():
+            return []
+        candidates = [path for path in runs_dir.iterdir() if path.name != exclude and (path / "meta.json").is_file()]
+        runs = []
+        # meta.json is rewritten when a run completes, so its mtime orders runs by completion
+        for run_path in sorted(candidates, key=lambda path: (path / "meta.json").stat().st_mtime, reverse=True):
+            try:
+                with open(run_path / "meta.json", 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if spec is not None and metadata.get('spec') != spec:
+                continue
+            runs.append((run_path, metadata))
+        return runs
+
+    @classmethod
+    def find_previous(cls, directory: str = DEFAULT_RUNS_DIR, spec: Optional[str] = None,
+                      exclude: Optional[str] = None) -> Optional["RunCheckpoint"]:
+        """Return the most recent completed run with endpoint fingerprints, read-only.
+
+        When ``spec`` is given, only runs started with that spec file qualify.
+        """
+        for run_path, metadata in cls.recent_runs(directory, spec, exclude):
+            if metadata.get('status') == 'completed' and metadata.get('fingerprints'):
+                return cls(run_path.name, directory, read_only=True)
+        return None
+
+    @classmethod
+    def iter_result_entries(cls, run_path: Path):
+        """Yield the raw ``{endpoint, index, result}`` entries of a run without building models."""
+        yield from cls._read_jsonl(Path(run_path) / "results.jsonl")
+
+    def _load(self):
+        """Load previously checkpointed cases, results and metadata."""
+        meta_path = self.path / "meta.json"
+        if meta_path.exists():
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                self.metadata = json.load(f)
+
+        for entry in self._read_jsonl(self.path / "test_cases.jsonl"):
+            self._test_cases[entry['endpoint']] = [TestCase.model_validate(tc) for tc in entry['test_cases']]
+
+        for entry in self._read_jsonl(self.path / "results.jsonl"):
+            self._results[(entry['endpoint'], entry['index'])] = TestResult.model_validate(entry['result'])
+
+    @staticmethod
+    def _open_append(file_path: Path):
+        """Open a log for appending, terminating any torn last line first."""
+        needs_newline = False
+        if file_path.exists() and file_path.stat().st_size:
+            with open(file_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+        handle = open(file_path, 'a', encoding='utf-8')
+        if needs_newline:
+            handle.write('\n')
+        return handle
+
+    @staticmethod
+    def _read_jsonl(file_path: Path):
+        if not file_path.exists():
+            return
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from an interrupted run
+                    continue
+
+    @property
+    def completed_results(self) -> int:
+        """Number of results already checkpointed."""
+        return len(self._results)
+
+    def get_test_cases(self, endpoint: Endpoint) -> Optional[List[TestCase]]:
+        """Return the checkpointed test cases for an endpoint, if any."""
+        return self._test_cases.get(endpoint_key(endpoint))
+
+    def save_test_cases(self, endpoint: Endpoint, test_cases: List[TestCase]):
+        """Checkpoint the generated test cases for an endpoint."""
+        key = endpoint_key(endpoint)
+        entry = {'endpoint': key, 'test_cases': [tc.model_dump(mode='json') for tc in test_cases]}
+        with self._lock:
+            self._test_cases[key] = test_cases
+            self._cases_file.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            # Generation is the expensive step, so never leave cases unflushed
+            self._cases_file.flush()
+
+    def get_result(self, endpoint: Endpoint, index: int) -> Optional[TestResult]:
+        """Return the checkpointed result of an endpoint's ``index``-th test case."""
+        return self._results.get((endpoint_key(endpoint), index))
+
+    def copy_endpoint(self, source: "RunCheckpoint", endpoint: Endpoint) -> bool:
+        """Carry an endpoint's test cases and results over from another run.
+
+        Only endpoints that completed in ``source`` are copied; returns whether
+        anything was copied.
+        """
+        test_cases = source.get_test_cases(endpoint)
+        if test_cases is None:
+            return False
+        results = [source.get_result(endpoint, index) for index in range(len(test_cases))]
+        if any(result is None for result in results):
+            return False
+
+        self.save_test_cases(endpoint, test_cases)
+        for index, result in enumerate(results):
+            self.save_result(endpoint, index, result)
+        return True
+
+    def save_result(self, endpoint: Endpoint, index: int, result: TestResult):
+        """Checkpoint a validated result."""
+        key = endpoint_key(endpoint)
+        entry = {'endpoint': key, 'index': index, 'result': result.model_dump(mode='json')}
+        with self._lock:
+            self._results[(key, index)] = result
+            self._results_file.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            self._pending_writes += 1
+            if self._pending_writes >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def update_metadata(self, **values):
+        """Merge values into the run metadata and persist it."""
+        with self._lock:
+            self.metadata.update(values)
+            tmp_path = self.path / "meta.json.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.metadata, f, indent=2, default=str)
+            os.replace(tmp_path, self.path / "meta.json")
+
+    def flush(self):
+        """Flush pending appends to disk."""
+        with self._lock:
+            self._results_file.flush()
+            self._cases_file.flush()
+            self._pending_writes = 0
+            self._last_flush = time.monotonic()
+
+    def close(self):
+        """Flush and close the checkpoint files."""
+        if self._results_file and not self._results_file.closed:
+            self.flush()
+            self._results_file.close()
+            self._cases_file.close()
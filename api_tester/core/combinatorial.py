@@ -0,0 +1,332 @@
+"""
+Bulk boundary and combinatorial test case generation.
+
+Boundary values are computed for all numeric and string parameters of an
+endpoint at once with array operations, then combined into a pairwise
+covering array (every pair of values of every two parameters appears in at
+least one case) or into a sample of the full cartesian product. Rows are
+value indices, so deduplication and coverage bookkeeping stay in numpy and
+only the final cases are materialized as Python objects.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.schemas import Endpoint, Parameter, ParameterLocation, TestCase
+from .metrics import endpoint_key
+from .schema_utils import SchemaSampler, json_media_schema, resolve_schema
+
+_LOCATION_SECTIONS = {
+    ParameterLocation.PATH: 'path_params',
+    ParameterLocation.QUERY: 'query_params',
+    ParameterLocation.HEADER: 'headers'
+}
+
+# Boundary strings longer than this are left out rather than sent in every case
+_MAX_STRING_LENGTH = 10000
+_NOMINAL_STRING_LENGTH = 8
+
+
+class _Missing:
+    """Marks a parameter that is left out of the request."""
+
+    def __repr__(self):
+        return '<missing>'
+
+
+MISSING = _Missing()
+
+
+class ParameterDomain:
+    """The values one parameter takes: valid boundary values first, nominal value at index 0."""
+
+    def __init__(self, param: Parameter, section: str, valid: List[Any], invalid: List[Tuple[Any, str]]):
+        self.param = param
+        self.section = section
+        self.valid = _unique(valid)
+        self.invalid = [(value, reason) for value, reason in _unique_pairs(invalid) if value not in self.valid]
+
+
+def _unique(values: List[Any]) -> List[Any]:
+    unique = []
+    for value in values:
+        # 1 == 1.0 == True in Python; keep them apart so types are not conflated
+        if not any(type(value) is type(seen) and value == seen for seen in unique):
+            unique.append(value)
+    return unique
+
+
+def _unique_pairs(pairs: List[Tuple[Any, str]]) -> List[Tuple[Any, str]]:
+    unique = []
+    for value, reason in pairs:
+        if not any(type(value) is type(seen) and value == seen for seen, _ in unique):
+            unique.append((value, reason))
+    return unique
+
+
+def _schema_type(schema: Dict[str, Any], param: Parameter) -> str:
+    schema_type = schema.get('type', param.type.value)
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != 'null'), 'string')
+    return schema_type
+
+
+def _bound(schema: Dict[str, Any], name: str, exclusive_name: str) -> Tuple[float, bool]:
+    """Return a bound and whether it is exclusive (OpenAPI 3.0 booleans or 3.1 numbers)."""
+    exclusive = schema.get(exclusive_name)
+    if isinstance(exclusive, (int, float)) and not isinstance(exclusive, bool):
+        return float(exclusive), True
+    value = schema.get(name)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value), exclusive is True
+    return np.nan, False
+
+
+def numeric_boundaries(schemas: List[Dict[str, Any]], integer: List[bool]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute boundary values for many numeric schemas at once.
+
+    Returns ``(valid, below, above, has_bounds)``: a ``(n, 5)`` matrix of valid
+    values (nominal, minimum, just above minimum, just below maximum,
+    maximum), the values just outside each range, and an ``(n, 2)`` mask of
+    which bounds the schemas declare.
+    """
+    bounds = [_bound(s, 'minimum', 'exclusiveMinimum') + _bound(s, 'maximum', 'exclusiveMaximum') for s in schemas]
+    raw = np.array([[lo, hi] for lo, _, hi, _ in bounds], dtype=float).reshape(-1, 2)
+    exclusive = np.array([[lo_x, hi_x] for _, lo_x, _, hi_x in bounds], dtype=bool).reshape(-1, 2)
+    integer = np.asarray(integer, dtype=bool)
+    has_lo, has_hi = ~np.isnan(raw[:, 0]), ~np.isnan(raw[:, 1])
+
+    # Tighten exclusive bounds to the nearest representable value inside the range
+    lo = np.where(integer, np.where(exclusive[:, 0], np.floor(raw[:, 0]) + 1, np.ceil(raw[:, 0])),
+                  np.where(exclusive[:, 0], np.nextafter(raw[:, 0], np.inf), raw[:, 0]))
+    hi = np.where(integer, np.where(exclusive[:, 1], np.ceil(raw[:, 1]) - 1, np.floor(raw[:, 1])),
+                  np.where(exclusive[:, 1], np.nextafter(raw[:, 1], -np.inf), raw[:, 1]))
+
+    # Unbounded sides get an arbitrary in-range value so the valid row stays valid
+    lo = np.where(has_lo, lo, np.where(has_hi, np.minimum(0, hi - 100), 0))
+    hi = np.where(has_hi, hi, np.maximum(lo, 0) + 100)
+    hi = np.maximum(hi, lo)
+
+    up = np.where(integer, lo + 1, np.nextafter(lo, np.inf))
+    down = np.where(integer, hi - 1, np.nextafter(hi, -np.inf))
+    mid = (lo + hi) / 2
+    mid = np.where(integer, np.floor(mid), mid)
+    valid = np.clip(np.stack([mid, lo, up, down, hi], axis=1), lo[:, None], hi[:, None])
+
+    below = np.where(integer, lo - 1, np.nextafter(lo, -np.inf))
+    above = np.where(integer, hi + 1, np.nextafter(hi, np.inf))
+    return valid, below, above, np.stack([has_lo, has_hi], axis=1)
+
+
+def string_lengths(schemas: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute boundary lengths for many string schemas at once.
+
+    Returns ``(valid, too_short, too_long)``: a ``(n, 3)`` matrix of valid
+    lengths (nominal, minLength, maxLength) and the lengths just outside the
+    range, ``-1`` where the schema sets no such limit.
+    """
+    min_length = np.array([s.get('minLength', 0) for s in schemas], dtype=np.int64)
+    max_length = np.array([s.get('maxLength', -1) for s in schemas], dtype=np.int64)
+    has_max = max_length >= 0
+    upper = np.where(has_max, max_length, np.maximum(min_length, _NOMINAL_STRING_LENGTH))
+    nominal = np.clip(_NOMINAL_STRING_LENGTH, min_length, np.maximum(upper, min_length))
+    valid = np.stack([nominal, min_length, upper], axis=1)
+    too_short = np.where(min_length > 0, min_length - 1, -1)
+    too_long = np.where(has_max, max_length + 1, -1)
+    return valid, too_short, too_long
+
+
+def parameter_domains(endpoint: Endpoint, spec_data: Optional[Dict[str, Any]] = None,
+                      sampler: Optional[SchemaSampler] = None) -> List[ParameterDomain]:
+    """Build the valid and invalid value domains of every path, query and header parameter."""
+    spec_data = spec_data or {}
+    sampler = sampler or SchemaSampler(spec_data, seed=0)
+    params = [p for p in endpoint.parameters if p.location in _LOCATION_SECTIONS]
+    schemas = [resolve_schema(p.param_schema or {'type': p.type.value}, spec_data) for p in params]
+    types = [_schema_type(schema, param) for schema, param in zip(schemas, params)]
+
+    numeric = [i for i, (schema, t) in enumerate(zip(schemas, types))
+               if t in ('integer', 'number') and not schema.get('enum')]
+    strings = [i for i, (schema, t) in enumerate(zip(schemas, types))
+               if t == 'string' and not schema.get('enum') and not schema.get('format') and not schema.get('pattern')]
+
+    valid: Dict[int, List[Any]] = {}
+    invalid: Dict[int, List[Tuple[Any, str]]] = {i: [] for i in range(len(params))}
+
+    if numeric:
+        is_integer = [types[i] == 'integer' for i in numeric]
+        values, below, above, has_bounds = numeric_boundaries([schemas[i] for i in numeric], is_integer)
+        cast = [int if integer else float for integer in is_integer]
+        for row, i in enumerate(numeric):
+            valid[i] = [cast[row](v) for v in values[row]]
+            if has_bounds[row, 0]:
+                invalid[i].append((cast[row](below[row]), 'below minimum'))
+            if has_bounds[row, 1]:
+                invalid[i].append((cast[row](above[row]), 'above maximum'))
+
+    if strings:
+        lengths, too_short, too_long = string_lengths([schemas[i] for i in strings])
+        for row, i in enumerate(strings):
+            valid[i] = ['a' * int(n) for n in lengths[row] if n <= _MAX_STRING_LENGTH]
+            if too_short[row] >= 0:
+                invalid[i].append(('a' * int(too_short[row]), 'too short'))
+            if 0 <= too_long[row] <= _MAX_STRING_LENGTH:
+                invalid[i].append(('a' * int(too_long[row]), 'too long'))
+
+    domains = []
+    for i, (param, schema, schema_type) in enumerate(zip(params, schemas, types)):
+        if i not in valid:
+            if schema.get('enum'):
+                valid[i] = list(schema['enum'])
+                outside = 'not_in_enum' if schema_type == 'string' else max(
+                    (v for v in schema['enum'] if isinstance(v, (int, float))), default=0) + 1
+                invalid[i].append((outside, 'not in enum'))
+            elif schema_type == 'boolean':
+                valid[i] = [True, False]
+            else:
+                sample = sampler.sample(schema)
+                valid[i] = [sample if sample is not None else param.example]
+                if schema.get('format'):
+                    invalid[i].append((f"not-a-{schema['format']}", 'wrong format'))
+
+        if schema_type in ('integer', 'number', 'boolean'):
+            invalid[i].append((f"not_a_{schema_type}", 'wrong type'))
+        if param.required:
+            invalid[i].append((MISSING, 'missing'))
+        elif param.location != ParameterLocation.PATH:
+            # Leaving an optional parameter out is a valid combination too
+            valid[i].append(MISSING)
+        domains.append(ParameterDomain(param, _LOCATION_SECTIONS[param.location], valid[i], invalid[i]))
+    return domains
+
+
+def pairwise_indices(sizes: List[int], seed: Optional[int] = None, candidates: int = 64) -> np.ndarray:
+    """Build a pairwise covering array over parameters with the given domain sizes.
+
+    Greedy AETG-style construction: each row is the best of ``candidates``
+    random rows, all seeded with the first still uncovered pair. Coverage of
+    every parameter pair lives in one flat boolean array, so scoring all
+    candidates is a single gather.
+    """
+    sizes = np.asarray(sizes, dtype=np.int64)
+    count = len(sizes)
+    if count < 2 or sizes.min(initial=1) == 0:
+        return product_indices(sizes.tolist(), max_rows=None)
+
+    first, second = np.triu_indices(count, k=1)
+    block = sizes[first] * sizes[second]
+    offsets = np.concatenate([[0], np.cumsum(block)[:-1]])
+    uncovered = np.ones(int(block.sum()), dtype=bool)
+    rng = np.random.default_rng(seed)
+
+    rows = []
+    remaining = uncovered.size
+    while remaining:
+        position = int(np.argmax(uncovered))
+        pair = int(np.searchsorted(offsets, position, side='right') - 1)
+        a, b = divmod(position - int(offsets[pair]), int(sizes[second[pair]]))
+
+        pool = rng.integers(0, sizes, size=(candidates, count))
+        pool[:, first[pair]] = a
+        pool[:, second[pair]] = b
+        cells = offsets + pool[:, first] * sizes[second] + pool[:, second]
+        gain = uncovered[cells].sum(axis=1)
+        best = int(np.argmax(gain))
+
+        uncovered[cells[best]] = False
+        remaining -= int(gain[best])
+        rows.append(pool[best])
+    return np.unique(np.array(rows), axis=0)
+
+
+def product_indices(sizes: List[int], max_rows: Optional[int] = 1000, seed: Optional[int] = None) -> np.ndarray:
+    """Rows of the full cartesian product, or a uniform sample of ``max_rows`` distinct rows."""
+    if not sizes:
+        return np.zeros((1, 0), dtype=np.int64)
+    total = int(np.prod([int(size) for size in sizes], dtype=object))
+    if total == 0:
+        return np.zeros((0, len(sizes)), dtype=np.int64)
+    if max_rows is None or total <= max_rows:
+        return np.indices(sizes).reshape(len(sizes), -1).T
+    rng = np.random.default_rng(seed)
+    if total < 2 ** 62:
+        # Sample row numbers and decode them in the mixed radix of the domain sizes
+        flat = np.sort(rng.choice(total, size=max_rows, replace=False))
+        return np.stack(np.unravel_index(flat, sizes), axis=1)
+    return np.unique(rng.integers(0, sizes, size=(max_rows, len(sizes))), axis=0)
+
+
+class BulkGenerator:
+    """Generates boundary and combinatorial test cases from parameter schemas without an LLM."""
+
+    STRATEGIES = ('pairwise', 'product')
+
+    def __init__(self, spec_data: Optional[Dict[str, Any]] = None, strategy: str = 'pairwise',
+                 max_cases: int = 1000, seed: Optional[int] = None, include_invalid: bool = True):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}', expected one of {', '.join(self.STRATEGIES)}")
+        self.spec_data = spec_data or {}
+        self.strategy = strategy
+        self.max_cases = max_cases
+        self.seed = seed
+        self.include_invalid = include_invalid
+        self.sampler = SchemaSampler(self.spec_data, seed=seed)
+
+    def generate_test_cases(self, endpoint: Endpoint) -> List[TestCase]:
+        """Return valid combinations first, then one case per invalid value."""
+        domains = parameter_domains(endpoint, self.spec_data, self.sampler)
+        sizes = [len(domain.valid) for domain in domains]
+        if self.strategy == 'pairwise':
+            rows = pairwise_indices(sizes, seed=self.seed)[:self.max_cases]
+        else:
+            rows = product_indices(sizes, max_rows=self.max_cases, seed=self.seed)
+
+        body = self._body(endpoint)
+        success = sorted(status for status in endpoint.responses if str(status).startswith('2'))
+        expected = int(success[0]) if success and str(success[0]).isdigit() else 200
+        key = endpoint_key(endpoint)
+
+        test_cases = []
+        for number, row in enumerate(rows.tolist(), 1):
+            input_data = self._input_data(domains, [domain.valid[index] for domain, index in zip(domains, row)], body)
+            test_cases.append(TestCase(
+                endpoint=endpoint,
+                name=f"{self.strategy.capitalize()} {key} #{number}",
+                description=f"{self.strategy.capitalize()} combination of boundary values",
+                input_data=input_data,
+                expected_status=expected,
+                test_type="boundary",
+                tags=["boundary", self.strategy]
+            ))
+
+        if self.include_invalid:
+            # One fault per case: combining invalid values hides which one was rejected
+            nominal = [domain.valid[0] for domain in domains]
+            for position, domain in enumerate(domains):
+                for value, reason in domain.invalid:
+                    values = list(nominal)
+                    values[position] = value
+                    test_cases.append(TestCase(
+                        endpoint=endpoint,
+                        name=f"Invalid {domain.param.name} ({reason})",
+                        description=f"{domain.param.name} is {reason}; other parameters take nominal values",
+                        input_data=self._input_data(domains, values, body),
+                        expected_status=400,
+                        test_type="invalid",
+                        tags=["invalid", "boundary", self.strategy]
+                    ))
+        return test_cases
+
+    def _body(self, endpoint: Endpoint) -> Any:
+        schema = json_media_schema((endpoint.request_body or {}).get('content', {}))
+        body = self.sampler.sample(schema) if schema else None
+        return body if body is not None else {}
+
+    @staticmethod
+    def _input_data(domains: List[ParameterDomain], values: List[Any], body: Any) -> Dict[str, Any]:
+        input_data: Dict[str, Any] = {'query_params': {}, 'path_params': {}, 'headers': {}, 'body': body}
+        for domain, value in zip(domains, values):
+            if value is not MISSING:
+                input_data[domain.section][domain.param.name] = value
+        return input_data
@@ -0,0 +1,235 @@
+"""
+Run-to-run comparison: new failures, fixed cases and latency changes.
+
+Results of two runs (checkpoint directories or saved reports) are read as
+flat rows, without building models, and aligned by endpoint and test case
+with a hash join. Latency changes per endpoint are tested for significance
+with a Mann-Whitney U test, which makes no assumption about the shape of
+latency distributions (they are rarely normal), and the p-values are
+corrected for testing many endpoints at once.
+"""
+
+import csv
+import json
+import math
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .checkpoint import RunCheckpoint, DEFAULT_RUNS_DIR
+from .streaming import open_text, strip_compression_suffix
+
+_FAILED_STATUSES = ('failed', 'error')
+
+Row = Dict[str, Any]  # endpoint, test_case, status, latency_ms, deduplicated
+RowKey = Tuple[str, str, int]  # endpoint, test case name, occurrence
+
+
+def _row(result: Dict[str, Any], endpoint: Optional[str] = None) -> Row:
+    """Extract the compared fields from a serialized ``TestResult``."""
+    test_case = result.get('test_case') or {}
+    if endpoint is None:
+        endpoint = test_case.get('endpoint')
+        if isinstance(endpoint, dict):
+            endpoint = f"{str(endpoint.get('method', '')).upper()} {endpoint.get('path')}"
+    execution_time = result.get('execution_time')
+    return {
+        'endpoint': endpoint,
+        'test_case': test_case.get('name'),
+        'status': result.get('status'),
+        'latency_ms': execution_time * 1000 if execution_time is not None else None,
+        'deduplicated': bool(result.get('deduplicated'))
+    }
+
+
+def resolve_source(source: str, runs_dir: str = DEFAULT_RUNS_DIR) -> Path:
+    """Return the run directory or report file named by ``source`` (a path or a run ID)."""
+    path = Path(source)
+    if not path.exists() and (Path(runs_dir) / source).is_dir():
+        path = Path(runs_dir) / source
+    if not path.exists():
+        raise FileNotFoundError(f"No run or report found for {source} (looked in {runs_dir})")
+    return path
+
+
+def iter_rows(source: str, runs_dir: str = DEFAULT_RUNS_DIR) -> Iterator[Row]:
+    """Yield the results of a run checkpoint or a json, jsonl or csv report (optionally compressed)."""
+    path = resolve_source(source, runs_dir)
+    if path.is_dir():
+        # A resumed run may log a result more than once; the last entry wins, as on resume
+        latest = {}
+        for entry in RunCheckpoint.iter_result_entries(path):
+            latest[(entry['endpoint'], entry['index'])] = entry
+        for (endpoint, _), entry in sorted(latest.items()):
+            yield _row(entry['result'], endpoint)
+        return
+
+    name = strip_compression_suffix(path)
+    with open_text(path) as f:
+        if name.endswith('.csv'):
+            for record in csv.DictReader(f):
+                yield {
+                    'endpoint': record['endpoint'],
+                    'test_case': record['test_case'],
+                    'status': record['status'],
+                    'latency_ms': float(record['latency_ms']) if record['latency_ms'] else None,
+                    'deduplicated': record.get('deduplicated') == 'True'
+                }
+        elif name.endswith('.jsonl'):
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    if entry.get('type') == 'result':
+                        yield _row(entry)
+        elif name.endswith('.json'):
+            for result in json.load(f).get('test_results', []):
+                yield _row(result)
+        else:
+            raise ValueError(f"Unsupported results file: {path} (expected a run directory or a json, jsonl or csv report)")
+
+
+def index_rows(rows: Iterable[Row]) -> Dict[RowKey, Row]:
+    """Key rows by ``(endpoint, test case, occurrence)``; repeated names are told apart by order."""
+    seen: Dict[Tuple[str, str], int] = defaultdict(int)
+    index = {}
+    for row in rows:
+        name = (row['endpoint'], row['test_case'])
+        index[name + (seen[name],)] = row
+        seen[name] += 1
+    return index
+
+
+def mann_whitney_u(a: np.ndarray, b: np.ndarray) -> Tuple[float, float]:
+    """Two-sided Mann-Whitney U test; return (U of ``a``, p-value).
+
+    Uses the normal approximation with tie and continuity corrections,
+    which is accurate from about five samples per side.
+    """
+    n1, n2 = len(a), len(b)
+    values = np.concatenate([a, b])
+    order = np.argsort(values, kind='mergesort')
+    # Tied values share the average of their ranks
+    _, starts, counts = np.unique(values[order], return_index=True, return_counts=True)
+    ranks = np.empty(len(values))
+    ranks[order] = np.repeat(starts + (counts + 1) / 2.0, counts)
+
+    u1 = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    ties = float((counts ** 3 - counts).sum())
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return u1, 1.0
+    z = max(abs(u1 - n1 * n2 / 2) - 0.5, 0.0) / math.sqrt(variance)
+    return u1, min(1.0, math.erfc(z / math.sqrt(2)))
+
+
+def fdr_adjust(p_values: List[float]) -> List[float]:
+    """Benjamini-Hochberg adjusted p-values, bounding the share of false positives among flagged endpoints."""
+    m = len(p_values)
+    adjusted = [1.0] * m
+    running = 1.0
+    for rank, index in reversed(list(enumerate(sorted(range(m), key=lambda i: p_values[i]), start=1))):
+        running = min(running, p_values[index] * m / rank)
+        adjusted[index] = running
+    return adjusted
+
+
+def _latency_samples(rows: Iterable[Row]) -> Dict[str, np.ndarray]:
+    # A deduplicated result repeats another request's latency, not a new sample
+    samples: Dict[str, List[float]] = defaultdict(list)
+    for row in rows:
+        if row['latency_ms'] is not None and row['status'] != 'skipped' and not row['deduplicated']:
+            samples[row['endpoint']].append(row['latency_ms'])
+    return {endpoint: np.asarray(values, dtype=float) for endpoint, values in samples.items()}
+
+
+def compare_latency(a: Dict[str, np.ndarray], b: Dict[str, np.ndarray], alpha: float = 0.05,
+                    min_change: float = 0.10, min_delta_ms: float = 1.0, min_samples: int = 5) -> List[Dict[str, Any]]:
+    """Compare per-endpoint latency samples, largest relative slowdown first.
+
+    An endpoint is ``slower`` or ``faster`` when its median moved by at
+    least ``min_change`` and ``min_delta_ms``, and the difference is significant at ``alpha``
+    after a false discovery rate correction over all tested endpoints; with
+    fewer than ``min_samples`` samples on either side it is
+    ``insufficient``.
+    """
+    rows = []
+    for endpoint in sorted(set(a) & set(b)):
+        before, after = a[endpoint], b[endpoint]
+        median_before, median_after = float(np.median(before)), float(np.median(after))
+        change = (median_after - median_before) / median_before if median_before > 0 else 0.0
+        p_value = None
+        if min(len(before), len(after)) >= min_samples:
+            _, p_value = mann_whitney_u(before, after)
+        rows.append({
+            'endpoint': endpoint,
+            'samples_a': len(before),
+            'samples_b': len(after),
+            'median_ms_a': median_before,
+            'median_ms_b': median_after,
+            'p90_ms_a': float(np.percentile(before, 90)),
+            'p90_ms_b': float(np.percentile(after, 90)),
+            'change': change,
+            'p_value': p_value,
+            'p_adjusted': None,
+            'verdict': 'insufficient'
+        })
+
+    tested = [row for row in rows if row['p_value'] is not None]
+    for row, p_adjusted in zip(tested, fdr_adjust([row['p_value'] for row in tested])):
+        row['p_adjusted'] = p_adjusted
+        relevant = p_adjusted < alpha and abs(row['median_ms_b'] - row['median_ms_a']) >= min_delta_ms
+        if relevant and row['change'] >= min_change:
+            row['verdict'] = 'slower'
+        elif relevant and row['change'] <= -min_change:
+            row['verdict'] = 'faster'
+        else:
+            row['verdict'] = 'unchanged'
+    rows.sort(key=lambda row: row['change'], reverse=True)
+    return rows
+
+
+def diff_runs(rows_a: Iterable[Row], rows_b: Iterable[Row], alpha: float = 0.05, min_change: float = 0.10,
+              min_delta_ms: float = 1.0, min_samples: int = 5) -> Dict[str, Any]:
+    """Align two runs' results and report status changes and latency changes per endpoint."""
+    rows_a, rows_b = list(rows_a), list(rows_b)
+    index_a, index_b = index_rows(rows_a), index_rows(rows_b)
+
+    new_failures, fixed, still_failing = [], [], []
+    matched = 0
+    for key, after in index_b.items():
+        before = index_a.get(key)
+        if before is None:
+            continue
+        matched += 1
+        failed_before = before['status'] in _FAILED_STATUSES
+        failed_after = after['status'] in _FAILED_STATUSES
+        change = {'endpoint': key[0], 'test_case': key[1], 'status_a': before['status'], 'status_b': after['status']}
+        if failed_after and not failed_before and before['status'] != 'skipped':
+            new_failures.append(change)
+        elif failed_before and after['status'] == 'passed':
+            fixed.append(change)
+        elif failed_before and failed_after:
+            still_failing.append(change)
+
+    def summarize(rows: List[Row]) -> Dict[str, int]:
+        return {
+            'results': len(rows),
+            'failed': len([row for row in rows if row['status'] in _FAILED_STATUSES])
+        }
+
+    return {
+        'a': summarize(rows_a),
+        'b': summarize(rows_b),
+        'matched': matched,
+        'added': [{'endpoint': key[0], 'test_case': key[1]} for key in index_b if key not in index_a],
+        'removed': [{'endpoint': key[0], 'test_case': key[1]} for key in index_a if key not in index_b],
+        'new_failures': new_failures,
+        'fixed': fixed,
+        'still_failing': still_failing,
+        'latency': compare_latency(_latency_samples(rows_a), _latency_samples(rows_b),
+                                   alpha=alpha, min_change=min_change, min_delta_ms=min_delta_ms,
+                                   min_samples=min_samples)
+    }
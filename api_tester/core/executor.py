@@ -4,22 +4,41 @@ HTTP request executor for API testing.
 
 import time
 import json
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 import requests
 from urllib.parse import urljoin, urlencode
 
 from ..models.schemas import TestCase, TestResult, TestStatus, Endpoint
+from .cassette import Cassette
+from .canonical import request_key
+from . import profiling, telemetry
+
+# Methods whose identical requests are sent once by default; repeating any
+# other method can change server state, so its responses may differ
+SAFE_METHODS = ('get', 'head', 'options')
 
 
 class TestExecutor:
     """Executes test cases by sending HTTP requests to API endpoints."""
     
-    def __init__(self, base_url: Optional[str] = None, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, base_url: Optional[str] = None, timeout: int = 30, max_retries: int = 3,
+                 request_delay: float = 0.1, cassette: Optional[Cassette] = None, dedupe: bool = True,
+                 http2: bool = False, dedupe_unsafe: bool = False):
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
+        self.request_delay = request_delay
+        self.cassette = cassette
+        self.dedupe = dedupe
+        self.dedupe_unsafe = dedupe_unsafe
         self.session = requests.Session()
         
+        # Optional multiplexed HTTP/2 transport; requests stays the HTTP/1.1 default
+        self.transport = None
+        if http2:
+            from .transport import Http2Transport
+            self.transport = Http2Transport(timeout=timeout)
+        
         # Set default headers
         self.session.headers.update({
             'Content-Type': 'application/json',
@@ -28,29 +47,57 @@ class TestExecutor:
     
     def execute_test_case(self, test_case: TestCase) -> TestResult:
         """Execute a single test case and return the result."""
-        start_time = time.time()
+        endpoint = test_case.endpoint
+        with telemetry.span("execute_test_case", **{
+            "http.method": endpoint.method.value.upper(),
+            "http.route": endpoint.path,
+            "test.name": test_case.name,
+            "test.type": test_case.test_type
+        }) as span:
+            result = self._execute_test_case(test_case)
+            span.set_attribute("test.status", result.status.value)
+            if result.response_status is not None:
+                span.set_attribute("http.status_code", result.response_status)
+            if result.error_message:
+                span.set_error(result.error_message)
+        
+        telemetry.record_request(endpoint.method.value, endpoint.path, result.response_status, result.execution_time)
+        return result
+    
+    def _execute_test_case(self, test_case: TestCase) -> TestResult:
+        """Build, send and time the request for a test case."""
+        start_time = time.perf_counter()
         
         try:
             # Build the request
             url, headers, data = self._build_request(test_case)
             
-            # Send the request
-            response = self._send_request(test_case.endpoint.method.value, url, headers, data)
+            build_time = time.perf_counter() - start_time
+            
+            # Send the request (or replay it from the cassette)
+            with profiling.stage("executor.request", method=test_case.endpoint.method.value, path=test_case.endpoint.path):
+                response, send_time = self._dispatch_request(test_case.endpoint.method.value, url, headers, data)
+            profiling.count("executor.requests")
+            profiling.count("executor.bytes_received", len(response.content))
             
             # Calculate execution time
-            execution_time = time.time() - start_time
+            execution_time = build_time + send_time
             
             # Determine test status
-            status = self._determine_test_status(test_case, response)
+            status = self._determine_test_status(test_case, response.status_code)
+            
+            with profiling.stage("executor.parse_body"):
+                response_body = self._parse_response_body(response)
             
             # Create test result
             test_result = TestResult(
                 test_case=test_case,
                 status=status,
                 response_status=response.status_code,
-                response_body=self._parse_response_body(response),
+                response_body=response_body,
                 response_headers=dict(response.headers),
                 execution_time=execution_time,
+                timings=self._split_timings(response, send_time, execution_time),
                 error_message=None
             )
             
@@ -58,7 +105,8 @@ class TestExecutor:
             
         except Exception as e:
             # Handle any exceptions during execution
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
+            profiling.count("executor.errors")
             
             return TestResult(
                 test_case=test_case,
@@ -67,29 +115,76 @@ class TestExecutor:
                 response_body=None,
                 response_headers=None,
                 execution_time=execution_time,
+                timings={'total': execution_time},
                 error_message=str(e)
             )
     
-    def execute_test_cases(self, test_cases: List[TestCase]) -> List[TestResult]:
-        """Execute multiple test cases and return results."""
+    def execute_test_cases(self, test_cases: List[TestCase],
+                           on_result: Optional[Callable[[int, TestResult], bool]] = None) -> List[TestResult]:
+        """Execute multiple test cases and return results.
+        
+        With ``dedupe`` enabled, GET, HEAD and OPTIONS test cases that build
+        the same request (method, URL, headers and body) are sent once and
+        the response is shared by all of them. Other methods are deduplicated
+        only with ``dedupe_unsafe``.
+        
+        ``on_result`` is called with the position and result of each test
+        case as soon as it is available; returning True stops execution, and
+        only the results so far are returned.
+        """
         results = []
+        executed: Dict[str, TestResult] = {}
         
         for test_case in test_cases:
+            key = self._request_key(test_case) if self.dedupe else None
+            if key is not None and key in executed:
+                results.append(self._fan_out(executed[key], test_case))
+                profiling.count("executor.deduplicated")
+                if on_result and on_result(len(results) - 1, results[-1]):
+                    break
+                continue
+            
             result = self.execute_test_case(test_case)
             results.append(result)
+            if key is not None:
+                executed[key] = result
+            if on_result and on_result(len(results) - 1, result):
+                break
             
             # Add a small delay between requests to be respectful
-            time.sleep(0.1)
+            if self.request_delay and not (self.cassette and self.cassette.is_replay):
+                time.sleep(self.request_delay)
         
         return results
     
+    def _request_key(self, test_case: TestCase) -> Optional[str]:
+        """Return the canonical hash of the request a test case sends, if it may be deduplicated."""
+        if test_case.endpoint.method.value not in SAFE_METHODS and not self.dedupe_unsafe:
+            return None
+        try:
+            url, headers, data = self._build_request(test_case)
+        except Exception:
+            return None
+        return request_key(test_case.endpoint.method.value, url, headers, data)
+    
+    def _fan_out(self, result: TestResult, test_case: TestCase) -> TestResult:
+        """Reuse an executed result for an equivalent test case.
+
+        The copy is marked ``deduplicated``: its timings belong to the one
+        request actually sent, so latency statistics count them only once.
+        """
+        status = result.status
+        if result.response_status is not None:
+            status = self._determine_test_status(test_case, result.response_status)
+        return result.model_copy(update={'test_case': test_case, 'status': status, 'deduplicated': True})
+    
     def _build_request(self, test_case: TestCase) -> tuple[str, Dict[str, str], Optional[Any]]:
         """Build the HTTP request from a test case."""
         endpoint = test_case.endpoint
         input_data = test_case.input_data
         
         # Build URL
-        url = self._build_url(endpoint.path, input_data.get('path_params', {}))
+        url = self._build_url(endpoint.path, input_data.get('path_params', {}), input_data.get('query_params', {}))
         
         # Build headers
         headers = self._build_headers(input_data.get('headers', {}))
@@ -99,8 +194,8 @@ class TestExecutor:
         
         return url, headers, data
     
-    def _build_url(self, path: str, path_params: Dict[str, Any]) -> str:
-        """Build the complete URL with path parameters."""
+    def _build_url(self, path: str, path_params: Dict[str, Any], query_params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the complete URL with path and query parameters."""
         # Replace path parameters in the URL
         url_path = path
         for param_name, param_value in path_params.items():
@@ -108,6 +203,10 @@ class TestExecutor:
             if placeholder in url_path:
                 url_path = url_path.replace(placeholder, str(param_value))
         
+        # Append query parameters (lists become repeated keys)
+        if query_params:
+            url_path = f"{url_path}?{urlencode(query_params, doseq=True)}"
+        
         # Join with base URL
         if self.base_url:
             return urljoin(self.base_url, url_path)
@@ -138,13 +237,32 @@ class TestExecutor:
         
         return None
     
+    def _dispatch_request(self, method: str, url: str, headers: Dict[str, str], data: Optional[Any]) -> tuple[requests.Response, float]:
+        """Send a request, recording or replaying it through the cassette if one is set."""
+        if self.cassette and self.cassette.is_replay:
+            return self.cassette.replay(method, url, headers, data)
+        
+        send_start = time.perf_counter()
+        response = self._send_request(method, url, headers, data)
+        send_time = time.perf_counter() - send_start
+        
+        if self.cassette:
+            self.cassette.record(method, url, headers, data, response, send_time)
+        
+        return response, send_time
+    
     def _send_request(self, method: str, url: str, headers: Dict[str, str], data: Optional[Any]) -> requests.Response:
         """Send the HTTP request with retry logic."""
         method = method.lower()
         
         for attempt in range(self.max_retries):
             try:
-                if method == 'get':
+                if self.transport is not None:
+                    response = self.transport.request(
+                        method, url, headers={**self.session.headers, **headers},
+                        json=data, timeout=self.timeout
+                    )
+                elif method == 'get':
                     response = self.session.get(url, headers=headers, timeout=self.timeout)
                 elif method == 'post':
                     response = self.session.post(url, headers=headers, json=data, timeout=self.timeout)
@@ -166,10 +284,22 @@ class TestExecutor:
             except requests.exceptions.RequestException as e:
                 if attempt == self.max_retries - 1:
                     raise e
+                profiling.count("executor.retries")
                 time.sleep(1)  # Wait before retry
         
         raise Exception("Max retries exceeded")
     
+    def _split_timings(self, response: requests.Response, send_time: float, execution_time: float) -> Dict[str, float]:
+        """Split the request time into time-to-first-byte and body transfer."""
+        # requests measures ``elapsed`` from sending the request until the
+        # response headers are parsed; the body is read after that.
+        ttfb = min(response.elapsed.total_seconds(), send_time)
+        return {
+            'ttfb': ttfb,
+            'transfer': max(0.0, send_time - ttfb),
+            'total': execution_time
+        }
+    
     def _parse_response_body(self, response: requests.Response) -> Any:
         """Parse the response body based on content type."""
         content_type = response.headers.get('content-type', '').lower()
@@ -182,10 +312,9 @@ class TestExecutor:
         else:
             return response.text
     
-    def _determine_test_status(self, test_case: TestCase, response: requests.Response) -> TestStatus:
+    def _determine_test_status(self, test_case: TestCase, actual_status: int) -> TestStatus:
         """Determine if the test passed, failed, or had an error."""
         expected_status = test_case.expected_status
-        actual_status = response.status_code
         
         # Check if status code matches expected
         if actual_status == expected_status:
@@ -193,6 +322,16 @@ class TestExecutor:
         else:
             return TestStatus.FAILED
     
+    def connection_stats(self) -> Optional[Dict[str, Any]]:
+        """Return connection reuse statistics of the HTTP/2 transport, if enabled."""
+        return self.transport.connection_stats() if self.transport is not None else None
+    
+    def close(self):
+        """Close pooled connections."""
+        if self.transport is not None:
+            self.transport.close()
+        self.session.close()
+    
     def set_base_url(self, base_url: str):
         """Set the base URL for API requests."""
         self.base_url = base_url
@@ -0,0 +1,52 @@
+"""
+Endpoint fingerprints for incremental test runs.
+"""
+
+from typing import Dict, List, Any
+
+from ..models.schemas import Endpoint
+from .canonical import stable_hash
+from .metrics import endpoint_key
+from .schema_utils import collect_refs, resolve_ref
+
+
+def endpoint_fingerprint(endpoint: Endpoint, spec_data: Dict[str, Any]) -> str:
+    """Return a hash of everything that affects an endpoint's tests.
+
+    Covers the parameters, request body, responses and vendor extensions, plus
+    the content of every schema they reference (transitively), so editing a
+    shared component changes the fingerprint of each endpoint that uses it.
+    Summaries, descriptions and tags are left out.
+    """
+    definition = {
+        'method': endpoint.method.value,
+        'path': endpoint.path,
+        'parameters': [parameter.model_dump(mode='json') for parameter in endpoint.parameters],
+        'request_body': endpoint.request_body,
+        'responses': endpoint.responses,
+        'extensions': endpoint.extensions
+    }
+
+    referenced = {}
+    for ref in sorted(collect_refs(definition, spec_data)):
+        try:
+            referenced[ref] = resolve_ref(ref, spec_data)
+        except (KeyError, ValueError):
+            referenced[ref] = None
+
+    return stable_hash({'endpoint': definition, 'refs': referenced})
+
+
+def fingerprint_endpoints(endpoints: List[Endpoint], spec_data: Dict[str, Any]) -> Dict[str, str]:
+    """Return the fingerprint of each endpoint, keyed by ``METHOD /path``."""
+    return {endpoint_key(endpoint): endpoint_fingerprint(endpoint, spec_data) for endpoint in endpoints}
+
+
+def diff_fingerprints(previous: Dict[str, str], current: Dict[str, str]) -> Dict[str, List[str]]:
+    """Classify endpoint keys as added, changed, removed or unchanged."""
+    return {
+        'added': sorted(key for key in current if key not in previous),
+        'changed': sorted(key for key in current if key in previous and previous[key] != current[key]),
+        'removed': sorted(key for key in previous if key not in current),
+        'unchanged': sorted(key for key in current if previous.get(key) == current[key])
+    }
@@ -0,0 +1,400 @@
+"""
+Coverage-guided mutation fuzzing of API endpoints.
+
+Seed test cases are mutated (type confusion, boundary numbers, long and
+special strings, missing or unexpected fields) and sent concurrently. Without
+access to server-side coverage, the response is the feedback signal: an input
+joins the corpus when it produces a new signature for its endpoint, i.e. a
+new combination of status code, validation errors and latency bucket. Inputs
+that crash the server (5xx or a dropped connection) are minimized against
+their seed before they are reported.
+"""
+
+import copy
+import random
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models.schemas import Endpoint, ParameterLocation, TestCase, TestResult, TestStatus
+from .executor import TestExecutor
+from .metrics import endpoint_key
+from .schema_utils import SchemaSampler, json_media_schema
+from .validator import ResponseValidator
+
+_SECTIONS = ('path_params', 'query_params', 'headers', 'body')
+_LOCATION_SECTIONS = {
+    ParameterLocation.PATH: 'path_params',
+    ParameterLocation.QUERY: 'query_params',
+    ParameterLocation.HEADER: 'headers'
+}
+
+_BOUNDARY_NUMBERS = [0, -1, 1, -2 ** 31, 2 ** 31 - 1, 2 ** 31, -2 ** 63, 2 ** 63 - 1, 2 ** 64,
+                     1e308, -1e308, 5e-324, 0.5, -0.0]
+_LONG_STRING_LENGTHS = [256, 1024, 8192, 65536]
+# URLs and headers are re-encoded by the client on every send; beyond a few KB
+# that dominates the fuzzer's CPU time while servers reject them with 414/431 anyway
+_MAX_URL_STRING = 4096
+_SPECIAL_STRINGS = [
+    '', ' ', 'null', 'undefined', 'NaN', '-1', '0x7fffffff', '%00', '\x00', '%s%s%s%n',
+    "' OR '1'='1", '"; DROP TABLE users; --', '../../../../etc/passwd', '<script>alert(1)</script>',
+    '{{7*7}}', '${jndi:ldap://localhost/a}', '‮﻿', '😀' * 16, 'ä' * 64
+]
+_CONFUSION_VALUES = [0, -1, 1.5, True, '', 'fuzz', [], {}, None]
+
+_NUMBER_PATTERN = re.compile(r'\d+')
+
+Path = Tuple[Any, ...]
+
+
+def seed_test_cases(endpoints: List[Endpoint], spec_data: Dict[str, Any], seed: Optional[int] = None) -> List[TestCase]:
+    """Build one schema-valid seed test case per endpoint from its parameter and body schemas."""
+    sampler = SchemaSampler(spec_data, seed=seed)
+    seeds = []
+    for endpoint in endpoints:
+        input_data: Dict[str, Any] = {'query_params': {}, 'path_params': {}, 'headers': {}, 'body': {}}
+        for param in endpoint.parameters:
+            section = _LOCATION_SECTIONS.get(param.location)
+            if section is None:
+                continue
+            value = sampler.sample(param.param_schema or {'type': param.type.value})
+            input_data[section][param.name] = value if value is not None else param.example
+        body_schema = json_media_schema((endpoint.request_body or {}).get('content', {}))
+        if body_schema:
+            body = sampler.sample(body_schema)
+            input_data['body'] = body if body is not None else {}
+
+        success = sorted(status for status in endpoint.responses if str(status).startswith('2'))
+        seeds.append(TestCase(
+            endpoint=endpoint,
+            name=f"Fuzz seed {endpoint_key(endpoint)}",
+            description="Schema-valid input sampled from the specification",
+            input_data=input_data,
+            expected_status=int(success[0]) if success and str(success[0]).isdigit() else 200,
+            test_type="fuzz",
+            tags=["fuzz", "seed"]
+        ))
+    return seeds
+
+
+def _leaf_paths(input_data: Dict[str, Any]) -> List[Path]:
+    """Every value location below the request sections, containers included."""
+    paths: List[Path] = []
+
+    def walk(value: Any, path: Path):
+        if isinstance(value, dict):
+            for key, child in value.items():
+                walk(child, path + (key,))
+        elif isinstance(value, list):
+            for index, child in enumerate(value):
+                walk(child, path + (index,))
+        if len(path) > 1:
+            paths.append(path)
+
+    for section in _SECTIONS:
+        if section in input_data:
+            walk(input_data[section], (section,))
+    return paths
+
+
+def _get(data: Any, path: Path) -> Any:
+    for key in path:
+        data = data[key]
+    return data
+
+
+def _set(data: Any, path: Path, value: Any):
+    _get(data, path[:-1])[path[-1]] = value
+
+
+def _delete(data: Any, path: Path):
+    del _get(data, path[:-1])[path[-1]]
+
+
+def _exists(data: Any, path: Path) -> bool:
+    try:
+        _get(data, path)
+    except (KeyError, IndexError, TypeError):
+        return False
+    return True
+
+
+def _header_value(value: Any) -> str:
+    return ''.join(ch for ch in str(value) if ' ' <= ch <= '~').strip()[:8192]
+
+
+class Mutator:
+    """Applies random structure- and type-aware mutations to test case inputs."""
+
+    OPERATIONS = ('type_confusion', 'boundary_number', 'long_string', 'special_string',
+                  'drop_field', 'add_field', 'null')
+
+    def __init__(self, seed: Optional[int] = None, max_stack: int = 3):
+        self.random = random.Random(seed)
+        self.max_stack = max_stack
+
+    def mutate(self, test_case: TestCase) -> TestCase:
+        """Return a copy of test_case with one to ``max_stack`` mutations applied."""
+        input_data = copy.deepcopy(test_case.input_data)
+        applied = []
+        for _ in range(self.random.randint(1, self.max_stack)):
+            applied.append(self._mutate_once(input_data))
+        operations = list(dict.fromkeys(applied))
+        # Header values must stay sendable, or the client fails before the server sees them
+        headers = input_data.get('headers')
+        if isinstance(headers, dict):
+            for name, value in headers.items():
+                headers[name] = _header_value(value)
+        return test_case.model_copy(update={
+            'name': f"Fuzz {endpoint_key(test_case.endpoint)} ({', '.join(operations)})",
+            'description': "Mutated input generated by the fuzzer",
+            'input_data': input_data,
+            'expected_status': 400,
+            'test_type': 'fuzz',
+            'tags': ['fuzz'] + operations
+        })
+
+    def _mutate_once(self, input_data: Dict[str, Any]) -> str:
+        paths = _leaf_paths(input_data)
+        operation = self.random.choice(self.OPERATIONS) if paths else 'add_field'
+        if operation == 'add_field':
+            self._add_field(input_data)
+            return operation
+
+        path = self.random.choice(paths)
+        value = _get(input_data, path)
+        if operation == 'drop_field':
+            _delete(input_data, path)
+        elif operation == 'null':
+            _set(input_data, path, None)
+        elif operation == 'type_confusion':
+            _set(input_data, path, self._confuse(value))
+        elif operation == 'boundary_number':
+            _set(input_data, path, self._boundary_number(value))
+        elif operation == 'long_string':
+            length = self.random.choice(_LONG_STRING_LENGTHS)
+            if path[0] != 'body':
+                length = min(length, _MAX_URL_STRING)
+            _set(input_data, path, self.random.choice('Aa0%') * length)
+        else:
+            _set(input_data, path, self.random.choice(_SPECIAL_STRINGS))
+        return operation
+
+    def _confuse(self, value: Any) -> Any:
+        candidates = [c for c in _CONFUSION_VALUES if type(c) is not type(value)] + [[value]]
+        return copy.deepcopy(self.random.choice(candidates))
+
+    def _boundary_number(self, value: Any) -> Any:
+        candidates = list(_BOUNDARY_NUMBERS)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            candidates += [value - 1, value + 1, -value, value * 2 ** 32]
+        return self.random.choice(candidates)
+
+    def _add_field(self, input_data: Dict[str, Any]):
+        section = self.random.choice(('query_params', 'body'))
+        target = input_data.get(section)
+        if not isinstance(target, dict):
+            target = input_data['query_params'] = input_data.get('query_params') or {}
+        name = f"fuzz_{self.random.randint(0, 999)}"
+        target[name] = copy.deepcopy(self.random.choice(_CONFUSION_VALUES + _SPECIAL_STRINGS[:4]))
+
+
+def signature(result: TestResult) -> Tuple[Any, ...]:
+    """The behaviour a result exhibits: endpoint, status, validation errors and latency bucket."""
+    latency_ms = int((result.execution_time or 0) * 1000)
+    errors = tuple(sorted({_NUMBER_PATTERN.sub('N', error)[:200] for error in result.validation_errors}))
+    return (
+        endpoint_key(result.test_case.endpoint),
+        result.response_status if result.response_status is not None else 'error',
+        errors,
+        latency_ms.bit_length()  # power-of-two millisecond buckets
+    )
+
+
+def is_crash(result: TestResult) -> bool:
+    """Server errors and dropped connections count as crashes."""
+    if result.response_status is None:
+        return result.status == TestStatus.ERROR
+    return result.response_status >= 500
+
+
+class Fuzzer:
+    """Runs a coverage-guided mutation loop against a live API."""
+
+    def __init__(self, base_url: str, spec_data: Dict[str, Any], seeds: List[TestCase],
+                 workers: int = 8, seed: Optional[int] = None, timeout: int = 5,
+                 headers: Optional[Dict[str, str]] = None, minimize_attempts: int = 50,
+                 progress: Optional[Callable[[str], None]] = None):
+        if not seeds:
+            raise ValueError("The fuzzer needs at least one seed test case")
+        self.base_url = base_url
+        self.spec_data = spec_data
+        self.seeds = list(seeds)
+        self.workers = workers
+        self.seed = seed
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.minimize_attempts = minimize_attempts
+        self.progress = progress
+
+        # Corpus entries keep the seed input they descend from, for minimization
+        self.corpus: List[Tuple[TestCase, Dict[str, Any]]] = []
+        self.crashes: List[TestCase] = []
+        self.signatures = set()
+        self.stats = Counter()
+        self._crash_signatures = set()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._executors: List[TestExecutor] = []
+
+    def _executor(self) -> TestExecutor:
+        executor = getattr(self._local, 'executor', None)
+        if executor is None:
+            executor = TestExecutor(base_url=self.base_url, timeout=self.timeout, max_retries=1,
+                                    request_delay=0, dedupe=False)
+            executor.set_custom_headers(self.headers)
+            # Skip the per-request proxy/netrc lookups in the environment
+            executor.session.trust_env = False
+            self._local.executor = executor
+            self._local.validator = ResponseValidator()
+            with self._lock:
+                self._executors.append(executor)
+        return executor
+
+    def execute(self, test_case: TestCase) -> TestResult:
+        """Send one test case and validate the response on the calling thread."""
+        result = self._executor().execute_test_case(test_case)
+        if result.response_status is not None:
+            result = self._local.validator.validate_response(result, self.spec_data)
+        return result
+
+    def run(self, duration: Optional[float] = 30, max_cases: Optional[int] = None) -> Dict[str, Any]:
+        """Fuzz until ``duration`` seconds pass or ``max_cases`` requests were sent."""
+        self._deadline = time.monotonic() + duration if duration else None
+        self._max_cases = max_cases
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                # Seeds establish the baseline behaviour of every endpoint
+                for test_case, result in zip(self.seeds, pool.map(self.execute, self.seeds)):
+                    self._record(test_case, test_case.input_data, result)
+                futures = [pool.submit(self._worker, index) for index in range(self.workers)]
+                for future in futures:
+                    future.result()
+        finally:
+            for executor in self._executors:
+                executor.close()
+
+        elapsed = time.perf_counter() - start
+        return {
+            'cases': self.stats['cases'],
+            'elapsed': elapsed,
+            'rate': self.stats['cases'] / elapsed if elapsed else 0.0,
+            'signatures': len(self.signatures),
+            'corpus': len(self.corpus),
+            'crashes': len(self.crashes),
+            'errors': self.stats['errors'],
+            'minimize_requests': self.stats['minimize_requests']
+        }
+
+    def _claim(self) -> bool:
+        """Reserve the next case, or return False once the budget is spent."""
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return False
+        with self._lock:
+            if self._max_cases is not None and self.stats['cases'] >= self._max_cases:
+                return False
+            self.stats['cases'] += 1
+            return True
+
+    def _worker(self, index: int):
+        mutator = Mutator(seed=None if self.seed is None else self.seed + index)
+        while self._claim():
+            with self._lock:
+                parent, origin = mutator.random.choice(self.corpus) if self.corpus else (
+                    mutator.random.choice(self.seeds), None)
+            if origin is None:
+                origin = parent.input_data
+            child = mutator.mutate(parent)
+            self._record(child, origin, self.execute(child))
+
+    def _record(self, test_case: TestCase, origin: Dict[str, Any], result: TestResult):
+        key = signature(result)
+        crash = is_crash(result)
+        with self._lock:
+            if result.response_status is None:
+                self.stats['errors'] += 1
+            if key in self.signatures:
+                return
+            self.signatures.add(key)
+            observed = test_case
+            if result.response_status is not None:
+                # Replaying the corpus with ``run --cases`` checks the behaviour still holds
+                observed = test_case.model_copy(update={'expected_status': result.response_status})
+            self.corpus.append((observed, origin))
+            # A crash is reported once per behaviour, whatever its latency
+            report_crash = crash and key[:3] not in self._crash_signatures
+            if report_crash:
+                self._crash_signatures.add(key[:3])
+
+        if report_crash:
+            minimized = self.minimize(test_case, origin, result)
+            with self._lock:
+                self.crashes.append(minimized)
+            if self.progress:
+                self.progress(f"💥 {key[0]} -> {key[1]}: {minimized.name}")
+
+    def minimize(self, test_case: TestCase, origin: Dict[str, Any], result: TestResult) -> TestCase:
+        """Shrink a crashing input while it keeps crashing the same way.
+
+        Mutated values are reverted to the seed's value one at a time, then
+        the remaining long strings are halved.
+        """
+        target = result.response_status
+        attempts = 0
+
+        def still_crashes(input_data: Dict[str, Any]) -> bool:
+            nonlocal attempts
+            attempts += 1
+            with self._lock:
+                self.stats['minimize_requests'] += 1
+            candidate = self.execute(test_case.model_copy(update={'input_data': input_data}))
+            return is_crash(candidate) and candidate.response_status == target
+
+        current = copy.deepcopy(test_case.input_data)
+        for path in sorted(_leaf_paths(current), key=len, reverse=True):
+            if attempts >= self.minimize_attempts:
+                break
+            if not _exists(current, path):
+                continue
+            candidate = copy.deepcopy(current)
+            if _exists(origin, path):
+                if _get(origin, path) == _get(current, path):
+                    continue
+                _set(candidate, path, copy.deepcopy(_get(origin, path)))
+            else:
+                _delete(candidate, path)
+            if still_crashes(candidate):
+                current = candidate
+
+        for path in _leaf_paths(current):
+            while attempts < self.minimize_attempts:
+                value = _get(current, path)
+                if not isinstance(value, str) or len(value) <= 8:
+                    break
+                candidate = copy.deepcopy(current)
+                _set(candidate, path, value[:len(value) // 2])
+                if not still_crashes(candidate):
+                    break
+                current = candidate
+
+        return test_case.model_copy(update={
+            'input_data': current,
+            'description': f"Minimized fuzzer input that crashed the server "
+                           f"({target if target is not None else result.error_message})",
+            'expected_status': 400,
+            'tags': test_case.tags + ['crash']
+        })
@@ -4,29 +4,71 @@ AI-powered test case generator using OpenAI GPT.
 
 import os
 import json
+import threading
 import time
 from typing import Dict, List, Any, Optional
-from openai import OpenAI
 from dotenv import load_dotenv
 
 from ..models.schemas import Endpoint, TestCase, Parameter, ParameterType
+from .prompts import PromptCompiler, estimate_tokens
+from .llm_usage import UsageTracker
+from .metrics import endpoint_key
+from . import profiling, telemetry
 
 load_dotenv()
 
+SYSTEM_PROMPT = "You are an expert API tester. Generate realistic test inputs based on the provided endpoint specification."
+
+RESPONSE_FORMAT = """
+**Response Format:**
+Return ONLY a JSON object with the keys query_params, path_params, headers and body (if applicable), e.g.
+{"query_params": {"status": "sold"}, "path_params": {"id": 123}, "headers": {}, "body": {"name": "value"}}
+"""
+
 
 class TestCaseGenerator:
     """AI-powered test case generator using OpenAI GPT."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo",
+                 spec_data: Optional[Dict[str, Any]] = None, max_prompt_tokens: Optional[int] = 1500,
+                 usage: Optional[UsageTracker] = None):
+        # Without a key every test case comes from the offline fallback generator
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
         self.model = model
-        self.client = OpenAI(api_key=self.api_key)
+        self._client = None
+        self._client_lock = threading.Lock()
+        self.prompt_compiler = PromptCompiler(spec_data, max_tokens=max_prompt_tokens)
+        # Token, latency and cost accounting; a tracker with limits acts as a run budget
+        self.usage = usage or UsageTracker(model)
+    
+    @property
+    def client(self):
+        """OpenAI client, created on first use so that the openai package is only imported when needed."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from openai import OpenAI
+                    self._client = OpenAI(api_key=self.api_key)
+        return self._client
+    
+    @property
+    def is_offline(self) -> bool:
+        """True when no API key is configured and the LLM is never called."""
+        return not self.api_key
         
     def generate_test_cases(self, endpoint: Endpoint, num_cases: int = 5) -> List[TestCase]:
         """Generate test cases for a given endpoint using AI."""
+        with telemetry.span("generate_test_cases", **{
+            "http.method": endpoint.method.value.upper(),
+            "http.route": endpoint.path
+        }) as span:
+            test_cases = self._generate_test_cases(endpoint)
+            span.set_attribute("test_cases.count", len(test_cases))
+            return test_cases
+    
+    def _generate_test_cases(self, endpoint: Endpoint) -> List[TestCase]:
+        """Generate the valid, invalid and boundary cases for an endpoint."""
         test_cases = []
         
         # Generate different types of test cases
@@ -46,69 +88,101 @@ class TestCaseGenerator:
     def _generate_single_test_case(self, endpoint: Endpoint, test_type: str, case_number: int) -> TestCase:
         """Generate a single test case for an endpoint."""
         
+        if self.is_offline:
+            profiling.count("generator.offline")
+            return self._create_fallback_test_case(endpoint, test_type, case_number, "OPENAI_API_KEY is not set")
+        
+        # Once a run budget is spent, the rest of the run uses the offline fallback
+        exhausted = self.usage.exhausted()
+        if exhausted:
+            profiling.count("generator.budget_skips")
+            telemetry.record_llm_call(self.model, "budget_exhausted")
+            self.usage.record_skip()
+            return self._create_fallback_test_case(endpoint, test_type, case_number, f"LLM budget exhausted: {exhausted}")
+        
         # Build the prompt for GPT
         prompt = self._build_prompt(endpoint, test_type)
+        key = endpoint_key(endpoint)
         
         try:
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert API tester. Generate realistic test inputs based on the provided endpoint specification."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1000
-            )
+            profiling.count("generator.llm_calls")
+            start = time.perf_counter()
+            try:
+                with profiling.stage("generator.llm", endpoint=endpoint.path, test_type=test_type):
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {"role": "system", "content": SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt}
+                        ],
+                        temperature=0.7,
+                        max_tokens=1000
+                    )
+            except Exception:
+                telemetry.record_llm_call(self.model, "error")
+                self.usage.record(key, test_type, latency=time.perf_counter() - start, outcome="error")
+                raise
+            latency = time.perf_counter() - start
             
-            # Parse the response
-            content = response.choices[0].message.content
-            if content is None:
-                raise ValueError("Empty response from OpenAI API")
-            test_data = self._parse_ai_response(content, endpoint)
+            # Parse the response first, so the call is recorded once with its real outcome
+            content = response.choices[0].message.content if response.choices else None
+            test_case, parse_error = None, None
+            try:
+                if content is None:
+                    raise ValueError("Empty response from OpenAI API")
+                test_data = self._parse_ai_response(content, endpoint)
+                
+                # Create test case
+                test_case = TestCase(
+                    endpoint=endpoint,
+                    name=f"{test_type.capitalize()} Test Case {case_number}",
+                    description=f"AI-generated {test_type} test case for {endpoint.method.value.upper()} {endpoint.path}",
+                    input_data=test_data,
+                    expected_status=self._get_expected_status(test_type),
+                    test_type=test_type,
+                    tags=[test_type, "ai-generated"]
+                )
+            except Exception as e:
+                parse_error = e
+            outcome = "success" if parse_error is None else "invalid_response"
             
-            # Create test case
-            test_case = TestCase(
-                endpoint=endpoint,
-                name=f"{test_type.capitalize()} Test Case {case_number}",
-                description=f"AI-generated {test_type} test case for {endpoint.method.value.upper()} {endpoint.path}",
-                input_data=test_data,
-                expected_status=self._get_expected_status(test_type),
-                test_type=test_type,
-                tags=[test_type, "ai-generated"]
-            )
+            if response.usage:
+                prompt_tokens, completion_tokens = response.usage.prompt_tokens, response.usage.completion_tokens
+                profiling.count("generator.prompt_tokens", prompt_tokens)
+                profiling.count("generator.completion_tokens", completion_tokens)
+                telemetry.record_llm_call(self.model, outcome, prompt_tokens, completion_tokens)
+                self.usage.record(key, test_type, prompt_tokens, completion_tokens, latency, outcome=outcome)
+            else:
+                # Some compatible servers omit usage; fall back to estimates
+                telemetry.record_llm_call(self.model, outcome)
+                self.usage.record(key, test_type, estimate_tokens(SYSTEM_PROMPT + prompt),
+                                  estimate_tokens(content or ''), latency, outcome=outcome, estimated=True)
             
+            if parse_error is not None:
+                raise parse_error
             return test_case
             
         except Exception as e:
-            # Fallback to basic test case if AI generation fails
+            # Fallback to basic test case if AI generation fails; the call's outcome is already recorded
+            profiling.count("generator.fallbacks")
             return self._create_fallback_test_case(endpoint, test_type, case_number, str(e))
     
     def _build_prompt(self, endpoint: Endpoint, test_type: str) -> str:
         """Build the prompt for GPT based on endpoint and test type."""
         
-        prompt = f"""
-Generate a JSON test input for the following API endpoint:
-
-**Endpoint Details:**
-- Method: {endpoint.method.value.upper()}
-- Path: {endpoint.path}
-- Summary: {endpoint.summary or 'No summary provided'}
-- Description: {endpoint.description or 'No description provided'}
-
-**Parameters:**
-"""
-        
-        # Add parameter details
-        for param in endpoint.parameters:
-            prompt += f"- {param.name} ({param.type.value}, {param.location.value}"
-            if param.required:
-                prompt += ", required"
-            prompt += f"): {param.description or 'No description'}\n"
-        
-        # Add request body info if available
-        if endpoint.request_body:
-            prompt += f"\n**Request Body:** {json.dumps(endpoint.request_body, indent=2)}\n"
+        header = "Generate a JSON test input for the following API endpoint:\n\n"
+        instructions = self._test_type_instructions(test_type) + RESPONSE_FORMAT
+        # Schemas are resolved and rendered compactly, within the prompt token budget
+        description = self.prompt_compiler.describe_endpoint(
+            endpoint, reserved_tokens=estimate_tokens(header) + estimate_tokens(instructions))
+        prompt = f"{header}{description}\n{instructions}"
+        profiling.count("generator.prompt_tokens_estimated", estimate_tokens(prompt))
+        return prompt
+    
+    def _test_type_instructions(self, test_type: str) -> str:
+        """Return the requirements section for a test type."""
+        prompt = ""
         
         # Add test type specific instructions
         if test_type == "valid":
@@ -132,23 +206,6 @@ Generate a JSON test input for the following API endpoint:
 - Use edge case values (min/max values, empty strings, null values)
 - Test limits of the API's validation
 - Examples: maximum string length, minimum integer values, empty arrays
-"""
-        
-        prompt += """
-**Response Format:**
-Return ONLY a valid JSON object with the test data. The JSON should contain:
-- query_params: for query parameters
-- path_params: for path parameters  
-- headers: for header parameters
-- body: for request body (if applicable)
-
-Example format:
-{
-  "query_params": {"param1": "value1"},
-  "path_params": {"id": 123},
-  "headers": {"Authorization": "Bearer token"},
-  "body": {"field1": "value1"}
-}
 """
         
         return prompt
@@ -0,0 +1,151 @@
+"""
+Build test cases from captured traffic (HAR files and JSONL access logs).
+"""
+
+import json
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from ..models.schemas import Endpoint, ParameterLocation, TestCase
+from .canonical import stable_hash
+from .metrics import endpoint_key
+from .routing import PathTemplateIndex
+from .streaming import iter_har_entries, iter_jsonl, strip_compression_suffix
+
+
+def detect_format(file_path: str) -> str:
+    """Guess whether a capture is a HAR file or a JSONL log from its name."""
+    name = strip_compression_suffix(str(file_path).lower())
+    return 'har' if name.endswith('.har') else 'jsonl'
+
+
+def iter_traffic(file_path: str, format: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Stream normalized requests (method, url, headers, body, status) from a capture."""
+    format = format or detect_format(file_path)
+    if format == 'har':
+        records = iter_har_entries(file_path)
+    elif format == 'jsonl':
+        records = iter_jsonl(file_path)
+    else:
+        raise ValueError(f"Unsupported traffic format: {format}")
+
+    for record in records:
+        request = normalize_record(record)
+        if request is not None:
+            yield request
+
+
+def normalize_record(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Normalize a HAR entry or an access-log line; returns None if it is not a request."""
+    if isinstance(record.get('request'), dict):
+        # HAR entry (or a HAR-shaped log line)
+        request = record['request']
+        response = record.get('response') or {}
+        headers = {h.get('name'): h.get('value') for h in request.get('headers', []) if isinstance(h, dict)}
+        post_data = request.get('postData') or {}
+        body = _parse_body(post_data.get('text'), post_data.get('mimeType', ''))
+        method, url, status = request.get('method'), request.get('url'), response.get('status')
+    else:
+        method = record.get('method') or record.get('request_method') or record.get('verb')
+        url = record.get('url') or record.get('uri') or record.get('request_uri') or record.get('path')
+        headers = record.get('headers') or record.get('request_headers') or {}
+        body = record.get('body', record.get('request_body'))
+        if isinstance(body, str):
+            body = _parse_body(body, 'application/json')
+        status = record.get('status') or record.get('status_code') or record.get('response_status')
+
+    if not isinstance(method, str) or not isinstance(url, str):
+        return None
+    try:
+        status = int(status) if status else None
+    except (TypeError, ValueError):
+        status = None
+    return {
+        'method': method.upper(),
+        'url': url,
+        'headers': headers if isinstance(headers, dict) else {},
+        'body': body,
+        'status': status
+    }
+
+
+def _parse_body(text: Optional[str], mime_type: str) -> Any:
+    if not text or 'json' not in mime_type:
+        return None
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        return None
+
+
+class TrafficImporter:
+    """Turns captured requests into deduplicated test cases for known endpoints."""
+
+    def __init__(self, endpoints: List[Endpoint], base_path: str = "", max_per_endpoint: Optional[int] = 50):
+        self.index = PathTemplateIndex(endpoints, base_path)
+        self.max_per_endpoint = max_per_endpoint
+        self.stats = Counter()
+        self._seen = set()
+        self._per_endpoint = Counter()
+
+    def import_requests(self, requests: Iterable[Dict[str, Any]]) -> Iterator[TestCase]:
+        """Yield a test case for every distinct request that matches an endpoint."""
+        for request in requests:
+            self.stats['requests'] += 1
+            test_case = self.to_test_case(request)
+            if test_case is not None:
+                yield test_case
+
+    def to_test_case(self, request: Dict[str, Any]) -> Optional[TestCase]:
+        """Convert one normalized request, or return None if unmatched, duplicate or over the cap."""
+        parts = urlsplit(request['url'])
+        match = self.index.match(request['method'], parts.path)
+        if match is None:
+            self.stats['unmatched'] += 1
+            return None
+        endpoint, path_params = match
+        key = endpoint_key(endpoint)
+
+        query_params: Dict[str, Any] = {}
+        for name, value in parse_qsl(parts.query, keep_blank_values=True):
+            if name in query_params:
+                existing = query_params[name]
+                query_params[name] = (existing if isinstance(existing, list) else [existing]) + [value]
+            else:
+                query_params[name] = value
+
+        # Only headers the spec declares are kept; cookies, auth and other
+        # volatile headers would both leak secrets and defeat deduplication.
+        declared = {p.name.lower(): p.name for p in endpoint.parameters if p.location == ParameterLocation.HEADER}
+        headers = {declared[name.lower()]: value for name, value in request['headers'].items()
+                   if isinstance(name, str) and name.lower() in declared}
+
+        input_data = {
+            'query_params': query_params,
+            'path_params': path_params,
+            'headers': headers,
+            'body': request['body'] if request['body'] is not None else {}
+        }
+        status = request['status'] or 200
+
+        fingerprint = stable_hash([key, input_data, status])[:32]
+        if fingerprint in self._seen:
+            self.stats['duplicates'] += 1
+            return None
+        if self.max_per_endpoint is not None and self._per_endpoint[key] >= self.max_per_endpoint:
+            self.stats['over_cap'] += 1
+            return None
+        self._seen.add(fingerprint)
+        self._per_endpoint[key] += 1
+        self.stats['imported'] += 1
+
+        return TestCase(
+            endpoint=endpoint,
+            name=f"Imported {key} #{self._per_endpoint[key]}",
+            description=f"Request captured from live traffic (observed status {status})",
+            input_data=input_data,
+            expected_status=status,
+            test_type="valid" if status < 400 else "invalid",
+            tags=["imported"]
+        )
@@ -0,0 +1,127 @@
+"""
+LLM usage accounting: tokens, latency and estimated cost per call and per run,
+with optional run-level budgets.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# USD per million tokens (prompt, completion); matched by longest model name prefix
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    'gpt-3.5-turbo': (0.50, 1.50),
+    'gpt-4': (30.00, 60.00),
+    'gpt-4-32k': (60.00, 120.00),
+    'gpt-4-turbo': (10.00, 30.00),
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4.1': (2.00, 8.00),
+    'gpt-4.1-mini': (0.40, 1.60),
+    'gpt-4.1-nano': (0.10, 0.40),
+}
+
+
+def model_pricing(model: str, pricing: Optional[Dict[str, Tuple[float, float]]] = None) -> Optional[Tuple[float, float]]:
+    """Return (prompt, completion) USD per million tokens for a model, or None if unknown."""
+    pricing = pricing or MODEL_PRICING
+    matches = [name for name in pricing if model == name or model.startswith(name + '-')]
+    if not matches:
+        return None
+    return pricing[max(matches, key=len)]
+
+
+class UsageTracker:
+    """Thread-safe record of LLM calls with run-level token, cost and time budgets.
+
+    Budgets are checked before each call, so concurrent generation can
+    overshoot a limit by the calls already in flight.
+    """
+
+    def __init__(self, model: str, max_tokens: Optional[int] = None, max_cost: Optional[float] = None,
+                 max_seconds: Optional[float] = None, pricing: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.model = model
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.max_seconds = max_seconds
+        self.price = model_pricing(model, pricing)
+        self.calls: List[Dict[str, Any]] = []
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost = 0.0
+        self.seconds = 0.0
+        self.skipped = 0
+        self.exhausted_reason: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def estimate_cost(self, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+        """Estimated USD cost of a call, or None if the model's pricing is unknown."""
+        if self.price is None:
+            return None
+        return (prompt_tokens * self.price[0] + completion_tokens * self.price[1]) / 1_000_000
+
+    def exhausted(self) -> Optional[str]:
+        """Return why the budget is spent, or None while calls are still allowed."""
+        with self._lock:
+            if self.exhausted_reason is None:
+                self.exhausted_reason = self._check()
+            return self.exhausted_reason
+
+    def _check(self) -> Optional[str]:
+        total = self.prompt_tokens + self.completion_tokens
+        if self.max_tokens is not None and total >= self.max_tokens:
+            return f"token budget of {self.max_tokens} reached"
+        if self.max_cost is not None and self.cost >= self.max_cost:
+            return f"cost budget of ${self.max_cost:.2f} reached"
+        if self.max_seconds is not None and self.seconds >= self.max_seconds:
+            return f"time budget of {self.max_seconds:.0f}s reached"
+        return None
+
+    def record(self, endpoint: str, test_type: str, prompt_tokens: int = 0, completion_tokens: int = 0,
+               latency: float = 0.0, outcome: str = "success", estimated: bool = False):
+        """Record one LLM call."""
+        cost = self.estimate_cost(prompt_tokens, completion_tokens)
+        with self._lock:
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            self.cost += cost or 0.0
+            self.seconds += latency
+            self.calls.append({
+                'endpoint': endpoint,
+                'test_type': test_type,
+                'outcome': outcome,
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'latency': latency,
+                'cost': cost,
+                'estimated_tokens': estimated
+            })
+
+    def record_skip(self):
+        """Count a call that was not made because the budget is spent."""
+        with self._lock:
+            self.skipped += 1
+
+    def summary(self, include_calls: bool = True) -> Dict[str, Any]:
+        """Return run totals, budget state and (optionally) every call."""
+        with self._lock:
+            calls = list(self.calls)
+            summary = {
+                'model': self.model,
+                'calls': len(calls),
+                'failed_calls': len([c for c in calls if c['outcome'] != 'success']),
+                'skipped_by_budget': self.skipped,
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'total_tokens': self.prompt_tokens + self.completion_tokens,
+                'llm_seconds': self.seconds,
+                'mean_latency': self.seconds / len(calls) if calls else 0.0,
+                'cost_usd': self.cost if self.price is not None else None,
+                'budget': {
+                    'max_tokens': self.max_tokens,
+                    'max_cost_usd': self.max_cost,
+                    'max_seconds': self.max_seconds,
+                    'exhausted': self.exhausted_reason
+                }
+            }
+        if include_calls:
+            summary['per_call'] = calls
+        return summary
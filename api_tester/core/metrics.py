@@ -0,0 +1,174 @@
+"""
+Latency histograms and per-endpoint percentile summaries.
+"""
+
+from typing import Dict, List, Any, Iterable, Optional
+
+from ..models.schemas import TestResult
+
+
+def endpoint_key(endpoint) -> str:
+    """Return the canonical ``METHOD /path`` key for an endpoint."""
+    return f"{endpoint.method.value.upper()} {endpoint.path}"
+
+
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram.
+
+    Values are recorded in microseconds. Each power-of-two range is split into
+    ``2 ** (sub_bucket_bits - 1)`` linear sub-buckets, which bounds the relative
+    error of any reported percentile to roughly ``1 / 2 ** (sub_bucket_bits - 1)``
+    while keeping the bucket array small. Counts are stored sparsely so that
+    histograms serialize compactly and can be merged across runs or shards.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self.counts: Dict[int, int] = {}
+        self.total_count = 0
+        self.min_value: Optional[int] = None
+        self.max_value: Optional[int] = None
+        self.sum_value = 0
+
+    def _bucket_index(self, value: int) -> int:
+        """Map a value in microseconds to its bucket index."""
+        if value < self._sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        top = value >> shift
+        return self._sub_bucket_count + (shift - 1) * self._half_count + (top - self._half_count)
+
+    def _bucket_upper_bound(self, index: int) -> int:
+        """Return the highest value (in microseconds) that falls into a bucket."""
+        if index < self._sub_bucket_count:
+            return index
+        offset = index - self._sub_bucket_count
+        shift = offset // self._half_count + 1
+        top = offset % self._half_count + self._half_count
+        return ((top + 1) << shift) - 1
+
+    def record(self, seconds: float, count: int = 1):
+        """Record a latency expressed in seconds."""
+        value = max(0, int(round(seconds * 1_000_000)))
+        index = self._bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += count
+        self.sum_value += value * count
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if self.max_value is None or value > self.max_value:
+            self.max_value = value
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Merge another histogram into this one in place."""
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += other.total_count
+        self.sum_value += other.sum_value
+        if other.min_value is not None:
+            self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+        if other.max_value is not None:
+            self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+        return self
+
+    def percentile(self, percentile: float) -> float:
+        """Return the latency (in seconds) at the given percentile (0-100)."""
+        if self.total_count == 0:
+            return 0.0
+        target = max(1, int(percentile / 100.0 * self.total_count + 0.5))
+        running = 0
+        for index in sorted(self.counts):
+            running += self.counts[index]
+            if running >= target:
+                value = min(self._bucket_upper_bound(index), self.max_value)
+                return value / 1_000_000
+        return self.max_value / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        if self.total_count == 0:
+            return 0.0
+        return self.sum_value / self.total_count / 1_000_000
+
+    def summary(self) -> Dict[str, Any]:
+        """Return count, mean, p50/p90/p99 and max latencies in seconds."""
+        return {
+            'count': self.total_count,
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': (self.max_value or 0) / 1_000_000
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the histogram to a JSON-compatible dictionary."""
+        return {
+            'sub_bucket_bits': self.sub_bucket_bits,
+            'counts': {str(index): count for index, count in sorted(self.counts.items())},
+            'total_count': self.total_count,
+            'min': self.min_value,
+            'max': self.max_value,
+            'sum': self.sum_value
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram serialized with :meth:`to_dict`."""
+        histogram = cls(sub_bucket_bits=data.get('sub_bucket_bits', 7))
+        histogram.counts = {int(index): count for index, count in data.get('counts', {}).items()}
+        histogram.total_count = data.get('total_count', 0)
+        histogram.min_value = data.get('min')
+        histogram.max_value = data.get('max')
+        histogram.sum_value = data.get('sum', 0)
+        return histogram
+
+
+def build_latency_histograms(test_results: Iterable[TestResult]) -> Dict[str, LatencyHistogram]:
+    """Build one latency histogram per endpoint from test results.
+
+    Deduplicated results share another result's response, so they add no sample.
+    """
+    histograms: Dict[str, LatencyHistogram] = {}
+    for result in test_results:
+        if result.execution_time is None or result.deduplicated:
+            continue
+        key = endpoint_key(result.test_case.endpoint)
+        if key not in histograms:
+            histograms[key] = LatencyHistogram()
+        histograms[key].record(result.execution_time)
+    return histograms
+
+
+def latency_table(test_results: Iterable[TestResult]) -> List[Dict[str, Any]]:
+    """Return per-endpoint latency percentiles, slowest p99 first."""
+    histograms = build_latency_histograms(test_results)
+    rows = [dict(endpoint=key, **histogram.summary()) for key, histogram in histograms.items()]
+    rows.sort(key=lambda row: row['p99'], reverse=True)
+    return rows
+
+
+def latency_budget_table(test_results: Iterable[TestResult]) -> List[Dict[str, Any]]:
+    """Summarize latency budget checks per endpoint, violators first."""
+    rows: Dict[str, Dict[str, Any]] = {}
+    for result in test_results:
+        if result.latency_budget_ms is None or result.deduplicated:
+            continue
+        key = endpoint_key(result.test_case.endpoint)
+        row = rows.setdefault(key, {
+            'endpoint': key,
+            'budget_ms': result.latency_budget_ms,
+            'checked': 0,
+            'exceeded': 0,
+            'worst_ms': 0.0
+        })
+        row['checked'] += 1
+        if result.latency_budget_exceeded:
+            row['exceeded'] += 1
+        row['worst_ms'] = max(row['worst_ms'], (result.execution_time or 0.0) * 1000)
+    return sorted(rows.values(), key=lambda row: (-row['exceeded'], -row['worst_ms']))
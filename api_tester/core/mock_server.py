@@ -0,0 +1,226 @@
+"""
+Local mock server that serves schema-valid responses for an OpenAPI spec.
+
+The server runs on asyncio streams with HTTP/1.1 keep-alive and no third-party
+dependencies. Response bodies are synthesized once per endpoint (a small pool
+of variants, serialized up front) so request handling stays cheap enough to
+sustain thousands of requests per second on a single core.
+"""
+
+import asyncio
+import json
+import random
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ..models.schemas import Endpoint
+from .routing import PathTemplateIndex
+from .schema_utils import SchemaSampler, resolve_schema, json_media_schema
+
+_REASONS = {
+    200: "OK", 201: "Created", 202: "Accepted", 204: "No Content",
+    400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"
+}
+
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+
+class MockServer:
+    """Serves synthesized responses for every endpoint in an OpenAPI spec."""
+
+    def __init__(self, spec_data: Dict[str, Any], endpoints: List[Endpoint],
+                 host: str = "127.0.0.1", port: int = 8000,
+                 latency_ms: float = 0.0, latency_jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 500,
+                 seed: Optional[int] = None, variants: int = 4):
+        self.spec_data = spec_data
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.request_count = 0
+
+        base_path = ""
+        servers = spec_data.get('servers') or []
+        if servers:
+            base_path = urlsplit(servers[0].get('url', '')).path
+        self.index = PathTemplateIndex(endpoints, base_path=base_path)
+
+        sampler = SchemaSampler(spec_data, seed=seed)
+        self._responses: Dict[Tuple[str, str], Tuple[int, List[bytes]]] = {}
+        self._required_bodies: Dict[Tuple[str, str], List[str]] = {}
+        for endpoint in endpoints:
+            key = (endpoint.method.value, endpoint.path)
+            self._responses[key] = self._prepare_responses(endpoint, sampler, variants)
+            self._required_bodies[key] = self._required_body_fields(endpoint)
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._writers: set = set()
+
+    def _prepare_responses(self, endpoint: Endpoint, sampler: SchemaSampler,
+                           variants: int) -> Tuple[int, List[bytes]]:
+        """Pick the success status for an endpoint and pre-render its bodies."""
+        success_codes = sorted(code for code in endpoint.responses if code.isdigit() and code.startswith('2'))
+        if success_codes:
+            status_key = success_codes[0]
+        elif 'default' in endpoint.responses:
+            status_key = 'default'
+        else:
+            status_key = None
+        status = int(status_key) if status_key and status_key.isdigit() else 200
+
+        response_spec = endpoint.responses.get(status_key, {}) if status_key else {}
+        schema = json_media_schema(response_spec.get('content', {}))
+        if status == 204 or schema is None:
+            return status, [b""]
+
+        bodies = []
+        for _ in range(max(1, variants)):
+            bodies.append(json.dumps(sampler.sample(schema), separators=(',', ':')).encode('utf-8'))
+        return status, bodies
+
+    def _required_body_fields(self, endpoint: Endpoint) -> Optional[List[str]]:
+        """Return the required top-level fields of a JSON request body, or None if no body is required."""
+        if not endpoint.request_body or not endpoint.request_body.get('required'):
+            return None
+        schema = json_media_schema(endpoint.request_body.get('content', {}))
+        schema = resolve_schema(schema, self.spec_data, max_depth=2) if schema else {}
+        return list(schema.get('required', [])) if isinstance(schema, dict) else []
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0) or 0)
+                if length > MAX_BODY_SIZE:
+                    writer.write(self._render(413, b""))
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = self._route(method, target, body)
+                if self.latency_ms or self.latency_jitter_ms:
+                    delay = self.latency_ms + self.random.uniform(0, self.latency_jitter_ms)
+                    await asyncio.sleep(delay / 1000)
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version != 'HTTP/1.0'
+                writer.write(self._render(status, b"" if method == 'HEAD' else payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _route(self, method: str, target: str, body: bytes) -> Tuple[int, bytes]:
+        """Resolve a request to a status code and response body."""
+        self.request_count += 1
+        path = urlsplit(target).path
+        match = self.index.match(method, path)
+        if match is None:
+            if self.index.allowed_methods(path):
+                return 405, self._error("Method not allowed")
+            return 404, self._error("Not found")
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            return self.error_status, self._error("Injected error")
+
+        endpoint, _ = match
+        key = (endpoint.method.value, endpoint.path)
+
+        required_fields = self._required_bodies.get(key)
+        if required_fields is not None:
+            try:
+                payload = json.loads(body) if body else None
+            except ValueError:
+                return 400, self._error("Request body is not valid JSON")
+            if not isinstance(payload, dict):
+                return 400, self._error("Request body is required")
+            missing = [name for name in required_fields if name not in payload]
+            if missing:
+                return 400, self._error(f"Missing required fields: {', '.join(missing)}")
+
+        status, bodies = self._responses[key]
+        return status, bodies[self.random.randrange(len(bodies))]
+
+    def _error(self, message: str) -> bytes:
+        return json.dumps({'error': message}).encode('utf-8')
+
+    def _render(self, status: int, payload: bytes, keep_alive: bool = False) -> bytes:
+        head = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}",
+            f"Content-Length: {len(payload)}",
+            "Connection: keep-alive" if keep_alive else "Connection: close"
+        ]
+        if payload:
+            head.append("Content-Type: application/json")
+        return ("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + payload
+
+    async def start(self):
+        """Start listening; the bound port is available as ``self.port``."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Start the server and serve until cancelled."""
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self) -> str:
+        """Run the server on a background event loop and return its base URL."""
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self.url
+
+    def stop(self):
+        """Stop a server started with :meth:`start_in_thread`."""
+        if self._loop and self._server:
+            async def shutdown():
+                self._server.close()
+                for writer in list(self._writers):
+                    writer.close()
+                await self._server.wait_closed()
+            asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server, including the spec's base path."""
+        return f"http://{self.host}:{self.port}{self.index.base_path}"
@@ -13,6 +13,7 @@ from ..models.schemas import (
     APISpec, Endpoint, Parameter, HTTPMethod, 
     ParameterType, ParameterLocation
 )
+from . import profiling
 
 
 class OpenAPIParser:
@@ -29,15 +30,17 @@ class OpenAPIParser:
         if not file_path_obj.exists():
             raise FileNotFoundError(f"OpenAPI spec file not found: {file_path}")
             
-        with open(file_path_obj, 'r', encoding='utf-8') as f:
-            if file_path_obj.suffix.lower() in ['.yaml', '.yml']:
-                self.spec_data = yaml.safe_load(f)
-            elif file_path_obj.suffix.lower() == '.json':
-                self.spec_data = json.load(f)
-            else:
-                raise ValueError(f"Unsupported file format: {file_path_obj.suffix}")
-                
-        return self._parse_spec()
+        with profiling.stage("parser.load", file=str(file_path_obj)):
+            with open(file_path_obj, 'r', encoding='utf-8') as f:
+                if file_path_obj.suffix.lower() in ['.yaml', '.yml']:
+                    self.spec_data = yaml.safe_load(f)
+                elif file_path_obj.suffix.lower() == '.json':
+                    self.spec_data = json.load(f)
+                else:
+                    raise ValueError(f"Unsupported file format: {file_path_obj.suffix}")
+        
+        with profiling.stage("parser.parse"):
+            return self._parse_spec()
     
     def parse_string(self, spec_content: str, format: str = 'yaml') -> APISpec:
         """Parse an OpenAPI specification from string content."""
@@ -84,9 +87,11 @@ class OpenAPIParser:
         paths = self.spec_data.get('paths', {})
         
         for path, path_data in paths.items():
+            path_extensions = self._extract_extensions(path_data)
             for method, method_data in path_data.items():
                 if method.lower() in [m.value for m in HTTPMethod]:
                     endpoint = self._parse_endpoint(path, method, method_data)
+                    endpoint.extensions = {**path_extensions, **endpoint.extensions}
                     endpoints.append(endpoint)
         
         return endpoints
@@ -117,9 +122,14 @@ class OpenAPIParser:
             request_body=request_body,
             responses=responses,
             tags=tags,
-            operation_id=operation_id
+            operation_id=operation_id,
+            extensions=self._extract_extensions(method_data)
         )
     
+    def _extract_extensions(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract x-* vendor extensions from a spec object."""
+        return {key: value for key, value in data.items() if key.startswith('x-')}
+    
     def _parse_parameters(self, parameters_data: List[Dict[str, Any]]) -> List[Parameter]:
         """Parse parameters from the OpenAPI specification."""
         parameters = []
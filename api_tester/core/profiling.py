@@ -0,0 +1,125 @@
+"""
+Lightweight stage timers and counters for profiling test runs.
+
+Instrumented code calls the module-level :func:`stage` and :func:`count`
+helpers. They are no-ops until :func:`enable_profiling` installs a
+:class:`Profiler`, so the hot paths pay only a function call when profiling
+is off.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Any, Optional
+
+
+class Profiler:
+    """Collects per-stage timings, counters and a Chrome-compatible event trace."""
+
+    def __init__(self, max_events: int = 100000):
+        self.max_events = max_events
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, float] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.dropped_events = 0
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, **attributes):
+        """Time the enclosed block and attribute it to ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._record(name, start, end, attributes)
+
+    def _record(self, name: str, start: float, end: float, attributes: Dict[str, Any]):
+        duration = end - start
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = {'count': 0, 'total': 0.0, 'max': 0.0}
+            stats['count'] += 1
+            stats['total'] += duration
+            stats['max'] = max(stats['max'], duration)
+
+            if len(self.events) < self.max_events:
+                self.events.append({
+                    'name': name,
+                    'ph': 'X',
+                    'ts': (start - self._origin) * 1_000_000,
+                    'dur': duration * 1_000_000,
+                    'pid': os.getpid(),
+                    'tid': threading.get_ident(),
+                    'args': attributes
+                })
+            else:
+                self.dropped_events += 1
+
+    def count(self, name: str, value: float = 1):
+        """Add ``value`` to the counter ``name``."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self) -> Dict[str, Any]:
+        """Return stage timings (with mean) and counters."""
+        stages = {
+            name: {**stats, 'mean': stats['total'] / stats['count'] if stats['count'] else 0.0}
+            for name, stats in sorted(self.stages.items(), key=lambda item: -item[1]['total'])
+        }
+        return {
+            'wall_time': time.perf_counter() - self._origin,
+            'stages': stages,
+            'counters': dict(sorted(self.counters.items()))
+        }
+
+    def write_trace(self, file_path: str) -> str:
+        """Write the summary and events as JSON loadable by chrome://tracing or Perfetto."""
+        trace = {
+            **self.summary(),
+            'dropped_events': self.dropped_events,
+            'traceEvents': self.events,
+            'displayTimeUnit': 'ms'
+        }
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, default=str)
+        return file_path
+
+
+_profiler: Optional[Profiler] = None
+_NULL_STAGE = nullcontext()
+
+
+def enable_profiling(max_events: int = 100000) -> Profiler:
+    """Install a process-wide profiler and return it."""
+    global _profiler
+    _profiler = Profiler(max_events=max_events)
+    return _profiler
+
+
+def disable_profiling():
+    """Remove the process-wide profiler."""
+    global _profiler
+    _profiler = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Return the active profiler, if profiling is enabled."""
+    return _profiler
+
+
+def stage(name: str, **attributes):
+    """Context manager timing a stage on the active profiler (no-op when disabled)."""
+    if _profiler is None:
+        return _NULL_STAGE
+    return _profiler.stage(name, **attributes)
+
+
+def count(name: str, value: float = 1):
+    """Increment a counter on the active profiler (no-op when disabled)."""
+    if _profiler is not None:
+        _profiler.count(name, value)
@@ -0,0 +1,202 @@
+"""
+Compact prompt rendering for LLM test generation.
+
+Request bodies and parameter schemas are resolved and rendered in a terse,
+TypeScript-like notation that keeps only what matters for generating inputs
+(types, formats, constraints, required fields and enums)::
+
+    {name: string, photoUrls: string[], status?: "available"|"pending"|"sold"}
+
+Descriptions, examples, XML hints, titles and read-only properties are
+dropped. When a prompt would still exceed its token budget, nested schemas
+are collapsed level by level until it fits.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from ..models.schemas import Endpoint
+from .schema_utils import json_media_schema, resolve_schema
+
+# Rough size of a token in English text and JSON-like notation
+CHARS_PER_TOKEN = 4
+
+_DESCRIPTION_CHARS = 120
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in text (about four characters per token)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _range(low: Any, high: Any, exclusive_low: bool = False, exclusive_high: bool = False) -> str:
+    if low is None and high is None:
+        return ''
+    return (f"{'(' if exclusive_low else '['}{'' if low is None else low}.."
+            f"{'' if high is None else high}{')' if exclusive_high else ']'}")
+
+
+def _numeric_range(schema: Dict[str, Any]) -> str:
+    low, high = schema.get('minimum'), schema.get('maximum')
+    exclusive_low = exclusive_high = False
+    # OpenAPI 3.0 flags the bound as exclusive; 3.1 gives the exclusive bound itself
+    if isinstance(schema.get('exclusiveMinimum'), bool):
+        exclusive_low = schema['exclusiveMinimum']
+    elif schema.get('exclusiveMinimum') is not None:
+        low, exclusive_low = schema['exclusiveMinimum'], True
+    if isinstance(schema.get('exclusiveMaximum'), bool):
+        exclusive_high = schema['exclusiveMaximum']
+    elif schema.get('exclusiveMaximum') is not None:
+        high, exclusive_high = schema['exclusiveMaximum'], True
+    return _range(low, high, exclusive_low, exclusive_high)
+
+
+def render_schema(schema: Any, max_depth: Optional[int] = None, _depth: int = 0) -> str:
+    """Render a resolved JSON Schema in compact notation.
+
+    Objects nested deeper than ``max_depth`` are collapsed to ``object`` (or
+    ``object[]``) to save tokens.
+    """
+    if not isinstance(schema, dict) or not schema:
+        return 'any'
+
+    if 'const' in schema:
+        return json.dumps(schema['const'])
+    if schema.get('enum'):
+        return '|'.join(json.dumps(value) for value in schema['enum'])
+
+    for key in ('oneOf', 'anyOf'):
+        if schema.get(key):
+            return '|'.join(render_schema(part, max_depth, _depth) for part in schema[key])
+    if schema.get('allOf'):
+        return '&'.join(render_schema(part, max_depth, _depth) for part in schema['allOf'])
+
+    schema_type = schema.get('type')
+    nullable = schema.get('nullable') is True
+    if isinstance(schema_type, list):
+        nullable = nullable or 'null' in schema_type
+        types = [t for t in schema_type if t != 'null']
+        schema_type = types[0] if len(types) == 1 else None
+        if len(types) > 1:
+            return '|'.join(types + (['null'] if nullable else []))
+    if schema_type is None:
+        schema_type = 'object' if 'properties' in schema else 'array' if 'items' in schema else None
+
+    if schema_type == 'object':
+        rendered = _render_object(schema, max_depth, _depth)
+    elif schema_type == 'array':
+        items = schema.get('items')
+        if max_depth is not None and _depth >= max_depth and isinstance(items, dict) and (
+                items.get('properties') or items.get('type') == 'object'):
+            item_text = 'object'
+        else:
+            item_text = render_schema(items, max_depth, _depth + 1)
+        if '|' in item_text or '&' in item_text:
+            item_text = f"({item_text})"
+        rendered = f"{item_text}[]{_range(schema.get('minItems'), schema.get('maxItems'))}"
+        if schema.get('uniqueItems'):
+            rendered += ' unique'
+    elif schema_type in ('integer', 'number'):
+        rendered = schema.get('format') if schema.get('format') in ('int32', 'int64', 'float', 'double') else schema_type
+        rendered += _numeric_range(schema)
+        if schema.get('multipleOf') is not None:
+            rendered += f" multipleOf {schema['multipleOf']}"
+    elif schema_type == 'string':
+        rendered = f"string<{schema['format']}>" if schema.get('format') else 'string'
+        rendered += _range(schema.get('minLength'), schema.get('maxLength'))
+        if schema.get('pattern'):
+            rendered += f" /{schema['pattern']}/"
+    else:
+        rendered = schema_type or 'any'
+
+    return f"{rendered}|null" if nullable else rendered
+
+
+def _render_object(schema: Dict[str, Any], max_depth: Optional[int], depth: int) -> str:
+    properties = schema.get('properties') or {}
+    additional = schema.get('additionalProperties')
+    if max_depth is not None and depth > max_depth and (properties or isinstance(additional, dict)):
+        return 'object'
+
+    required = set(schema.get('required') or [])
+    fields = []
+    for name, prop in properties.items():
+        # Read-only fields are set by the server and never sent in a request
+        if isinstance(prop, dict) and prop.get('readOnly'):
+            continue
+        marker = '' if name in required else '?'
+        fields.append(f"{name}{marker}: {render_schema(prop, max_depth, depth + 1)}")
+    if isinstance(additional, dict) and additional:
+        fields.append(f"[key: string]: {render_schema(additional, max_depth, depth + 1)}")
+    if not fields:
+        return 'object'
+    return '{' + ', '.join(fields) + '}'
+
+
+def _truncate(text: Optional[str], limit: int = _DESCRIPTION_CHARS) -> str:
+    text = ' '.join((text or '').split())
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + '…'
+
+
+class PromptCompiler:
+    """Renders the endpoint part of generation prompts within a token budget."""
+
+    def __init__(self, spec_data: Optional[Dict[str, Any]] = None, max_tokens: Optional[int] = 1500):
+        self.spec_data = spec_data or {}
+        self.max_tokens = max_tokens
+
+    def _body_schema(self, endpoint: Endpoint) -> tuple:
+        """Return the resolved request body schema and its media type (JSON preferred)."""
+        content = (endpoint.request_body or {}).get('content') or {}
+        schema = json_media_schema(content)
+        media_type = 'application/json'
+        if schema is None:
+            for media_type, media in content.items():
+                if isinstance(media, dict) and media.get('schema'):
+                    schema = media['schema']
+                    break
+            else:
+                return None, None
+        return resolve_schema(schema, self.spec_data), media_type
+
+    def describe_endpoint(self, endpoint: Endpoint, reserved_tokens: int = 0) -> str:
+        """Describe an endpoint compactly, collapsing nested schemas to fit the budget.
+
+        ``reserved_tokens`` accounts for the fixed instructions that share the
+        prompt.
+        """
+        body_schema, media_type = self._body_schema(endpoint)
+        budget = None if self.max_tokens is None else self.max_tokens - reserved_tokens
+
+        text = self._describe(endpoint, body_schema, media_type, None)
+        depth = 3
+        while budget is not None and estimate_tokens(text) > budget and depth >= 0:
+            text = self._describe(endpoint, body_schema, media_type, depth)
+            depth -= 1
+        if budget is not None and estimate_tokens(text) > budget:
+            text = text[:max(0, budget * CHARS_PER_TOKEN - 1)] + '…'
+        return text
+
+    def _describe(self, endpoint: Endpoint, body_schema: Any, media_type: Optional[str],
+                  max_depth: Optional[int]) -> str:
+        lines = [f"Endpoint: {endpoint.method.value.upper()} {endpoint.path}"]
+        summary = _truncate(endpoint.summary or endpoint.description)
+        if summary:
+            lines.append(f"Summary: {summary}")
+
+        if endpoint.parameters:
+            lines.append("Parameters:")
+            for param in endpoint.parameters:
+                schema = resolve_schema(param.param_schema or {'type': param.type.value}, self.spec_data)
+                line = f"- {param.name} ({param.location.value}{', required' if param.required else ''}): " \
+                       f"{render_schema(schema, max_depth)}"
+                description = _truncate(param.description, 80 if max_depth is None else 40)
+                if description:
+                    line += f" - {description}"
+                lines.append(line)
+
+        if body_schema is not None:
+            label = 'JSON' if media_type == 'application/json' else media_type
+            required = ', required' if (endpoint.request_body or {}).get('required') else ''
+            lines.append(f"Body ({label}{required}): {render_schema(body_schema, max_depth)}")
+        return '\n'.join(lines)
@@ -2,14 +2,40 @@
 Test report generator for API testing results.
 """
 
+import csv
 import json
 import os
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
-from jinja2 import Template
 from ..models.schemas import TestReport, TestResult, TestStatus, APISpec
+from . import profiling
+from .metrics import build_latency_histograms, latency_table, latency_budget_table, endpoint_key
+from .streaming import COMPRESSION_SUFFIXES, open_text, strip_compression_suffix
+
+# Columns of the columnar (csv, parquet) reports, one row per result
+RESULT_COLUMNS = [
+    'endpoint', 'test_case', 'test_type', 'status', 'response_status', 'latency_ms',
+    'error', 'validation_errors', 'latency_budget_exceeded', 'deduplicated', 'timestamp'
+]
+
+
+def result_row(result: TestResult) -> Dict[str, Any]:
+    """Flatten a result into a columnar report row."""
+    return {
+        'endpoint': endpoint_key(result.test_case.endpoint),
+        'test_case': result.test_case.name,
+        'test_type': result.test_case.test_type,
+        'status': result.status.value,
+        'response_status': result.response_status,
+        'latency_ms': round(result.execution_time * 1000, 3) if result.execution_time is not None else None,
+        'error': result.error_message,
+        'validation_errors': len(result.validation_errors),
+        'latency_budget_exceeded': result.latency_budget_exceeded,
+        'deduplicated': result.deduplicated,
+        'timestamp': result.timestamp.isoformat()
+    }
 
 
 class TestReporter:
@@ -19,18 +45,40 @@ class TestReporter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
     
-    def generate_report(self, test_report: TestReport, format: str = "html") -> str:
-        """Generate a test report in the specified format."""
+    def generate_report(self, test_report: TestReport, format: str = "html", name: Optional[str] = None,
+                        compression: Optional[str] = None) -> str:
+        """Generate a test report in the specified format.
+
+        ``name`` overrides the default ``test_report_<timestamp>`` file stem.
+        ``compression`` (``gzip`` or ``zstd``) applies to the json, jsonl and
+        csv formats, and selects the codec of parquet files.
+        """
+        if compression is not None and compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression and format.lower() in ("html", "markdown"):
+            raise ValueError(f"Compression is not supported for {format} reports")
+        with profiling.stage("reporter.generate", format=format.lower()):
+            return self._generate_report(test_report, format, name, compression)
+    
+    def _generate_report(self, test_report: TestReport, format: str, name: Optional[str],
+                         compression: Optional[str] = None) -> str:
+        """Dispatch to the generator for the requested format."""
         if format.lower() == "html":
-            return self._generate_html_report(test_report)
+            return self._generate_html_report(test_report, name)
         elif format.lower() == "json":
-            return self._generate_json_report(test_report)
+            return self._generate_json_report(test_report, name, compression)
         elif format.lower() == "markdown":
-            return self._generate_markdown_report(test_report)
+            return self._generate_markdown_report(test_report, name)
+        elif format.lower() == "jsonl":
+            return self._generate_jsonl_report(test_report, name, compression)
+        elif format.lower() == "csv":
+            return self._generate_csv_report(test_report, name, compression)
+        elif format.lower() == "parquet":
+            return self._generate_parquet_report(test_report, name, compression)
         else:
             raise ValueError(f"Unsupported report format: {format}")
     
-    def _generate_html_report(self, test_report: TestReport) -> str:
+    def _generate_html_report(self, test_report: TestReport, name: Optional[str] = None) -> str:
         """Generate an HTML test report."""
         template = self._get_html_template()
         
@@ -41,31 +89,101 @@ class TestReporter:
         html_content = template.render(**template_data)
         
         # Save to file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"test_report_{timestamp}.html"
-        filepath = self.output_dir / filename
+        filepath = self._report_path("html", name)
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
         return str(filepath)
     
-    def _generate_json_report(self, test_report: TestReport) -> str:
+    def _generate_json_report(self, test_report: TestReport, name: Optional[str] = None,
+                              compression: Optional[str] = None) -> str:
         """Generate a JSON test report."""
         # Convert test report to dict
-        report_dict = test_report.model_dump()
+        report_dict = test_report.model_dump(mode='json')
+        report_dict.update(self._latency_sections(test_report))
         
         # Save to file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"test_report_{timestamp}.json"
-        filepath = self.output_dir / filename
+        filepath = self._report_path("json", name, compression)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open_text(filepath, 'w') as f:
             json.dump(report_dict, f, indent=2, default=str)
         
         return str(filepath)
     
-    def _generate_markdown_report(self, test_report: TestReport) -> str:
+    def _latency_sections(self, test_report: TestReport) -> Dict[str, Any]:
+        """Latency histograms and budget tables shared by the JSON formats."""
+        histograms = build_latency_histograms(test_report.test_results)
+        return {
+            'latency': {
+                endpoint: {'summary': histogram.summary(), 'histogram': histogram.to_dict()}
+                for endpoint, histogram in histograms.items()
+            },
+            'latency_budgets': latency_budget_table(test_report.test_results)
+        }
+    
+    def _generate_jsonl_report(self, test_report: TestReport, name: Optional[str] = None,
+                               compression: Optional[str] = None) -> str:
+        """Generate a JSONL test report: a header line, then one compact line per result.
+
+        Results refer to their endpoint by ``METHOD /path`` instead of
+        repeating it; the endpoints are stored once in the header's spec.
+        """
+        header = test_report.model_dump(mode='json', exclude={'test_results'})
+        header['type'] = 'report'
+        header.update(self._latency_sections(test_report))
+        known = {endpoint_key(endpoint) for endpoint in test_report.api_spec.endpoints}
+        
+        filepath = self._report_path("jsonl", name, compression)
+        
+        with open_text(filepath, 'w') as f:
+            f.write(json.dumps(header, separators=(',', ':'), default=str) + '\n')
+            for result in test_report.test_results:
+                key = endpoint_key(result.test_case.endpoint)
+                if key in known:
+                    entry = result.model_dump(mode='json', exclude={'test_case': {'endpoint'}})
+                    entry['test_case']['endpoint'] = key
+                else:
+                    entry = result.model_dump(mode='json')
+                entry['type'] = 'result'
+                f.write(json.dumps(entry, separators=(',', ':'), default=str) + '\n')
+        
+        return str(filepath)
+    
+    def _generate_csv_report(self, test_report: TestReport, name: Optional[str] = None,
+                             compression: Optional[str] = None) -> str:
+        """Generate a columnar CSV report with one row per result (see ``RESULT_COLUMNS``)."""
+        filepath = self._report_path("csv", name, compression)
+        
+        with open_text(filepath, 'w') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(RESULT_COLUMNS)
+            for result in test_report.test_results:
+                row = result_row(result)
+                writer.writerow(['' if row[column] is None else row[column] for column in RESULT_COLUMNS])
+        
+        return str(filepath)
+    
+    def _generate_parquet_report(self, test_report: TestReport, name: Optional[str] = None,
+                                 compression: Optional[str] = None) -> str:
+        """Generate a columnar Parquet report with one row per result (requires pyarrow)."""
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            # pyarrow 18+ may require NumPy 2, while requirements.txt pins numpy 1.26
+            raise ImportError(f'Parquet reports require pyarrow compatible with the installed NumPy '
+                              f'(pip install "pyarrow>=14,<18" for numpy 1.26): {e}') from e
+        
+        rows = [result_row(result) for result in test_report.test_results]
+        table = pyarrow.table({column: [row[column] for row in rows] for column in RESULT_COLUMNS})
+        
+        filepath = self._report_path("parquet", name)
+        pyarrow.parquet.write_table(table, str(filepath), compression=compression or 'snappy')
+        
+        return str(filepath)
+    
+    def _generate_markdown_report(self, test_report: TestReport, name: Optional[str] = None) -> str:
         """Generate a Markdown test report."""
         content = []
         
@@ -84,9 +202,39 @@ class TestReporter:
         content.append(f"- **Passed:** {test_report.passed_tests}")
         content.append(f"- **Failed:** {test_report.failed_tests}")
         content.append(f"- **Errors:** {test_report.error_tests}")
+        if test_report.skipped_tests:
+            content.append(f"- **Skipped:** {test_report.skipped_tests}")
         content.append(f"- **Success Rate:** {test_report.success_rate:.1f}%")
         content.append(f"")
         
+        # Latency
+        latency_rows = latency_table(test_report.test_results)
+        if latency_rows:
+            content.append(f"## Latency by Endpoint")
+            content.append(f"")
+            content.append(f"| Endpoint | Count | p50 (ms) | p90 (ms) | p99 (ms) | Max (ms) |")
+            content.append(f"|----------|------:|---------:|---------:|---------:|---------:|")
+            for row in latency_rows:
+                content.append(
+                    f"| {row['endpoint']} | {row['count']} | {row['p50'] * 1000:.1f} | "
+                    f"{row['p90'] * 1000:.1f} | {row['p99'] * 1000:.1f} | {row['max'] * 1000:.1f} |"
+                )
+            content.append(f"")
+        
+        # Latency budgets
+        budget_rows = latency_budget_table(test_report.test_results)
+        if budget_rows:
+            content.append(f"## Latency Budgets")
+            content.append(f"")
+            content.append(f"| Endpoint | Budget (ms) | Checked | Exceeded | Worst (ms) |")
+            content.append(f"|----------|------------:|--------:|---------:|-----------:|")
+            for row in budget_rows:
+                content.append(
+                    f"| {row['endpoint']} | {row['budget_ms']:g} | {row['checked']} | "
+                    f"{row['exceeded']} | {row['worst_ms']:.1f} |"
+                )
+            content.append(f"")
+        
         # Test Results
         content.append(f"## Test Results")
         content.append(f"")
@@ -98,7 +246,8 @@ class TestReporter:
             content.append(f"- **Endpoint:** {result.test_case.endpoint.method.value.upper()} {result.test_case.endpoint.path}")
             content.append(f"- **Status:** {result.status.value}")
             content.append(f"- **Response Status:** {result.response_status or 'N/A'}")
-            content.append(f"- **Execution Time:** {result.execution_time:.3f}s")
+            if result.execution_time is not None:
+                content.append(f"- **Execution Time:** {result.execution_time:.3f}s")
             content.append(f"- **Test Type:** {result.test_case.test_type}")
             content.append(f"")
             
@@ -120,15 +269,46 @@ class TestReporter:
                 content.append(f"")
         
         # Save to file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"test_report_{timestamp}.md"
-        filepath = self.output_dir / filename
+        filepath = self._report_path("md", name)
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write('\n'.join(content))
         
         return str(filepath)
     
+    def _report_path(self, extension: str, name: Optional[str] = None, compression: Optional[str] = None) -> Path:
+        """Return the output path for a report file."""
+        if name is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            name = f"test_report_{timestamp}"
+        return self.output_dir / f"{name}.{extension}{COMPRESSION_SUFFIXES.get(compression, '')}"
+    
+    def load_report(self, file_path: str) -> TestReport:
+        """Load a report previously written in JSON or JSONL format, optionally compressed."""
+        with open_text(file_path) as f:
+            if not strip_compression_suffix(file_path).endswith('.jsonl'):
+                return TestReport.model_validate(json.load(f))
+            
+            header = json.loads(f.readline())
+            endpoints = {
+                endpoint_key(endpoint): endpoint
+                for endpoint in APISpec.model_validate(header['api_spec']).endpoints
+            }
+            results = []
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                endpoint = entry['test_case']['endpoint']
+                if isinstance(endpoint, str):
+                    # Validated models are shared rather than rebuilt for every result
+                    entry['test_case']['endpoint'] = endpoints[endpoint]
+                results.append(TestResult.model_validate(entry))
+        return TestReport(
+            **{field: value for field, value in header.items() if field in TestReport.model_fields and field != 'test_results'},
+            test_results=results
+        )
+    
     def _prepare_template_data(self, test_report: TestReport) -> Dict[str, Any]:
         """Prepare data for HTML template."""
         return {
@@ -140,9 +320,12 @@ class TestReporter:
                 'passed_tests': test_report.passed_tests,
                 'failed_tests': test_report.failed_tests,
                 'error_tests': test_report.error_tests,
+                'skipped_tests': test_report.skipped_tests,
                 'success_rate': test_report.success_rate,
                 'execution_time': test_report.execution_time
             },
+            'latency': latency_table(test_report.test_results),
+            'latency_budgets': latency_budget_table(test_report.test_results),
             'timestamp': test_report.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
             'status_emoji': {
                 TestStatus.PASSED: '✅',
@@ -152,8 +335,11 @@ class TestReporter:
             }
         }
     
-    def _get_html_template(self) -> Template:
+    def _get_html_template(self):
         """Get the HTML template for reports."""
+        # jinja2 is only needed for HTML reports
+        from jinja2 import Template
+        
         template_content = """
 <!DOCTYPE html>
 <html lang="en">
@@ -295,6 +481,23 @@ class TestReporter:
             max-height: 300px;
             overflow-y: auto;
         }
+        .latency {
+            padding: 30px 30px 0 30px;
+        }
+        .latency table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.95em;
+        }
+        .latency th, .latency td {
+            padding: 8px 12px;
+            border-bottom: 1px solid #e9ecef;
+            text-align: right;
+        }
+        .latency th:first-child, .latency td:first-child {
+            text-align: left;
+            font-family: 'Courier New', monospace;
+        }
         .footer {
             text-align: center;
             padding: 20px;
@@ -328,6 +531,12 @@ class TestReporter:
                 <h3>Errors</h3>
                 <div class="number error">{{ summary.error_tests }}</div>
             </div>
+            {% if summary.skipped_tests %}
+            <div class="summary-card">
+                <h3>Skipped</h3>
+                <div class="number total">{{ summary.skipped_tests }}</div>
+            </div>
+            {% endif %}
             <div class="summary-card">
                 <h3>Success Rate</h3>
                 <div class="number passed">{{ "%.1f"|format(summary.success_rate) }}%</div>
@@ -338,6 +547,64 @@ class TestReporter:
             </div>
         </div>
         
+        {% if latency %}
+        <div class="latency">
+            <h2>Latency by Endpoint</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Endpoint</th>
+                        <th>Count</th>
+                        <th>p50 (ms)</th>
+                        <th>p90 (ms)</th>
+                        <th>p99 (ms)</th>
+                        <th>Max (ms)</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for row in latency %}
+                    <tr>
+                        <td>{{ row.endpoint }}</td>
+                        <td>{{ row.count }}</td>
+                        <td>{{ "%.1f"|format(row.p50 * 1000) }}</td>
+                        <td>{{ "%.1f"|format(row.p90 * 1000) }}</td>
+                        <td>{{ "%.1f"|format(row.p99 * 1000) }}</td>
+                        <td>{{ "%.1f"|format(row.max * 1000) }}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endif %}
+        
+        {% if latency_budgets %}
+        <div class="latency">
+            <h2>Latency Budgets</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Endpoint</th>
+                        <th>Budget (ms)</th>
+                        <th>Checked</th>
+                        <th>Exceeded</th>
+                        <th>Worst (ms)</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for row in latency_budgets %}
+                    <tr>
+                        <td>{{ row.endpoint }}</td>
+                        <td>{{ "%g"|format(row.budget_ms) }}</td>
+                        <td>{{ row.checked }}</td>
+                        <td class="{{ 'failed' if row.exceeded else 'passed' }}">{{ row.exceeded }}</td>
+                        <td>{{ "%.1f"|format(row.worst_ms) }}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endif %}
+        
         <div class="results">
             <h2>Test Results</h2>
             {% for result in test_results %}
@@ -358,10 +625,18 @@ class TestReporter:
                         <div class="detail-label">Response Status:</div>
                         <div class="detail-value">{{ result.response_status or 'N/A' }}</div>
                     </div>
+                    {% if result.execution_time is not none %}
                     <div class="detail-row">
                         <div class="detail-label">Execution Time:</div>
                         <div class="detail-value">{{ "%.3f"|format(result.execution_time) }}s</div>
                     </div>
+                    {% endif %}
+                    {% if result.timings.ttfb is defined %}
+                    <div class="detail-row">
+                        <div class="detail-label">Timing:</div>
+                        <div class="detail-value">TTFB {{ "%.1f"|format(result.timings.ttfb * 1000) }}ms, transfer {{ "%.1f"|format(result.timings.transfer * 1000) }}ms</div>
+                    </div>
+                    {% endif %}
                     <div class="detail-row">
                         <div class="detail-label">Test Type:</div>
                         <div class="detail-value">{{ result.test_case.test_type }}</div>
@@ -410,11 +685,14 @@ class TestReporter:
         passed_tests = len([r for r in test_results if r.status == TestStatus.PASSED])
         failed_tests = len([r for r in test_results if r.status == TestStatus.FAILED])
         error_tests = len([r for r in test_results if r.status == TestStatus.ERROR])
+        skipped_tests = len([r for r in test_results if r.status == TestStatus.SKIPPED])
+        run_tests = total_tests - skipped_tests
         
         return {
             'total_tests': total_tests,
             'passed_tests': passed_tests,
             'failed_tests': failed_tests,
             'error_tests': error_tests,
-            'success_rate': (passed_tests / total_tests * 100) if total_tests > 0 else 0
+            'skipped_tests': skipped_tests,
+            'success_rate': (passed_tests / run_tests * 100) if run_tests > 0 else 0
         } 
\ No newline at end of file
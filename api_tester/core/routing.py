@@ -0,0 +1,119 @@
+"""
+Path-template index for matching concrete request paths to endpoints.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from ..models.schemas import Endpoint
+
+_PARAM_PATTERN = re.compile(r'\{([^}/]+)\}')
+
+
+class _Node:
+    """A trie node keyed by path segment."""
+
+    __slots__ = ('literals', 'param', 'patterns', 'endpoints')
+
+    def __init__(self):
+        self.literals: Dict[str, "_Node"] = {}
+        self.param: Optional["_Node"] = None
+        self.patterns: List[Tuple[re.Pattern, "_Node"]] = []
+        self.endpoints: Dict[str, Endpoint] = {}
+
+
+class PathTemplateIndex:
+    """Matches request paths such as ``/pets/42`` to templates like ``/pets/{petId}``.
+
+    Templates are stored in a segment trie so matching costs O(path depth)
+    regardless of how many endpoints the spec has. Literal segments win over
+    parameter segments, so ``/pets/mine`` matches before ``/pets/{petId}``.
+    """
+
+    def __init__(self, endpoints: Optional[List[Endpoint]] = None, base_path: str = ""):
+        self.root = _Node()
+        self.base_path = base_path.rstrip('/')
+        for endpoint in endpoints or []:
+            self.add(endpoint)
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        return [segment for segment in path.split('/') if segment]
+
+    @staticmethod
+    def _segment_regex(segment: str) -> re.Pattern:
+        """Compile a mixed segment such as ``{name}.json`` into a regex."""
+        parts = _PARAM_PATTERN.split(segment)
+        # split() alternates literal text and parameter names
+        pattern = ''.join(re.escape(part) if i % 2 == 0 else '([^/]+?)' for i, part in enumerate(parts))
+        return re.compile(f'^{pattern}$')
+
+    def add(self, endpoint: Endpoint):
+        """Add an endpoint to the index."""
+        node = self.root
+        for segment in self._split(endpoint.path):
+            names = _PARAM_PATTERN.findall(segment)
+            if not names:
+                node = node.literals.setdefault(segment, _Node())
+            elif segment == f"{{{names[0]}}}":
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                regex = self._segment_regex(segment)
+                child = next((n for p, n in node.patterns if p.pattern == regex.pattern), None)
+                if child is None:
+                    child = _Node()
+                    node.patterns.append((regex, child))
+                node = child
+        node.endpoints[endpoint.method.value] = endpoint
+
+    def match(self, method: str, path: str) -> Optional[Tuple[Endpoint, Dict[str, str]]]:
+        """Return the endpoint and extracted path parameters for a request, if any."""
+        node_match = self._match_path(path)
+        if node_match is None:
+            return None
+        node, values = node_match
+        endpoint = node.endpoints.get(method.lower())
+        if endpoint is None:
+            return None
+        # Parameter names are taken from the endpoint's own template, since
+        # templates sharing a trie node may name the same segment differently.
+        return endpoint, dict(zip(_PARAM_PATTERN.findall(endpoint.path), values))
+
+    def allowed_methods(self, path: str) -> List[str]:
+        """Return the methods defined for the template matching path."""
+        node_match = self._match_path(path)
+        if node_match is None:
+            return []
+        return [method.upper() for method in node_match[0].endpoints]
+
+    def _match_path(self, path: str) -> Optional[Tuple[_Node, List[str]]]:
+        path = path.split('?', 1)[0]
+        if self.base_path and path.startswith(self.base_path):
+            path = path[len(self.base_path):]
+        return self._walk(self.root, self._split(path), 0, [])
+
+    def _walk(self, node: _Node, segments: List[str], position: int,
+              values: List[str]) -> Optional[Tuple[_Node, List[str]]]:
+        if position == len(segments):
+            return (node, values) if node.endpoints else None
+
+        segment = segments[position]
+        child = node.literals.get(segment)
+        if child is not None:
+            found = self._walk(child, segments, position + 1, values)
+            if found:
+                return found
+
+        for regex, child in node.patterns:
+            match = regex.match(segment)
+            if match:
+                found = self._walk(child, segments, position + 1, values + list(match.groups()))
+                if found:
+                    return found
+
+        if node.param is not None:
+            return self._walk(node.param, segments, position + 1, values + [segment])
+
+        return None
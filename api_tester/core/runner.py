@@ -0,0 +1,222 @@
+"""
+Test run orchestration: generate, execute and validate endpoint by endpoint.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Any, Optional
+
+from ..models.schemas import Endpoint, TestCase, TestResult, TestStatus
+from .generator import TestCaseGenerator
+from .executor import TestExecutor
+from .validator import ResponseValidator
+from .cassette import Cassette
+from .checkpoint import RunCheckpoint
+from .scenarios import DependencyGraph, ScenarioContext
+from .scheduler import Scheduler
+
+NOT_RUN_MESSAGE = "Not run: the run stopped early after too many failures"
+
+
+class TestRunner:
+    """Runs the generate → execute → validate pipeline for a set of endpoints."""
+
+    def __init__(self, generator: Optional[TestCaseGenerator], executor: TestExecutor, validator: ResponseValidator,
+                 spec_data: Dict[str, Any], checkpoint: Optional[RunCheckpoint] = None,
+                 cassette: Optional[Cassette] = None, progress: Optional[Callable[[str], None]] = None,
+                 chain: bool = False, parallel: int = 1, scheduler: Optional[Scheduler] = None,
+                 max_failures: Optional[int] = None):
+        self.generator = generator
+        self.executor = executor
+        self.validator = validator
+        self.spec_data = spec_data
+        self.checkpoint = checkpoint
+        self.cassette = cassette
+        self.progress = progress or (lambda message: None)
+        self.chain = chain
+        self.parallel = max(1, parallel)
+        self.scheduler = scheduler
+        self.max_failures = max_failures
+        self.failures = 0
+        self.stopped = False
+        # Endpoints never reached after an early stop, whose test cases were never generated
+        self.not_run: List[Endpoint] = []
+        self.scenario: Optional[ScenarioContext] = None
+        self.test_cases: List[TestCase] = []
+        # The validator keeps per-call state, so parallel chains take turns
+        self._validate_lock = threading.Lock()
+        self._failure_lock = threading.Lock()
+
+    def _count_failure(self, result: TestResult) -> bool:
+        """Count a failed or errored result; return True once the run should stop."""
+        with self._failure_lock:
+            if result.status in (TestStatus.FAILED, TestStatus.ERROR):
+                self.failures += 1
+                if self.max_failures is not None and self.failures >= self.max_failures and not self.stopped:
+                    self.stopped = True
+                    self.progress(f"\n🛑 Stopping after {self.failures} failures")
+            return self.stopped
+
+    @staticmethod
+    def _not_run(test_case: TestCase) -> TestResult:
+        """A skipped result for a test case left unexecuted by an early stop."""
+        return TestResult(test_case=test_case, status=TestStatus.SKIPPED, error_message=NOT_RUN_MESSAGE)
+
+    def skip_endpoint(self, endpoint: Endpoint) -> List[TestResult]:
+        """Account for an endpoint that an early stop kept from running.
+
+        Test cases already checkpointed for it (when resuming) are reported
+        with their checkpointed results or as skipped. Otherwise its cases
+        were never generated, so the endpoint is listed in ``not_run``.
+        """
+        test_cases = self.checkpoint.get_test_cases(endpoint) if self.checkpoint else None
+        if test_cases is None:
+            with self._failure_lock:
+                self.not_run.append(endpoint)
+            return []
+        self.test_cases.extend(test_cases)
+        return [self.checkpoint.get_result(endpoint, index) or self._not_run(test_case)
+                for index, test_case in enumerate(test_cases)]
+
+    def run(self, endpoints: List[Endpoint]) -> List[TestResult]:
+        """Run every endpoint and return the validated results.
+
+        With ``chain`` enabled, endpoints are grouped into dependency chains
+        (producers before consumers), identifiers from producer responses
+        are bound into consumers' path parameters, and independent chains
+        run on up to ``parallel`` threads.
+
+        With a ``scheduler``, historically failing, flaky and slow endpoints
+        (or chains) run first. Once ``max_failures`` is reached, remaining
+        endpoints are not generated or executed (see ``skip_endpoint``).
+        """
+        if not self.chain:
+            if self.scheduler:
+                endpoints = self.scheduler.order_endpoints(endpoints)
+            results = []
+            for endpoint in endpoints:
+                results.extend(self.skip_endpoint(endpoint) if self.stopped else self.run_endpoint(endpoint))
+            return results
+
+        graph = DependencyGraph(endpoints, self.spec_data)
+        self.scenario = ScenarioContext(graph)
+        chains = graph.chains()
+        if self.scheduler:
+            chains = self.scheduler.order_chains(chains)
+        self.progress(f"🔗 Planned {len(chains)} independent chains "
+                      f"({len(graph.producers)} collections with producers)")
+
+        def run_chain(chain: List[Endpoint]) -> List[TestResult]:
+            chain_results = []
+            for endpoint in chain:
+                chain_results.extend(self.skip_endpoint(endpoint) if self.stopped else self.run_endpoint(endpoint))
+            return chain_results
+
+        with ThreadPoolExecutor(max_workers=self.parallel) as pool:
+            return [result for chain_results in pool.map(run_chain, chains) for result in chain_results]
+
+    def run_test_cases(self, test_cases: Iterable[TestCase], batch_size: int = 100) -> List[TestResult]:
+        """Execute and validate pre-built test cases, consuming them in batches.
+        
+        ``test_cases`` may be a lazy iterator; only one batch of cases is
+        pending at a time, and each batch is deduplicated by the executor.
+        Cases left after an early stop are read on and reported as skipped.
+        Results are kept for the report, so memory still grows with them.
+        """
+        results = []
+        passed = 0
+
+        def on_result(position: int, result: TestResult) -> bool:
+            nonlocal passed
+            results.append(self.validator.validate_response(result, self.spec_data))
+            passed += results[-1].status == TestStatus.PASSED
+            return self._count_failure(results[-1])
+
+        iterator = iter(test_cases)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            if self.stopped:
+                results.extend(self._not_run(test_case) for test_case in batch)
+                continue
+            executed = len(results)
+            self.executor.execute_test_cases(batch, on_result)
+            self.progress(f"🚀 Executed {len(results)} test cases ({passed} passed)")
+            results.extend(self._not_run(test_case) for test_case in batch[len(results) - executed:])
+        return results
+    
+    def get_test_cases(self, endpoint: Endpoint) -> List[TestCase]:
+        """Return test cases for an endpoint, reusing checkpointed or recorded ones."""
+        label = f"{endpoint.method.value.upper()} {endpoint.path}"
+        test_cases = self.checkpoint.get_test_cases(endpoint) if self.checkpoint else None
+        if test_cases is not None:
+            self.progress(f"\n♻️  Reusing {len(test_cases)} checkpointed test cases for {label}")
+            return test_cases
+
+        if self.cassette and self.cassette.is_replay:
+            test_cases = self.cassette.replay_test_cases(endpoint)
+            if test_cases is not None:
+                self.progress(f"\n📼 Replaying {len(test_cases)} recorded test cases for {label}")
+        if test_cases is None:
+            self.progress(f"\n🧠 Generating test cases for {label}...")
+            test_cases = self.generator.generate_test_cases(endpoint)
+            self.progress(f"✅ Generated {len(test_cases)} test cases")
+
+        if self.cassette and not self.cassette.is_replay:
+            self.cassette.record_test_cases(endpoint, test_cases)
+        if self.checkpoint:
+            self.checkpoint.save_test_cases(endpoint, test_cases)
+        return test_cases
+
+    def run_endpoint(self, endpoint: Endpoint) -> List[TestResult]:
+        """Generate, execute and validate the test cases of one endpoint."""
+        test_cases = self.get_test_cases(endpoint)
+        if self.scenario:
+            test_cases = self.scenario.bind(endpoint, test_cases)
+        self.test_cases.extend(test_cases)
+
+        results: List[Optional[TestResult]] = [
+            self.checkpoint.get_result(endpoint, index) if self.checkpoint else None
+            for index in range(len(test_cases))
+        ]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if len(pending) < len(test_cases):
+            self.progress(f"♻️  Reusing {len(test_cases) - len(pending)} checkpointed results")
+
+        if self.scheduler:
+            pending = self.scheduler.order_cases(endpoint, test_cases, pending)
+
+        if pending and not self.stopped:
+            # Execute test cases, validating each response as it arrives
+            self.progress("🚀 Executing and validating test cases...")
+
+            def on_result(position: int, result: TestResult) -> bool:
+                index = pending[position]
+                # Pass the complete OpenAPI spec for proper schema resolution
+                with self._validate_lock:
+                    results[index] = self.validator.validate_response(result, self.spec_data)
+                if self.checkpoint:
+                    self.checkpoint.save_result(endpoint, index, results[index])
+                return self._count_failure(results[index])
+
+            self.executor.execute_test_cases([test_cases[index] for index in pending], on_result)
+
+        # Cases left unexecuted by an early stop are reported as skipped, not checkpointed
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = self._not_run(test_cases[index])
+
+        if self.scenario:
+            self.scenario.observe(endpoint, results)
+
+        # Show progress
+        passed = len([r for r in results if r.status == TestStatus.PASSED])
+        failed = len([r for r in results if r.status == TestStatus.FAILED])
+        errors = len([r for r in results if r.status == TestStatus.ERROR])
+        skipped = len([r for r in results if r.status == TestStatus.SKIPPED])
+        self.progress(f"📊 Results: {passed} passed, {failed} failed, {errors} errors"
+                      + (f", {skipped} skipped" if skipped else ""))
+
+        return results
@@ -0,0 +1,230 @@
+"""
+Stateful scenarios: order endpoints so producers run before consumers and
+thread identifiers from earlier responses into later path parameters.
+"""
+
+import re
+import threading
+from typing import Dict, List, Any, Optional, Set
+
+from ..models.schemas import Endpoint, TestCase, TestResult
+from .schema_utils import json_media_schema, resolve_schema
+
+_PARAM_PATTERN = re.compile(r'\{([^}/]+)\}')
+
+# Reads first, then updates, and deletes last so the resource still exists
+_METHOD_RANK = {'get': 0, 'head': 0, 'options': 0, 'post': 1, 'put': 1, 'patch': 1, 'delete': 2}
+
+
+def _segments(path: str) -> List[str]:
+    return [segment for segment in path.split('/') if segment]
+
+
+def path_collections(endpoint: Endpoint) -> Dict[str, str]:
+    """Map each path parameter to the collection template it indexes.
+
+    ``/users/{userId}/posts/{postId}`` gives ``{'userId': '/users',
+    'postId': '/users/{userId}/posts'}``.
+    """
+    collections = {}
+    segments = _segments(endpoint.path)
+    for index, segment in enumerate(segments):
+        for name in _PARAM_PATTERN.findall(segment):
+            collections.setdefault(name, '/' + '/'.join(segments[:index]))
+    return collections
+
+
+class DependencyGraph:
+    """Producer/consumer relations between endpoints, derived from their paths and schemas.
+
+    An endpoint produces identifiers for a collection (e.g. ``/pet``) when it
+    lives at or below the collection without further path parameters and its
+    success response exposes an identifier-like field (``POST /pet``,
+    ``GET /pet/findByStatus``). Every endpoint with a path parameter indexing
+    the collection (``GET /pet/{petId}``) consumes them.
+    """
+
+    def __init__(self, endpoints: List[Endpoint], spec_data: Dict[str, Any]):
+        self.endpoints = list(endpoints)
+        self.spec_data = spec_data
+        self.producers: Dict[str, List[int]] = {}
+        self.edges: Dict[int, Set[int]] = {index: set() for index in range(len(self.endpoints))}
+        self._build()
+
+    def _response_fields(self, endpoint: Endpoint) -> Optional[Set[str]]:
+        """Top-level fields of the success response (or of its array items); None if unknown."""
+        for status, response in sorted(endpoint.responses.items()):
+            if not str(status).startswith('2') or not isinstance(response, dict):
+                continue
+            schema = json_media_schema(response.get('content', {}))
+            if not schema:
+                continue
+            schema = resolve_schema(schema, self.spec_data, max_depth=3)
+            if schema.get('type') == 'array' or 'items' in schema:
+                schema = schema.get('items') or {}
+            return set(schema.get('properties', {}))
+        return None
+
+    def _build(self):
+        consumers: Dict[str, List[int]] = {}
+        for index, endpoint in enumerate(self.endpoints):
+            for collection in path_collections(endpoint).values():
+                consumers.setdefault(collection, []).append(index)
+
+        for collection, consumer_indexes in consumers.items():
+            wanted = {name for index in consumer_indexes
+                      for name, owner in path_collections(self.endpoints[index]).items() if owner == collection}
+            producers = []
+            for index, endpoint in enumerate(self.endpoints):
+                path = endpoint.path.rstrip('/') or '/'
+                if _PARAM_PATTERN.search(path[len(collection):]) or not (
+                        path == collection or path.startswith(collection.rstrip('/') + '/')):
+                    continue
+                if index in consumer_indexes:
+                    continue
+                fields = self._response_fields(endpoint)
+                if fields is None:
+                    # Unknown schema: trust a create on the collection itself
+                    if endpoint.method.value == 'post' and path == collection:
+                        producers.append(index)
+                elif fields & (wanted | {'id'}):
+                    producers.append(index)
+            # Creates on the collection itself are the most reliable source
+            producers.sort(key=lambda i: (self.endpoints[i].method.value != 'post', self.endpoints[i].path != collection))
+            if not producers:
+                continue
+            self.producers[collection] = producers
+
+            for consumer in consumer_indexes:
+                for producer in producers:
+                    self.edges[producer].add(consumer)
+                # A delete must wait for everything else using the resource
+                if self.endpoints[consumer].method.value == 'delete':
+                    prefix = self.endpoints[consumer].path
+                    for other, endpoint in enumerate(self.endpoints):
+                        if other != consumer and endpoint.method.value != 'delete' and (
+                                endpoint.path == prefix or endpoint.path.startswith(prefix + '/')):
+                            self.edges[other].add(consumer)
+
+    def chains(self) -> List[List[Endpoint]]:
+        """Split endpoints into independent chains, each in dependency order."""
+        parent = list(range(len(self.endpoints)))
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        for source, targets in self.edges.items():
+            for target in targets:
+                parent[find(source)] = find(target)
+
+        components: Dict[int, List[int]] = {}
+        for index in range(len(self.endpoints)):
+            components.setdefault(find(index), []).append(index)
+        return [[self.endpoints[index] for index in self._order(members)] for members in components.values()]
+
+    def _order(self, members: List[int]) -> List[int]:
+        """Topologically sort a component; ties go reads → writes → deletes, then spec order."""
+        member_set = set(members)
+        incoming = {index: 0 for index in members}
+        for source in members:
+            for target in self.edges[source] & member_set:
+                incoming[target] += 1
+
+        def rank(index: int):
+            return (_METHOD_RANK.get(self.endpoints[index].method.value, 1), index)
+
+        ready = sorted((index for index in members if incoming[index] == 0), key=rank)
+        ordered = []
+        while ready:
+            index = ready.pop(0)
+            ordered.append(index)
+            for target in self.edges[index] & member_set:
+                incoming[target] -= 1
+                if incoming[target] == 0:
+                    ready.append(target)
+            ready.sort(key=rank)
+        # Cycles (rare: mutually dependent collections) keep spec order
+        ordered.extend(index for index in members if index not in ordered)
+        return ordered
+
+
+class ScenarioContext:
+    """Collects objects returned by producers and binds them into consumer path parameters."""
+
+    def __init__(self, graph: DependencyGraph, max_objects: int = 10):
+        self.graph = graph
+        self.max_objects = max_objects
+        self.objects: Dict[str, List[Dict[str, Any]]] = {}
+        self._producer_of: Dict[str, List[str]] = {}
+        for collection, producers in graph.producers.items():
+            for index in producers:
+                key = self._key(graph.endpoints[index])
+                self._producer_of.setdefault(key, []).append(collection)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(endpoint: Endpoint) -> str:
+        return f"{endpoint.method.value} {endpoint.path}"
+
+    def observe(self, endpoint: Endpoint, results: List[TestResult]):
+        """Remember objects from successful responses of a producer endpoint."""
+        collections = self._producer_of.get(self._key(endpoint))
+        if not collections:
+            return
+        found = []
+        for result in results:
+            if result.response_status is None or not 200 <= result.response_status < 300:
+                continue
+            body = result.response_body
+            items = body if isinstance(body, list) else [body]
+            found.extend(item for item in items if isinstance(item, dict))
+        if not found:
+            return
+        with self._lock:
+            for collection in collections:
+                stored = self.objects.setdefault(collection, [])
+                stored[:0] = found[:self.max_objects]
+                del stored[self.max_objects:]
+
+    def _value(self, collection: str, name: str, position: int) -> Any:
+        stored = self.objects.get(collection)
+        if not stored:
+            return None
+        candidate = stored[position % len(stored)]
+        if name in candidate:
+            return candidate[name]
+        return candidate.get('id')
+
+    def bind(self, endpoint: Endpoint, test_cases: List[TestCase]) -> List[TestCase]:
+        """Replace made-up path parameters of valid cases with produced identifiers.
+
+        Invalid and boundary cases keep their generated values, since those
+        are meant to exercise bad input.
+        """
+        collections = path_collections(endpoint)
+        if not collections:
+            return test_cases
+
+        bound = []
+        position = 0
+        with self._lock:
+            for test_case in test_cases:
+                if test_case.test_type != 'valid':
+                    bound.append(test_case)
+                    continue
+                path_params = dict(test_case.input_data.get('path_params', {}))
+                changed = False
+                for name, collection in collections.items():
+                    value = self._value(collection, name, position)
+                    if value is not None:
+                        path_params[name] = value
+                        changed = True
+                position += 1
+                if changed:
+                    input_data = {**test_case.input_data, 'path_params': path_params}
+                    test_case = test_case.model_copy(update={'input_data': input_data, 'tags': test_case.tags + ['chained']})
+                bound.append(test_case)
+        return bound
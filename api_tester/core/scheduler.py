@@ -0,0 +1,139 @@
+"""
+History-based test prioritization.
+
+Outcomes of earlier runs (read from their checkpoints) rank test cases so
+that recently failing, flaky and slow ones run first. A broken deployment
+then shows up in the first few requests instead of after every passing
+endpoint, especially combined with ``--fail-fast``.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.schemas import Endpoint, TestCase
+from .checkpoint import RunCheckpoint, DEFAULT_RUNS_DIR
+from .metrics import endpoint_key
+
+# Weight of each older run relative to the next newer one
+DECAY = 0.5
+
+# Score of cases and endpoints without history: behind known failures, ahead of known passes
+NEW_SCORE = 0.5
+
+_FAILED_STATUSES = ('failed', 'error')
+
+Outcome = Tuple[bool, float]  # (failed, execution time in seconds)
+
+
+class TestHistory:
+    """Pass/fail outcomes and durations of test cases over recent runs, newest first."""
+
+    def __init__(self):
+        self.runs: List[Dict[Tuple[str, str], Outcome]] = []
+        self.run_ids: List[str] = []
+
+    @classmethod
+    def load(cls, directory: str = DEFAULT_RUNS_DIR, spec: Optional[str] = None,
+             exclude: Optional[str] = None, max_runs: int = 10) -> "TestHistory":
+        """Read the outcomes of the ``max_runs`` most recent runs of a spec."""
+        history = cls()
+        for run_path, _ in RunCheckpoint.recent_runs(directory, spec, exclude):
+            if len(history.runs) >= max_runs:
+                break
+            outcomes = {}
+            for entry in RunCheckpoint.iter_result_entries(run_path):
+                result = entry.get('result') or {}
+                name = (result.get('test_case') or {}).get('name')
+                if name is None or result.get('status') == 'skipped':
+                    continue
+                outcomes[(entry['endpoint'], name)] = (
+                    result.get('status') in _FAILED_STATUSES, result.get('execution_time') or 0.0)
+            if outcomes:
+                history.add_run(run_path.name, outcomes)
+        return history
+
+    def add_run(self, run_id: str, outcomes: Dict[Tuple[str, str], Outcome]):
+        """Append an older run's outcomes, keyed by ``(METHOD /path, test case name)``."""
+        self.run_ids.append(run_id)
+        self.runs.append(outcomes)
+
+    def __len__(self) -> int:
+        return len(self.runs)
+
+    def stats(self, keys: List[Tuple[str, str]]) -> Optional[Dict[str, Any]]:
+        """Summarize the history of one or more keys (a test case, or every case of an endpoint).
+
+        ``failure`` is the recency-weighted failure rate, ``flakiness`` the
+        share of consecutive runs whose outcome flipped, and ``duration`` the
+        mean execution time. Returns None when none of the keys was seen.
+        """
+        states = []
+        weight_total = failure = duration = 0.0
+        for age, run in enumerate(self.runs):
+            outcomes = [run[key] for key in keys if key in run]
+            if not outcomes:
+                continue
+            failed = any(outcome[0] for outcome in outcomes)
+            weight = DECAY ** age
+            weight_total += weight
+            failure += weight * failed
+            duration += sum(outcome[1] for outcome in outcomes)
+            states.append(failed)
+        if not states:
+            return None
+        flips = sum(a != b for a, b in zip(states, states[1:]))
+        return {
+            'runs': len(states),
+            'last_failed': states[0],
+            'failure': failure / weight_total,
+            'flakiness': flips / (len(states) - 1) if len(states) > 1 else 0.0,
+            'duration': duration / len(states)
+        }
+
+
+class Scheduler:
+    """Orders endpoints and test cases by their history: failing, then flaky, then slow."""
+
+    def __init__(self, history: TestHistory):
+        self.history = history
+        self._endpoint_keys: Dict[str, List[Tuple[str, str]]] = {}
+        for run in history.runs:
+            for key in run:
+                keys = self._endpoint_keys.setdefault(key[0], [])
+                if key not in keys:
+                    keys.append(key)
+
+    @staticmethod
+    def _priority(stats: Optional[Dict[str, Any]]) -> Tuple[float, float]:
+        """Sort key (lower runs first); failures outweigh flakiness, duration breaks ties."""
+        if stats is None:
+            return (-NEW_SCORE, 0.0)
+        return (-(2 * stats['failure'] + stats['flakiness']), -stats['duration'])
+
+    def endpoint_priority(self, endpoint: Endpoint) -> Tuple[float, float]:
+        """Priority of an endpoint: that of its most urgent test case."""
+        keys = self._endpoint_keys.get(endpoint_key(endpoint))
+        if not keys:
+            return self._priority(None)
+        return min(self._priority(self.history.stats([key])) for key in keys)
+
+    def order_endpoints(self, endpoints: List[Endpoint]) -> List[Endpoint]:
+        """Sort endpoints most urgent first; ties keep spec order."""
+        return sorted(endpoints, key=self.endpoint_priority)
+
+    def order_chains(self, chains: List[List[Endpoint]]) -> List[List[Endpoint]]:
+        """Sort dependency chains by their most urgent endpoint, keeping each chain's internal order."""
+        return sorted(chains, key=lambda chain: min(self.endpoint_priority(endpoint) for endpoint in chain))
+
+    def order_cases(self, endpoint: Endpoint, test_cases: List[TestCase], indexes: List[int]) -> List[int]:
+        """Sort the given test case indexes most urgent first.
+
+        Cases without history of their own inherit the endpoint's history.
+        """
+        key = endpoint_key(endpoint)
+        fallback = self.history.stats(self._endpoint_keys.get(key, []))
+
+        def priority(index: int) -> Tuple[float, float]:
+            stats = self.history.stats([(key, test_cases[index].name)])
+            return self._priority(stats if stats is not None else fallback)
+
+        return sorted(indexes, key=priority)
@@ -0,0 +1,176 @@
+"""
+Incremental JSON Schema inference from observed JSON documents.
+
+Samples are merged into a summary tree one at a time and then discarded, so
+memory depends on the shape of the data (bounded by ``max_properties`` and
+``max_depth``), not on the number of samples.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional
+
+_TYPE_ORDER = ('object', 'array', 'string', 'integer', 'number', 'boolean')
+
+_FORMAT_PATTERNS = [
+    ('uuid', re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')),
+    ('email', re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')),
+    ('uri', re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://\S+$')),
+]
+
+
+def detect_format(value: str) -> Optional[str]:
+    """Return the JSON Schema ``format`` a string conforms to, if a common one."""
+    if len(value) >= 10 and value[4:5] == '-' and value[7:8] == '-':
+        try:
+            if len(value) == 10:
+                date.fromisoformat(value)
+                return 'date'
+            datetime.fromisoformat(value.replace('Z', '+00:00'))
+            return 'date-time'
+        except ValueError:
+            pass
+    for name, pattern in _FORMAT_PATTERNS:
+        if pattern.match(value):
+            return name
+    return None
+
+
+class _Node:
+    """Merged observations for one location in the documents."""
+
+    __slots__ = ('count', 'null_count', 'types', 'object_count', 'properties', 'additional',
+                 'items', 'format', 'example')
+
+    def __init__(self):
+        self.count = 0
+        self.null_count = 0
+        self.types = set()
+        self.object_count = 0
+        self.properties: Dict[str, "_Node"] = {}
+        self.additional: Optional["_Node"] = None
+        self.items: Optional["_Node"] = None
+        self.format: Any = None  # None: no string seen yet, False: no common format
+        self.example: Any = None
+
+
+class SchemaInferrer:
+    """Builds a JSON Schema from sample documents, merging them incrementally."""
+
+    def __init__(self, max_properties: int = 200, max_depth: int = 16):
+        self.max_properties = max_properties
+        self.max_depth = max_depth
+        self.samples = 0
+        self._root = _Node()
+
+    def add(self, document: Any):
+        """Merge one sample document into the inferred schema."""
+        self.samples += 1
+        self._merge(self._root, document, 0)
+
+    def _merge(self, node: _Node, value: Any, depth: int):
+        node.count += 1
+        if value is None:
+            node.null_count += 1
+            return
+
+        if isinstance(value, dict):
+            node.types.add('object')
+            node.object_count += 1
+            if depth >= self.max_depth:
+                return
+            for key, child in value.items():
+                target = node.properties.get(key)
+                if target is None:
+                    if len(node.properties) < self.max_properties:
+                        target = node.properties[key] = _Node()
+                    else:
+                        # Map-like objects with unbounded keys collapse into additionalProperties
+                        if node.additional is None:
+                            node.additional = _Node()
+                        target = node.additional
+                self._merge(target, child, depth + 1)
+        elif isinstance(value, list):
+            node.types.add('array')
+            if depth >= self.max_depth:
+                return
+            if node.items is None and value:
+                node.items = _Node()
+            for item in value:
+                self._merge(node.items, item, depth + 1)
+        elif isinstance(value, bool):
+            node.types.add('boolean')
+        elif isinstance(value, int):
+            node.types.add('integer')
+            if node.example is None:
+                node.example = value
+        elif isinstance(value, float):
+            node.types.add('number')
+            if node.example is None:
+                node.example = value
+        else:
+            value = str(value)
+            node.types.add('string')
+            if node.example is None:
+                node.example = value
+            if node.format is not False:
+                detected = detect_format(value)
+                if node.format is None:
+                    node.format = detected or False
+                elif detected != node.format:
+                    node.format = False
+
+    def to_schema(self) -> Dict[str, Any]:
+        """Return the JSON Schema describing every sample merged so far."""
+        if not self.samples:
+            return {}
+        return self._schema(self._root)
+
+    def _schema(self, node: _Node) -> Dict[str, Any]:
+        types = [t for t in _TYPE_ORDER if t in node.types]
+        if 'integer' in types and 'number' in types:
+            types.remove('integer')
+        nullable = node.null_count > 0
+
+        schemas = [self._typed_schema(node, schema_type) for schema_type in types]
+        if not schemas:
+            return {'type': 'null'} if nullable else {}
+        if len(schemas) == 1:
+            schema = schemas[0]
+            if nullable:
+                schema['type'] = [schema['type'], 'null']
+            return schema
+        if nullable:
+            schemas.append({'type': 'null'})
+        return {'anyOf': schemas}
+
+    def _typed_schema(self, node: _Node, schema_type: str) -> Dict[str, Any]:
+        schema: Dict[str, Any] = {'type': schema_type}
+        if schema_type == 'object':
+            if node.properties:
+                schema['properties'] = {name: self._schema(child) for name, child in node.properties.items()}
+                required = [name for name, child in node.properties.items()
+                            if child.count == node.object_count]
+                if required:
+                    schema['required'] = required
+            if node.additional is not None:
+                schema['additionalProperties'] = self._schema(node.additional)
+        elif schema_type == 'array':
+            schema['items'] = self._schema(node.items) if node.items is not None else {}
+        elif schema_type == 'string':
+            if node.format:
+                schema['format'] = node.format
+            if isinstance(node.example, str):
+                schema['example'] = node.example
+        elif schema_type in ('integer', 'number'):
+            if isinstance(node.example, (int, float)) and not isinstance(node.example, bool):
+                schema['example'] = node.example
+        return schema
+
+
+def infer_schema(documents: List[Any], **kwargs) -> Dict[str, Any]:
+    """Infer a JSON Schema from a list of sample documents."""
+    inferrer = SchemaInferrer(**kwargs)
+    for document in documents:
+        inferrer.add(document)
+    return inferrer.to_schema()
@@ -0,0 +1,181 @@
+"""
+JSON Schema helpers: $ref resolution and example synthesis.
+"""
+
+import random
+import string
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+
+
+def resolve_ref(ref: str, api_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve a local JSON pointer such as ``#/components/schemas/Pet``."""
+    if not ref.startswith('#/'):
+        raise ValueError(f"Only local references are supported: {ref}")
+
+    node: Any = api_spec
+    for part in ref[2:].split('/'):
+        part = part.replace('~1', '/').replace('~0', '~')
+        if not isinstance(node, dict) or part not in node:
+            raise KeyError(f"Unresolvable reference: {ref}")
+        node = node[part]
+    return node
+
+
+def resolve_schema(schema: Any, api_spec: Dict[str, Any], max_depth: int = 8,
+                   _stack: Optional[List[str]] = None) -> Any:
+    """Return a copy of schema with every local $ref inlined.
+
+    Recursive references are cut off (replaced by an empty schema) once they
+    reappear on the current resolution path or ``max_depth`` is reached.
+    """
+    stack = _stack or []
+
+    if isinstance(schema, list):
+        return [resolve_schema(item, api_spec, max_depth, stack) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    if '$ref' in schema:
+        ref = schema['$ref']
+        if ref in stack or len(stack) >= max_depth:
+            return {}
+        try:
+            target = resolve_ref(ref, api_spec)
+        except (KeyError, ValueError):
+            return {}
+        return resolve_schema(target, api_spec, max_depth, stack + [ref])
+
+    return {key: resolve_schema(value, api_spec, max_depth, stack) for key, value in schema.items()}
+
+
+def collect_refs(schema: Any, api_spec: Dict[str, Any], seen: Optional[set] = None) -> set:
+    """Return every $ref reachable from schema, following references transitively."""
+    seen = set() if seen is None else seen
+
+    if isinstance(schema, list):
+        for item in schema:
+            collect_refs(item, api_spec, seen)
+    elif isinstance(schema, dict):
+        ref = schema.get('$ref')
+        if isinstance(ref, str) and ref not in seen:
+            seen.add(ref)
+            try:
+                collect_refs(resolve_ref(ref, api_spec), api_spec, seen)
+            except (KeyError, ValueError):
+                pass
+        for key, value in schema.items():
+            if key != '$ref':
+                collect_refs(value, api_spec, seen)
+    return seen
+
+
+def json_media_schema(content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Pick the JSON schema out of an OpenAPI ``content`` map."""
+    if not content:
+        return None
+    for media_type, media in content.items():
+        if 'json' in media_type and isinstance(media, dict) and 'schema' in media:
+            return media['schema']
+    return None
+
+
+class SchemaSampler:
+    """Synthesizes instances that conform to a JSON Schema."""
+
+    def __init__(self, api_spec: Optional[Dict[str, Any]] = None, seed: Optional[int] = None,
+                 max_depth: int = 6):
+        self.api_spec = api_spec or {}
+        self.random = random.Random(seed)
+        self.max_depth = max_depth
+
+    def sample(self, schema: Optional[Dict[str, Any]], _depth: int = 0, _stack: tuple = ()) -> Any:
+        """Generate a value that validates against schema."""
+        if not schema or _depth > self.max_depth:
+            return None
+
+        if '$ref' in schema:
+            ref = schema['$ref']
+            if ref in _stack:
+                return None
+            try:
+                target = resolve_ref(ref, self.api_spec)
+            except (KeyError, ValueError):
+                return None
+            return self.sample(target, _depth, _stack + (ref,))
+
+        if 'const' in schema:
+            return schema['const']
+        if schema.get('enum'):
+            return self.random.choice(schema['enum'])
+        if 'example' in schema:
+            return schema['example']
+        if 'default' in schema:
+            return schema['default']
+
+        if 'allOf' in schema:
+            merged: Dict[str, Any] = {}
+            for part in schema['allOf']:
+                value = self.sample(part, _depth + 1, _stack)
+                if isinstance(value, dict):
+                    merged.update(value)
+            return merged
+        for key in ('oneOf', 'anyOf'):
+            if schema.get(key):
+                return self.sample(schema[key][0], _depth + 1, _stack)
+
+        schema_type = schema.get('type')
+        if isinstance(schema_type, list):
+            schema_type = next((t for t in schema_type if t != 'null'), None)
+        if schema_type is None:
+            schema_type = 'object' if 'properties' in schema else 'array' if 'items' in schema else 'string'
+
+        if schema_type == 'object':
+            result = {}
+            for name, prop_schema in schema.get('properties', {}).items():
+                result[name] = self.sample(prop_schema, _depth + 1, _stack)
+            return result
+        if schema_type == 'array':
+            min_items = schema.get('minItems', 1)
+            max_items = max(min_items, schema.get('maxItems', min_items + 1))
+            count = self.random.randint(min_items, min(max_items, min_items + 2))
+            return [self.sample(schema.get('items', {}), _depth + 1, _stack) for _ in range(count)]
+        if schema_type == 'integer':
+            return self._sample_number(schema, integer=True)
+        if schema_type == 'number':
+            return self._sample_number(schema, integer=False)
+        if schema_type == 'boolean':
+            return self.random.random() < 0.5
+        if schema_type == 'null':
+            return None
+        return self._sample_string(schema)
+
+    def _sample_number(self, schema: Dict[str, Any], integer: bool) -> Any:
+        minimum = schema.get('minimum', 0 if integer else 0.0)
+        maximum = schema.get('maximum', minimum + 1000)
+        if schema.get('exclusiveMinimum') is True:
+            minimum += 1 if integer else 1e-6
+        if schema.get('exclusiveMaximum') is True:
+            maximum -= 1 if integer else 1e-6
+        if integer:
+            return self.random.randint(int(minimum), int(max(minimum, maximum)))
+        return round(self.random.uniform(minimum, max(minimum, maximum)), 2)
+
+    def _sample_string(self, schema: Dict[str, Any]) -> str:
+        fmt = schema.get('format')
+        if fmt == 'date-time':
+            return (datetime(2024, 1, 1) + timedelta(seconds=self.random.randint(0, 10 ** 7))).isoformat() + 'Z'
+        if fmt == 'date':
+            return (datetime(2024, 1, 1) + timedelta(days=self.random.randint(0, 365))).date().isoformat()
+        if fmt == 'email':
+            return f"user{self.random.randint(1, 9999)}@example.com"
+        if fmt == 'uuid':
+            return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+        if fmt in ('uri', 'url'):
+            return f"https://example.com/{self.random.randint(1, 9999)}"
+
+        min_length = schema.get('minLength', 1)
+        max_length = max(min_length, schema.get('maxLength', max(min_length, 12)))
+        length = self.random.randint(min_length, min(max_length, max(min_length, 12)))
+        return ''.join(self.random.choice(string.ascii_lowercase) for _ in range(length))
@@ -0,0 +1,74 @@
+"""
+Deterministic sharding of endpoints and merging of per-shard reports.
+"""
+
+import hashlib
+from typing import List, Tuple
+
+from ..models.schemas import Endpoint, TestReport
+from .metrics import endpoint_key
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse a ``i/N`` shard spec (1-based) into ``(index, total)``."""
+    try:
+        index_str, total_str = value.split('/', 1)
+        index, total = int(index_str), int(total_str)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected the form i/N (e.g. 2/4)")
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}', index must be between 1 and {max(total, 1)}")
+    return index, total
+
+
+def endpoint_shard(endpoint: Endpoint, total: int) -> int:
+    """Return the 1-based shard an endpoint belongs to.
+
+    The shard is derived from a hash of the method and path, so every machine
+    computes the same assignment independently of spec order.
+    """
+    digest = hashlib.sha256(endpoint_key(endpoint).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % total + 1
+
+
+def select_shard(endpoints: List[Endpoint], index: int, total: int) -> List[Endpoint]:
+    """Return the endpoints assigned to shard ``index`` of ``total``."""
+    return [endpoint for endpoint in endpoints if endpoint_shard(endpoint, total) == index]
+
+
+def merge_reports(reports: List[TestReport]) -> TestReport:
+    """Combine per-shard reports into a single report.
+
+    Shards run in parallel, so the merged execution time is the slowest
+    shard's; the summed time is kept in the metadata.
+    """
+    if not reports:
+        raise ValueError("No reports to merge")
+
+    seen_shards = set()
+    test_results = []
+    shards = []
+    for report in reports:
+        shard = report.metadata.get('shard')
+        if shard is not None:
+            if shard in seen_shards:
+                raise ValueError(f"Shard {shard} appears more than once")
+            seen_shards.add(shard)
+        test_results.extend(report.test_results)
+        shards.append({
+            'shard': shard,
+            'total_tests': report.total_tests,
+            'execution_time': report.execution_time,
+            'timestamp': report.timestamp.isoformat()
+        })
+
+    return TestReport(
+        api_spec=reports[0].api_spec,
+        test_results=test_results,
+        execution_time=max(report.execution_time for report in reports),
+        timestamp=min(report.timestamp for report in reports),
+        metadata={
+            'merged_from': shards,
+            'total_shard_time': sum(report.execution_time for report in reports)
+        }
+    )
@@ -4,18 +4,101 @@ Auto-generate OpenAPI specifications from API endpoints.
 
 import requests
 import json
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 import re
 
+from requests.adapters import HTTPAdapter
+
+from .schema_inference import SchemaInferrer
+
+DEFAULT_COMMON_PATHS = [
+    "/", "/api", "/api/v1", "/api/v2",
+    "/users", "/posts", "/items", "/products",
+    "/health", "/status", "/docs", "/swagger"
+]
+PROBE_METHODS = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH']
+COLLECTION_KEYS = ('items', 'data', 'results')
+
+_ID_SEGMENT = re.compile(
+    r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{24,})$'
+)
+
+
+def template_path(path: str) -> Tuple[str, Dict[str, str]]:
+    """Replace ID-like segments of a concrete path with named parameters.
+    
+    ``/users/42/posts/7`` becomes ``/users/{userId}/posts/{postId}`` with
+    ``{'userId': '42', 'postId': '7'}``.
+    """
+    segments = []
+    params: Dict[str, str] = {}
+    previous = None
+    for segment in path.strip('/').split('/'):
+        if segment and _ID_SEGMENT.match(segment):
+            base = previous[:-1] if previous and previous.endswith('s') else previous
+            name = f"{base}Id" if base else "id"
+            name = re.sub(r'[^0-9a-zA-Z_]', '_', name)
+            if name in params:
+                name = f"{name}{len(params) + 1}"
+            params[name] = segment
+            segments.append(f"{{{name}}}")
+        else:
+            segments.append(segment)
+            previous = segment
+    return '/' + '/'.join(segments), params
+
+
+def load_wordlist(file_path: str) -> Iterator[str]:
+    """Yield paths from a wordlist file, one per line (``#`` starts a comment)."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            path = line.split('#', 1)[0].strip()
+            if path:
+                yield path if path.startswith('/') else '/' + path
+
+
+class RateLimiter:
+    """Spaces calls evenly so that at most ``rate`` happen per second across threads."""
+
+    def __init__(self, rate: Optional[float]):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class OpenAPISpecGenerator:
     """Generate OpenAPI specifications from API endpoints."""
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, max_workers: int = 16, rate_limit: Optional[float] = None,
+                 timeout: float = 5):
         self.base_url = base_url
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter(rate_limit)
+        
+        # One pooled session shared by all workers, so probes reuse connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         self.spec = {
-            "openapi": "3.0.0",
+            "openapi": "3.1.0",
             "info": {
                 "title": "Auto-Generated API",
                 "version": "1.0.0",
@@ -32,71 +115,277 @@ class OpenAPISpecGenerator:
                 "schemas": {}
             }
         }
+        
+        # Observations from crawling: template -> path parameter samples and
+        # per-method, per-status response schemas
+        self.inferred: Dict[str, Dict[str, Any]] = {}
+    
+    def _request(self, method: str, path: str, timeout: Optional[float] = None) -> requests.Response:
+        self.rate_limiter.acquire()
+        # Paths are relative to the base URL, including any base path such as /api/v3
+        url = self.base_url.rstrip('/') + '/' + path.lstrip('/')
+        return self.session.request(method, url, timeout=timeout or self.timeout)
     
-    def discover_endpoints(self, common_paths: List[str] = None) -> Dict[str, Any]:
-        """Discover API endpoints by trying common paths."""
+    def discover_endpoints(self, common_paths: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Discover API endpoints by probing candidate paths concurrently.
+        
+        ``common_paths`` may be any iterable (e.g. :func:`load_wordlist`); it is
+        consumed lazily with a bounded number of probes in flight, and paths
+        answering 404 are left out of the result.
+        """
         if common_paths is None:
-            common_paths = [
-                "/", "/api", "/api/v1", "/api/v2",
-                "/users", "/posts", "/items", "/products",
-                "/health", "/status", "/docs", "/swagger"
-            ]
+            common_paths = DEFAULT_COMMON_PATHS
         
         discovered_paths = {}
         
-        for path in common_paths:
-            try:
-                response = requests.get(urljoin(self.base_url, path), timeout=5)
-                discovered_paths[path] = {
-                    "status": response.status_code,
-                    "content_type": response.headers.get('content-type', ''),
-                    "methods": self._detect_methods(path)
-                }
-            except Exception as e:
-                print(f"Error testing {path}: {e}")
+        def collect(futures):
+            for future in futures:
+                path, info = future.result()
+                if info is not None:
+                    discovered_paths[path] = info
         
-        return discovered_paths
+        seen = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = set()
+            for path in common_paths:
+                if path in seen:
+                    continue
+                seen.add(path)
+                pending.add(pool.submit(self._probe_path, path))
+                if len(pending) >= self.max_workers * 4:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(wait(pending)[0])
+        
+        return dict(sorted(discovered_paths.items()))
+    
+    def _probe_path(self, path: str):
+        """Probe a single path; returns ``(path, info)`` with ``info`` None if absent."""
+        try:
+            response = self._request('GET', path)
+        except Exception as e:
+            print(f"Error testing {path}: {e}")
+            return path, None
+        if response.status_code == 404:
+            return path, None
+        return path, {
+            "status": response.status_code,
+            "content_type": response.headers.get('content-type', ''),
+            "methods": self._detect_methods(path, get_status=response.status_code)
+        }
     
-    def _detect_methods(self, path: str) -> List[str]:
-        """Detect which HTTP methods are supported for a path."""
+    def _detect_methods(self, path: str, get_status: Optional[int] = None) -> List[str]:
+        """Detect which HTTP methods are supported for a path.
+        
+        A single ``OPTIONS`` request is tried first; if the server answers with
+        an ``Allow`` header the methods are taken from it, otherwise each
+        method is probed in turn.
+        """
+        try:
+            response = self._request('OPTIONS', path, timeout=3)
+            # 405 responses must carry Allow too, so only a missing path is ignored
+            allow = response.headers.get('allow') if response.status_code != 404 else None
+            if allow:
+                allowed = {method.strip().upper() for method in allow.split(',')}
+                return [method.lower() for method in PROBE_METHODS if method in allowed]
+        except Exception:
+            pass
+        
         methods = []
-        test_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH']
+        for method in PROBE_METHODS:
+            if method == 'GET' and get_status is not None:
+                status = get_status
+            else:
+                try:
+                    status = self._request(method, path, timeout=3).status_code
+                except Exception:
+                    continue
+            if status not in [404, 405, 501]:
+                methods.append(method.lower())
         
-        for method in test_methods:
+        return methods
+    
+    def crawl(self, seed_paths: Iterable[str], max_requests: int = 200, samples_per_template: int = 20,
+              ids_per_collection: int = 2) -> Dict[str, Dict[str, Any]]:
+        """Crawl JSON responses with GET, following links and IDs to nested resources.
+        
+        Every response body is merged into a :class:`SchemaInferrer` for its
+        path template and status code, then dropped. The crawl stops after
+        ``max_requests`` requests and fetches at most ``samples_per_template``
+        concrete paths per template, so memory stays bounded.
+        """
+        queue = deque()
+        seen = set()
+        template_hits = Counter()
+        
+        def enqueue(path: Optional[str]):
+            if path is None or path in seen or len(seen) >= max_requests:
+                return
+            template, _ = template_path(path)
+            if template_hits[template] >= samples_per_template:
+                return
+            seen.add(path)
+            template_hits[template] += 1
+            queue.append(path)
+        
+        for path in seed_paths:
+            enqueue(self._relative_path(path))
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = set()
+            while queue or pending:
+                while queue and len(pending) < self.max_workers * 2:
+                    pending.add(pool.submit(self._fetch_json, queue.popleft()))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, status, body = future.result()
+                    if status is None or status == 404:
+                        continue
+                    self._observe(path, 'get', status, body)
+                    if body is not None and 200 <= status < 300:
+                        for link in self._extract_links(path, body, ids_per_collection):
+                            enqueue(link)
+        
+        return self.inferred
+    
+    def _fetch_json(self, path: str) -> Tuple[str, Optional[int], Any]:
+        """GET a path; returns ``(path, status, body)`` with a JSON body or None."""
+        try:
+            response = self._request('GET', path)
+        except Exception as e:
+            print(f"Error crawling {path}: {e}")
+            return path, None, None
+        body = None
+        if 'json' in response.headers.get('content-type', ''):
             try:
-                response = requests.request(method, urljoin(self.base_url, path), timeout=3)
-                if response.status_code not in [404, 405, 501]:
-                    methods.append(method.lower())
-            except:
+                body = response.json()
+            except ValueError:
                 pass
+        return path, response.status_code, body
+    
+    def _observe(self, path: str, method: str, status: int, body: Any):
+        """Merge a response into the inferred schema of its path template."""
+        template, params = template_path(path)
+        entry = self.inferred.setdefault(template, {'parameters': {}, 'methods': {}})
+        for name, value in params.items():
+            entry['parameters'].setdefault(name, SchemaInferrer()).add(int(value) if value.isdigit() else value)
+        responses = entry['methods'].setdefault(method, {})
+        inferrer = responses.setdefault(str(status), SchemaInferrer())
+        if body is not None:
+            inferrer.add(body)
+    
+    def _relative_path(self, link: str) -> Optional[str]:
+        """Turn a link into a path relative to the base URL, or None if it points elsewhere."""
+        if not isinstance(link, str) or not link or len(link) > 512 or any(c in link for c in ' {}'):
+            return None
+        base = urlparse(self.base_url)
+        base_path = base.path.rstrip('/')
         
-        return methods
+        if link.startswith(('http://', 'https://')):
+            parsed = urlparse(link)
+            if parsed.netloc != base.netloc:
+                return None
+            path = parsed.path
+        elif link.startswith('/'):
+            path = urlparse(link).path
+        else:
+            return None
+        
+        if base_path:
+            if path == base_path:
+                path = '/'
+            elif path.startswith(base_path + '/'):
+                path = path[len(base_path):]
+            elif link.startswith(('http://', 'https://')):
+                return None
+        path = path.rstrip('/') or '/'
+        return path
+    
+    def _extract_links(self, path: str, body: Any, ids_per_collection: int, max_values: int = 1000) -> List[str]:
+        """Find same-host links and collection member IDs in a JSON body."""
+        links = []
+        
+        # Collection members: /users -> /users/{id} for the first few IDs
+        collection = body if isinstance(body, list) else None
+        if isinstance(body, dict):
+            collection = next((body[key] for key in COLLECTION_KEYS if isinstance(body.get(key), list)), None)
+        for item in (collection or [])[:ids_per_collection]:
+            if isinstance(item, dict) and isinstance(item.get('id'), (str, int)) and not isinstance(item['id'], bool):
+                links.append(f"{path.rstrip('/')}/{item['id']}")
+        
+        # Link-looking strings anywhere in the document, breadth first
+        stack = deque([body])
+        visited = 0
+        while stack and visited < max_values:
+            value = stack.popleft()
+            visited += 1
+            if isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, list):
+                stack.extend(value)
+            elif isinstance(value, str) and value.startswith(('/', 'http://', 'https://')):
+                link = self._relative_path(value)
+                if link:
+                    links.append(link)
+        return links
     
     def generate_spec_from_discovery(self, discovered_paths: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate OpenAPI spec from discovered endpoints."""
+        """Generate OpenAPI spec from discovered endpoints and crawled responses."""
+        operations: Dict[str, set] = {}
         for path, info in discovered_paths.items():
             if info['methods']:
-                self.spec['paths'][path] = {}
-                
-                for method in info['methods']:
-                    self.spec['paths'][path][method] = {
-                        "summary": f"{method.upper()} {path}",
-                        "responses": {
-                            "200": {
-                                "description": "Successful response",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object",
-                                            "description": "Response data"
-                                        }
-                                    }
-                                }
+                template, _ = template_path(path)
+                operations.setdefault(template, set()).update(info['methods'])
+        for template, entry in self.inferred.items():
+            operations.setdefault(template, set()).update(entry['methods'])
+        
+        for template in sorted(operations):
+            self.spec['paths'][template] = {
+                method: self._build_operation(template, method)
+                for method in sorted(operations[template], key=lambda m: PROBE_METHODS.index(m.upper()))
+            }
+        
+        return self.spec
+    
+    def _build_operation(self, template: str, method: str) -> Dict[str, Any]:
+        """Build an operation, using inferred response schemas where available."""
+        entry = self.inferred.get(template, {'parameters': {}, 'methods': {}})
+        operation: Dict[str, Any] = {"summary": f"{method.upper()} {template}"}
+        
+        parameters = []
+        for name in re.findall(r'{([^}]+)}', template):
+            inferrer = entry['parameters'].get(name)
+            schema = inferrer.to_schema() if inferrer else {"type": "string"}
+            parameters.append({"name": name, "in": "path", "required": True, "schema": schema})
+        if parameters:
+            operation["parameters"] = parameters
+        
+        observed = entry['methods'].get(method)
+        if not observed:
+            operation["responses"] = {
+                "200": {
+                    "description": "Successful response",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "description": "Response data"
                             }
                         }
                     }
+                }
+            }
+            return operation
         
-        return self.spec
+        operation["responses"] = {}
+        for status, inferrer in sorted(observed.items()):
+            response: Dict[str, Any] = {
+                "description": "Successful response" if status.startswith('2') else "Observed response"
+            }
+            if inferrer.samples:
+                response["content"] = {"application/json": {"schema": inferrer.to_schema()}}
+            operation["responses"][status] = response
+        return operation
     
     def save_spec(self, filename: str = "auto_generated_api.yaml"):
         """Save the generated specification to a file."""
@@ -108,9 +397,15 @@ class OpenAPISpecGenerator:
         return filename
 
 
-def generate_spec_from_url(base_url: str, output_file: str = "auto_generated_api.yaml") -> str:
+def generate_spec_from_url(base_url: str, output_file: str = "auto_generated_api.yaml",
+                           wordlist: Optional[str] = None, max_workers: int = 16,
+                           rate_limit: Optional[float] = None, crawl_limit: int = 200) -> str:
     """Convenience function to generate OpenAPI spec from URL."""
-    generator = OpenAPISpecGenerator(base_url)
-    discovered = generator.discover_endpoints()
+    generator = OpenAPISpecGenerator(base_url, max_workers=max_workers, rate_limit=rate_limit)
+    discovered = generator.discover_endpoints(load_wordlist(wordlist) if wordlist else None)
+    if crawl_limit:
+        seeds = [path for path, info in discovered.items()
+                 if 'get' in info['methods'] and 'json' in info['content_type']]
+        generator.crawl(seeds, max_requests=crawl_limit)
     spec = generator.generate_spec_from_discovery(discovered)
     return generator.save_spec(output_file) 
\ No newline at end of file
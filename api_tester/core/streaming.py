@@ -0,0 +1,141 @@
+"""
+Streaming readers for large JSONL, JSON array and HAR files.
+
+The readers yield one record at a time and transparently handle gzip
+(``.gz``) and zstd (``.zst``, requires ``pip install zstandard``) compressed
+input, so multi-gigabyte traffic captures can be processed in constant memory.
+"""
+
+import gzip
+import json
+import re
+from typing import Any, Dict, Iterator, TextIO
+
+from ..models.schemas import TestCase
+
+_ENTRIES_KEY = re.compile(r'"entries"\s*:\s*\[')
+_ARRAY_START = re.compile(r'^\s*\[')
+_SEPARATOR = re.compile(r'[\s,]*')
+
+
+# File suffix of each supported compression
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def strip_compression_suffix(file_path: str) -> str:
+    """Return the path without its ``.gz``/``.zst`` suffix, e.g. to read the inner extension."""
+    file_path = str(file_path)
+    for suffix in COMPRESSION_SUFFIXES.values():
+        if file_path.endswith(suffix):
+            return file_path[:-len(suffix)]
+    return file_path
+
+
+def open_text(file_path: str, mode: str = 'r') -> TextIO:
+    """Open a text file for reading (``'r'``) or writing (``'w'``).
+
+    Files ending in ``.gz`` or ``.zst`` are (de)compressed on the fly.
+    """
+    if str(file_path).endswith('.gz'):
+        # Level 6 compresses nearly as well as the default 9 at a fraction of the time
+        return gzip.open(file_path, mode + 't', encoding='utf-8', compresslevel=6)
+    if str(file_path).endswith('.zst'):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError('zstd compression requires zstandard: pip install zstandard')
+        return zstandard.open(file_path, mode + 't', encoding='utf-8')
+    return open(file_path, mode, encoding='utf-8')
+
+
+def iter_jsonl(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield each JSON object of a JSONL file, skipping blank and malformed lines."""
+    with open_text(file_path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+def iter_json_array(file_path: str, chunk_size: int = 1 << 20) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array one at a time."""
+    with open_text(file_path) as f:
+        yield from _iter_array(f, _ARRAY_START, file_path, chunk_size)
+
+
+def iter_har_entries(file_path: str, chunk_size: int = 1 << 20) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of a HAR file's ``log.entries`` array one at a time."""
+    with open_text(file_path) as f:
+        for entry in _iter_array(f, _ENTRIES_KEY, file_path, chunk_size):
+            if isinstance(entry, dict):
+                yield entry
+
+
+def _iter_array(f: TextIO, start: re.Pattern, file_path: str, chunk_size: int) -> Iterator[Any]:
+    """Decode the elements of the JSON array opened by ``start`` as they become complete.
+
+    The file is read in chunks and each element is decoded as soon as it is
+    complete, so the whole document is never held in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    eof = False
+
+    # Skip ahead to the start of the array
+    while True:
+        match = start.search(buffer)
+        if match:
+            buffer = buffer[match.end():]
+            break
+        if eof:
+            return
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        # Keep a tail in case the opening straddles two chunks
+        buffer = buffer[-64:] + chunk
+
+    position = 0
+    while True:
+        position = _SEPARATOR.match(buffer, position).end()
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        try:
+            element, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise ValueError(f"Truncated or malformed JSON array in {file_path}")
+            # The element is incomplete; read more and retry
+            buffer = buffer[position:]
+            position = 0
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+        yield element
+        position = end
+        if position > chunk_size:
+            buffer = buffer[position:]
+            position = 0
+
+
+def iter_test_cases(file_path: str) -> Iterator[TestCase]:
+    """Rebuild test cases one at a time from a JSON array or JSONL file.
+
+    The format is detected from the first non-blank character, so files
+    written by ``generate``/``import`` and JSONL exports both work.
+    """
+    with open_text(file_path) as f:
+        first = ''
+        while not first:
+            chunk = f.read(1)
+            if not chunk:
+                return
+            first = chunk.strip()
+    records = iter_json_array(file_path) if first == '[' else iter_jsonl(file_path)
+    for record in records:
+        yield TestCase.model_validate(record)
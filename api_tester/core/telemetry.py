@@ -0,0 +1,335 @@
+"""
+OpenTelemetry-style tracing and Prometheus metrics without external dependencies.
+
+Spans are exported as OTLP/JSON (the format written by the OpenTelemetry
+Collector's file exporter) and metrics are rendered in the Prometheus text
+exposition format, either served over HTTP or written to a file for the
+node_exporter textfile collector. Like :mod:`profiling`, the module-level
+helpers are no-ops until tracing or metrics are enabled.
+"""
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Optional, Tuple
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Span:
+    """A single timed operation within a trace."""
+
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_span_id', 'start_ns', 'end_ns',
+                 'attributes', 'status_code', 'status_message')
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = dict(attributes)
+        self.status_code = "STATUS_CODE_UNSET"
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any):
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        """Mark the span as failed."""
+        self.status_code = "STATUS_CODE_ERROR"
+        self.status_message = message
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Convert the span to its OTLP/JSON representation."""
+        span = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': 1,
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns or self.start_ns),
+            'attributes': [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            'status': {'code': self.status_code, 'message': self.status_message}
+        }
+        if self.parent_span_id:
+            span['parentSpanId'] = self.parent_span_id
+        return span
+
+
+class _NullSpan:
+    """Span stand-in used when tracing is disabled."""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_error(self, message: str):
+        pass
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
+
+
+class Tracer:
+    """Creates nested spans and buffers them for export."""
+
+    def __init__(self, service_name: str = "api-auto-tester"):
+        self.service_name = service_name
+        self.trace_id = os.urandom(16).hex()
+        self.spans: List[Span] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Open a span as a child of the current span on this thread."""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        parent = stack[-1].span_id if stack else None
+        span = Span(name, self.trace_id, parent, attributes)
+        stack.append(span)
+        try:
+            yield span
+        except Exception as e:
+            span.set_error(str(e))
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            stack.pop()
+            with self._lock:
+                self.spans.append(span)
+
+    def export_otlp(self, file_path: str) -> str:
+        """Write all finished spans to an OTLP/JSON file."""
+        with self._lock:
+            spans = [span.to_otlp() for span in self.spans]
+        payload = {
+            'resourceSpans': [{
+                'resource': {'attributes': [_otlp_attribute('service.name', self.service_name)]},
+                'scopeSpans': [{
+                    'scope': {'name': 'api_tester'},
+                    'spans': spans
+                }]
+            }]
+        }
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+        return file_path
+
+
+def _label_key(labels: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(label_key: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(label_key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in pairs) + "}"
+
+
+class Counter:
+    """A monotonically increasing Prometheus counter."""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.values: Dict[Tuple[Tuple[str, str], ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, value: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{_format_labels(key)} {value:g}")
+        return lines
+
+
+class Histogram:
+    """A Prometheus histogram with fixed, cumulative buckets."""
+
+    def __init__(self, name: str, description: str, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self.values: Dict[Tuple[Tuple[str, str], ...], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self.values.get(key)
+            if series is None:
+                series = self.values[key] = {'counts': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+            series['counts'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self.values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), series['counts']):
+                    cumulative += count
+                    le = "+Inf" if bound == float('inf') else f"{bound:g}"
+                    lines.append(f"{self.name}_bucket{_format_labels(key, ('le', le))} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {series['sum']:g}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {series['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """The metrics exposed by a test run."""
+
+    def __init__(self):
+        self.requests = Counter("api_tester_requests_total", "HTTP requests sent, by method, route and status code.")
+        self.request_duration = Histogram("api_tester_request_duration_seconds", "HTTP request latency in seconds.")
+        self.errors = Counter("api_tester_errors_total", "Errors by kind (transport, validation, latency_budget).")
+        self.test_results = Counter("api_tester_test_results_total", "Test results by status.")
+        self.llm_calls = Counter("api_tester_llm_calls_total", "LLM completion calls by model and outcome.")
+        self.llm_tokens = Counter("api_tester_llm_tokens_total", "LLM tokens used by model and token type.")
+        self.metrics = [self.requests, self.request_duration, self.errors, self.test_results, self.llm_calls, self.llm_tokens]
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, file_path: str) -> str:
+        """Write the current metrics to a file (for the node_exporter textfile collector)."""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(self.render_prometheus())
+        return file_path
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> str:
+        """Serve ``/metrics`` on a background thread and return its URL."""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self._server.server_port}/metrics"
+
+    def shutdown(self):
+        """Stop the metrics HTTP server, if running."""
+        if self._server:
+            self._server.shutdown()
+            self._server = None
+
+
+_tracer: Optional[Tracer] = None
+_metrics: Optional[MetricsRegistry] = None
+_NULL_SPAN = _NullSpan()
+
+
+@contextmanager
+def _null_span():
+    yield _NULL_SPAN
+
+
+def enable_tracing(service_name: str = "api-auto-tester") -> Tracer:
+    """Install a process-wide tracer and return it."""
+    global _tracer
+    _tracer = Tracer(service_name)
+    return _tracer
+
+
+def enable_metrics() -> MetricsRegistry:
+    """Install a process-wide metrics registry and return it."""
+    global _metrics
+    _metrics = MetricsRegistry()
+    return _metrics
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the active tracer, if tracing is enabled."""
+    return _tracer
+
+
+def get_metrics() -> Optional[MetricsRegistry]:
+    """Return the active metrics registry, if metrics are enabled."""
+    return _metrics
+
+
+def span(name: str, **attributes):
+    """Open a span on the active tracer (yields a no-op span when disabled)."""
+    if _tracer is None:
+        return _null_span()
+    return _tracer.span(name, **attributes)
+
+
+def record_request(method: str, route: str, status_code: Optional[int], duration: Optional[float]):
+    """Record an HTTP request; a missing status code counts as a transport error."""
+    if _metrics is None:
+        return
+    method = method.upper()
+    _metrics.requests.inc(method=method, route=route, status=status_code if status_code is not None else "error")
+    if duration is not None:
+        _metrics.request_duration.observe(duration, method=method, route=route)
+    if status_code is None:
+        _metrics.errors.inc(kind="transport", method=method, route=route)
+
+
+def record_result(method: str, route: str, status: str, validation_errors: int, latency_budget_exceeded: bool):
+    """Record the outcome of a validated test result."""
+    if _metrics is None:
+        return
+    method = method.upper()
+    _metrics.test_results.inc(status=status)
+    if validation_errors:
+        _metrics.errors.inc(validation_errors, kind="validation", method=method, route=route)
+    if latency_budget_exceeded:
+        _metrics.errors.inc(kind="latency_budget", method=method, route=route)
+
+
+def record_llm_call(model: str, outcome: str, prompt_tokens: int = 0, completion_tokens: int = 0):
+    """Record an LLM call and its token usage."""
+    if _metrics is None:
+        return
+    _metrics.llm_calls.inc(model=model, outcome=outcome)
+    if prompt_tokens:
+        _metrics.llm_tokens.inc(prompt_tokens, model=model, type="prompt")
+    if completion_tokens:
+        _metrics.llm_tokens.inc(completion_tokens, model=model, type="completion")
@@ -0,0 +1,114 @@
+"""
+Optional HTTP/2 transport for the executor, built on httpx.
+
+Requires ``pip install "httpx[http2]"``. Responses are converted to
+``requests.Response`` objects so the rest of the executor, the cassette and
+the validator behave exactly as on the default HTTP/1.1 path.
+"""
+
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class Http2Transport:
+    """Sends requests over multiplexed HTTP/2 connections and tracks connection reuse.
+
+    Over ``https`` the protocol is negotiated with ALPN and falls back to
+    HTTP/1.1 when the server does not offer h2. Cleartext ``http`` URLs have
+    no negotiation, so HTTP/2 is spoken with prior knowledge (h2c).
+    """
+
+    def __init__(self, timeout: float = 30, verify: bool = True, max_connections: int = 10):
+        try:
+            import httpx
+            import h2  # noqa: F401  (httpx needs it for http2=True)
+        except ImportError:
+            raise ImportError('HTTP/2 support requires httpx and h2: pip install "httpx[http2]"')
+
+        self._httpx = httpx
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        # One client per scheme: ALPN negotiation for TLS, prior knowledge for cleartext
+        self._clients = {
+            'https': httpx.Client(http2=True, timeout=timeout, verify=verify, limits=limits),
+            'http': httpx.Client(http1=False, http2=True, timeout=timeout, limits=limits)
+        }
+        self.stats = Counter()
+        self._lock = threading.Lock()
+
+    def _trace(self, event_name: str, info: Dict[str, Any]):
+        """httpcore trace hook: counts new connections, TLS handshakes and resumed sessions."""
+        if event_name == 'connection.connect_tcp.complete':
+            self._count('connections_opened')
+        elif event_name == 'connection.start_tls.complete':
+            self._count('tls_handshakes')
+            stream = info.get('return_value')
+            ssl_object = stream.get_extra_info('ssl_object') if stream is not None else None
+            if ssl_object is not None and ssl_object.session_reused:
+                self._count('tls_sessions_resumed')
+
+    def _count(self, name: str, value: int = 1):
+        with self._lock:
+            self.stats[name] += value
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                json: Any = None, timeout: Optional[float] = None) -> requests.Response:
+        """Send a request and return it as a ``requests.Response``."""
+        httpx = self._httpx
+        client = self._clients['https' if urlsplit(url).scheme == 'https' else 'http']
+        # Like the requests path, only methods with a body send one
+        if method.upper() not in ('POST', 'PUT', 'PATCH'):
+            json = None
+        request = client.build_request(
+            method.upper(), url, headers=headers, json=json,
+            timeout=timeout if timeout is not None else client.timeout,
+            extensions={'trace': self._trace}
+        )
+
+        start = time.perf_counter()
+        try:
+            response = client.send(request, stream=True)
+            # Headers have arrived; the body is read next
+            ttfb = time.perf_counter() - start
+            try:
+                content = response.read()
+            finally:
+                response.close()
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+
+        self._count('requests')
+        self._count(f'requests_{response.http_version.replace("/", "").lower()}')
+
+        converted = requests.Response()
+        converted.status_code = response.status_code
+        # httpx joins repeated headers with commas, as requests does
+        converted.headers = CaseInsensitiveDict(response.headers.items())
+        converted.url = str(response.url)
+        converted.reason = response.reason_phrase
+        converted.elapsed = timedelta(seconds=ttfb)
+        converted._content = content
+        converted.encoding = response.encoding
+        return converted
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """Return request and connection counts with the connection reuse ratio."""
+        with self._lock:
+            stats = dict(self.stats)
+        requests_sent = stats.get('requests', 0)
+        opened = stats.get('connections_opened', 0)
+        stats['reuse_ratio'] = (1 - opened / requests_sent) if requests_sent else 0.0
+        return stats
+
+    def close(self):
+        """Close all pooled connections."""
+        for client in self._clients.values():
+            client.close()
@@ -3,20 +3,94 @@ Response validator for API testing.
 """
 
 import json
+import yaml
+from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from jsonschema import validate, ValidationError, SchemaError, RefResolver
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from ..models.schemas import TestResult, TestStatus, Endpoint
+from . import profiling, telemetry
+from .canonical import stable_hash
+
+LATENCY_EXTENSION = 'x-max-latency-ms'
+LATENCY_BUDGET_ERROR = "Latency budget exceeded"
+
+# Compiled response schema validators kept per ResponseValidator (least recently used evicted)
+SCHEMA_CACHE_SIZE = 256
+
+
+def load_latency_budgets(file_path: str) -> Dict[str, Any]:
+    """Load latency budgets from a YAML or JSON config file.
+
+    The file holds an optional ``default`` budget and per-endpoint budgets
+    keyed by ``METHOD /path``, all in milliseconds::
+
+        default: 1000
+        endpoints:
+          GET /pet/{petId}: 200
+    """
+    file_path_obj = Path(file_path)
+    
+    if not file_path_obj.exists():
+        raise FileNotFoundError(f"Latency budget file not found: {file_path}")
+    
+    with open(file_path_obj, 'r', encoding='utf-8') as f:
+        if file_path_obj.suffix.lower() in ['.yaml', '.yml']:
+            config = yaml.safe_load(f) or {}
+        elif file_path_obj.suffix.lower() == '.json':
+            config = json.load(f)
+        else:
+            raise ValueError(f"Unsupported file format: {file_path_obj.suffix}")
+    
+    if not isinstance(config, dict):
+        raise ValueError(f"Latency budget file must contain a mapping: {file_path}")
+    endpoints = config.get('endpoints') or {}
+    if not isinstance(endpoints, dict):
+        raise ValueError(f"'endpoints' in {file_path} must map 'METHOD /path' to milliseconds")
+    
+    return {
+        'default': config.get('default'),
+        'endpoints': {key.strip(): value for key, value in endpoints.items()}
+    }
 
 
 class ResponseValidator:
     """Validates API responses against OpenAPI schemas."""
     
-    def __init__(self):
+    def __init__(self, latency_budgets: Optional[Dict[str, float]] = None,
+                 default_latency_ms: Optional[float] = None):
         self.validation_errors: List[str] = []
+        self.latency_budgets = latency_budgets or {}
+        self.default_latency_ms = default_latency_ms
+        # Compiled validators keyed by the content hashes of the spec and the
+        # schema, so equal schemas from deserialized test cases share one entry
+        self._schema_validators: OrderedDict = OrderedDict()
+        self._spec: Optional[Dict[str, Any]] = None
+        self._spec_hash: Optional[str] = None
     
     def validate_response(self, test_result: TestResult, api_spec: Dict[str, Any]) -> TestResult:
         """Validate a test result against the API specification."""
+        endpoint = test_result.test_case.endpoint
+        with telemetry.span("validate_response", **{
+            "http.method": endpoint.method.value.upper(),
+            "http.route": endpoint.path
+        }) as span, profiling.stage("validator.validate"):
+            test_result = self._validate_response(test_result, api_spec)
+            span.set_attribute("test.status", test_result.status.value)
+            span.set_attribute("validation.error_count", len(test_result.validation_errors))
+        
+        telemetry.record_result(
+            endpoint.method.value, endpoint.path, test_result.status.value,
+            len(test_result.validation_errors) - int(test_result.latency_budget_exceeded),
+            test_result.latency_budget_exceeded
+        )
+        return test_result
+    
+    def _validate_response(self, test_result: TestResult, api_spec: Dict[str, Any]) -> TestResult:
+        """Run schema, header and latency checks for a single result."""
         self.validation_errors = []
         
         if test_result.status == TestStatus.ERROR:
@@ -30,11 +104,15 @@ class ResponseValidator:
         
         if expected_schema:
             # Validate response body against schema
-            self._validate_response_body(test_result.response_body, expected_schema, api_spec)
+            with profiling.stage("validator.schema", path=endpoint.path):
+                self._validate_response_body(test_result.response_body, expected_schema, api_spec)
             
             # Validate response headers
             self._validate_response_headers(test_result.response_headers, endpoint, str(response_status), api_spec)
         
+        # Check the endpoint's latency budget
+        self._validate_latency_budget(test_result, api_spec)
+        
         # Update test result with validation errors
         if self.validation_errors:
             test_result.validation_errors = self.validation_errors.copy()
@@ -91,10 +169,11 @@ class ResponseValidator:
             return
         
         try:
-            # Create a proper RefResolver with the complete OpenAPI spec
-            # The api_spec should contain the full OpenAPI document including components/schemas
-            resolver = RefResolver.from_schema(api_spec)
-            validate(instance=response_body, schema=schema, resolver=resolver)
+            # Validate with a RefResolver over the complete OpenAPI spec so
+            # components/schemas references resolve; same error as validate()
+            error = best_match(self._schema_validator(schema, api_spec).iter_errors(response_body))
+            if error is not None:
+                raise error
         except ValidationError as e:
             self.validation_errors.append(f"Response body validation failed: {e.message}")
         except SchemaError as e:
@@ -111,6 +190,24 @@ class ResponseValidator:
             except Exception as e2:
                 self.validation_errors.append(f"Validation failed: {str(e2)}")
     
+    def _schema_validator(self, schema: Dict[str, Any], api_spec: Dict[str, Any]):
+        """Return a cached validator for schema, checking the schema only once."""
+        # The spec is hashed once per spec object, the (small) schema on every call
+        if api_spec is not self._spec:
+            self._spec, self._spec_hash = api_spec, stable_hash(api_spec)
+        key = (self._spec_hash, stable_hash(schema))
+        validator = self._schema_validators.get(key)
+        if validator is not None:
+            self._schema_validators.move_to_end(key)
+            return validator
+        
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        validator = self._schema_validators[key] = cls(schema, resolver=RefResolver.from_schema(api_spec))
+        if len(self._schema_validators) > SCHEMA_CACHE_SIZE:
+            self._schema_validators.popitem(last=False)
+        return validator
+    
     def _validate_response_headers(self, response_headers: Optional[Dict[str, str]], 
                                  endpoint: Endpoint, status_code: str, api_spec: Dict[str, Any]):
         """Validate response headers."""
@@ -153,6 +250,39 @@ class ResponseValidator:
         """Validate if the response time is within acceptable limits."""
         return response_time <= max_time
     
+    def get_latency_budget(self, endpoint: Endpoint, api_spec: Dict[str, Any]) -> Optional[float]:
+        """Get the latency budget in milliseconds for an endpoint.
+
+        Budgets from the config file take precedence over the spec: an
+        explicit per-endpoint entry, then the operation's x-max-latency-ms,
+        then the configured default, then a spec-wide x-max-latency-ms.
+        """
+        key = f"{endpoint.method.value.upper()} {endpoint.path}"
+        if key in self.latency_budgets:
+            return float(self.latency_budgets[key])
+        if LATENCY_EXTENSION in endpoint.extensions:
+            return float(endpoint.extensions[LATENCY_EXTENSION])
+        if self.default_latency_ms is not None:
+            return float(self.default_latency_ms)
+        if api_spec and LATENCY_EXTENSION in api_spec:
+            return float(api_spec[LATENCY_EXTENSION])
+        return None
+    
+    def _validate_latency_budget(self, test_result: TestResult, api_spec: Dict[str, Any]):
+        """Fail the test if its response time exceeds the endpoint's budget."""
+        budget_ms = self.get_latency_budget(test_result.test_case.endpoint, api_spec)
+        if budget_ms is None or test_result.execution_time is None:
+            return
+        
+        test_result.latency_budget_ms = budget_ms
+        latency_ms = test_result.execution_time * 1000
+        if not self.validate_response_time(latency_ms, budget_ms):
+            test_result.latency_budget_exceeded = True
+            test_result.status = TestStatus.FAILED
+            self.validation_errors.append(
+                f"{LATENCY_BUDGET_ERROR}: {latency_ms:.1f}ms > {budget_ms:g}ms"
+            )
+    
     def get_validation_summary(self, test_results: List[TestResult]) -> Dict[str, Any]:
         """Get a summary of validation results."""
         total_tests = len(test_results)
@@ -164,9 +294,12 @@ class ResponseValidator:
                 validation_errors += 1
                 schema_validation_failures += len(result.validation_errors)
         
+        latency_budget_failures = len([r for r in test_results if r.latency_budget_exceeded])
+        
         return {
             'total_tests': total_tests,
             'tests_with_validation_errors': validation_errors,
             'total_validation_errors': schema_validation_failures,
+            'latency_budget_failures': latency_budget_failures,
             'validation_success_rate': ((total_tests - validation_errors) / total_tests * 100) if total_tests > 0 else 0
         } 
\ No newline at end of file
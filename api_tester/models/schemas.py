@@ -68,6 +68,7 @@ class Endpoint(BaseModel):
     responses: Dict[str, Dict[str, Any]] = {}
     tags: List[str] = []
     operation_id: Optional[str] = None
+    extensions: Dict[str, Any] = {}  # x-* vendor extensions, e.g. x-max-latency-ms
 
 
 class APISpec(BaseModel):
@@ -101,8 +102,12 @@ class TestResult(BaseModel):
     response_body: Optional[Any] = None
     response_headers: Optional[Dict[str, str]] = None
     execution_time: Optional[float] = None
+    timings: Dict[str, float] = {}  # ttfb, transfer, total (seconds)
     error_message: Optional[str] = None
     validation_errors: List[str] = []
+    latency_budget_ms: Optional[float] = None
+    latency_budget_exceeded: bool = False
+    deduplicated: bool = False  # response shared with an identical request sent earlier
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
@@ -135,9 +140,15 @@ class TestReport(BaseModel):
         """Number of tests that encountered errors."""
         return len([r for r in self.test_results if r.status == TestStatus.ERROR])
 
+    @property
+    def skipped_tests(self) -> int:
+        """Number of tests that were not run (e.g. after an early stop)."""
+        return len([r for r in self.test_results if r.status == TestStatus.SKIPPED])
+
     @property
     def success_rate(self) -> float:
-        """Success rate as a percentage."""
-        if self.total_tests == 0:
+        """Success rate as a percentage of the tests that ran; skipped tests are left out."""
+        run_tests = self.total_tests - self.skipped_tests
+        if run_tests == 0:
             return 0.0
-        return (self.passed_tests / self.total_tests) * 100 
\ No newline at end of file
+        return (self.passed_tests / run_tests) * 100 
\ No newline at end of file
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the parser, executor, validator and reporter.
+
+Usage:
+    python -m benchmarks.run --sizes 10,1000,10000 --output bench_results.json
+    python -m benchmarks.run --baseline bench_baseline.json
+    python -m benchmarks.run --sizes '' --startup-target 0.25
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+import click
+import yaml
+
+from api_tester import OpenAPIParser, TestExecutor, ResponseValidator, TestReporter
+from api_tester.core.mock_server import MockServer
+from api_tester.models.schemas import TestReport
+
+from .synthetic import build_spec, build_test_cases, build_test_results
+
+CLI_PATH = Path(__file__).resolve().parent.parent / 'cli.py'
+
+# Scripts call the CLI thousands of times, so plain invocations must stay fast
+STARTUP_TARGET_SECONDS = 0.25
+
+STARTUP_COMMANDS = {
+    'cli.startup[--help]': ['--help'],
+    'cli.startup[test --help]': ['test', '--help'],
+    'cli.startup[discover --help]': ['discover', '--help'],
+}
+
+
+def measure(func: Callable[[], Any], repeat: int, operations: int = 1) -> Dict[str, float]:
+    """Time ``func`` ``repeat`` times and summarize the wall-clock samples."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    median = statistics.median(samples)
+    return {
+        'min': min(samples),
+        'median': median,
+        'max': max(samples),
+        'operations': operations,
+        'ops_per_sec': operations / median if median > 0 else 0.0
+    }
+
+
+def run_size(size: int, workdir: Path, repeat: int, requests_per_run: int, validate_limit: int) -> Dict[str, Dict[str, float]]:
+    """Run every benchmark against a synthetic spec with ``size`` endpoints."""
+    results: Dict[str, Dict[str, float]] = {}
+    spec_data = build_spec(size)
+
+    yaml_path = workdir / f'spec_{size}.yaml'
+    json_path = workdir / f'spec_{size}.json'
+    with open(yaml_path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(spec_data, f, sort_keys=False)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(spec_data, f)
+
+    results['parser.parse_file[yaml]'] = measure(lambda: OpenAPIParser().parse_file(str(yaml_path)), repeat, size)
+    results['parser.parse_file[json]'] = measure(lambda: OpenAPIParser().parse_file(str(json_path)), repeat, size)
+
+    parser = OpenAPIParser()
+    api_spec = parser.parse_file(str(json_path))
+    test_cases = build_test_cases(api_spec, spec_data)
+
+    # Without dedupe every case is sent, so mock throughput counts real requests
+    executor = TestExecutor(base_url='http://127.0.0.1:8000', request_delay=0, dedupe=False)
+    results['executor._build_request'] = measure(
+        lambda: [executor._build_request(test_case) for test_case in test_cases], repeat, len(test_cases)
+    )
+
+    test_results = build_test_results(test_cases, spec_data)
+    validator = ResponseValidator()
+    sample = test_results[:validate_limit]
+    results['validator.validate_response'] = measure(
+        lambda: [validator.validate_response(result, spec_data) for result in sample], repeat, len(sample)
+    )
+
+    report = TestReport(api_spec=api_spec, test_results=test_results, execution_time=1.0)
+    reporter = TestReporter(output_dir=str(workdir / 'reports'))
+    for report_format in ('html', 'json', 'markdown', 'jsonl', 'csv'):
+        results[f'reporter.{report_format}'] = measure(
+            lambda: reporter.generate_report(report, report_format), repeat, len(test_results)
+        )
+
+    server = MockServer(spec_data, api_spec.endpoints, port=0, seed=0)
+    executor.set_base_url(server.start_in_thread())
+    try:
+        cases = [test_cases[i % len(test_cases)] for i in range(requests_per_run)]
+        results['executor.execute_test_cases[mock]'] = measure(
+            lambda: executor.execute_test_cases(cases), repeat, len(cases)
+        )
+    finally:
+        server.stop()
+
+    return results
+
+
+def run_startup(repeat: int) -> Dict[str, Dict[str, float]]:
+    """Time fresh interpreter runs of the CLI, imports included."""
+    results: Dict[str, Dict[str, float]] = {}
+    for name, args in STARTUP_COMMANDS.items():
+        command = [sys.executable, str(CLI_PATH), *args]
+        results[name] = measure(
+            lambda: subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True), repeat
+        )
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Compare per-operation median timings against a baseline.
+
+    Ratios above ``1 + threshold`` are flagged as regressions.
+    """
+    rows = []
+    for size, benchmarks in current['results'].items():
+        for name, stats in benchmarks.items():
+            base = baseline.get('results', {}).get(size, {}).get(name)
+            if not base or not base.get('median'):
+                continue
+            ratio = (stats['median'] / stats['operations']) / (base['median'] / base['operations'])
+            rows.append({
+                'size': size,
+                'benchmark': name,
+                'baseline': base['median'],
+                'current': stats['median'],
+                'ratio': ratio,
+                'regression': ratio > 1 + threshold
+            })
+    return rows
+
+
+@click.command()
+@click.option('--sizes', default='10,1000,10000', help='Comma-separated endpoint counts for synthetic specs')
+@click.option('--repeat', default=3, type=int, help='Samples per benchmark (the median is reported)')
+@click.option('--requests', 'requests_per_run', default=200, type=int, help='Requests sent to the mock server per sample')
+@click.option('--validate-limit', default=2000, type=int, help='Maximum results validated per sample')
+@click.option('--output', '-o', default='bench_results.json', help='File to write machine-readable results to')
+@click.option('--baseline', '-b', type=click.Path(exists=True), help='Baseline results file to compare against')
+@click.option('--threshold', default=0.10, type=float, help='Allowed slowdown versus the baseline (0.10 = 10%)')
+@click.option('--startup-target', default=STARTUP_TARGET_SECONDS, show_default=True, type=float,
+              help='Maximum median seconds for `cli.py --help`, imports included')
+def main(sizes, repeat, requests_per_run, validate_limit, output, baseline, threshold, startup_target):
+    """Benchmark the API Auto-Tester pipeline on synthetic specs."""
+    current: Dict[str, Any] = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'repeat': repeat
+        },
+        'results': {}
+    }
+
+    click.echo("⏱️  Benchmarking CLI startup...")
+    current['results']['startup'] = run_startup(max(repeat, 5))
+    for name, stats in current['results']['startup'].items():
+        click.echo(f"   {name:<40} {stats['median'] * 1000:10.2f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in [int(s) for s in sizes.split(',') if s.strip()]:
+            click.echo(f"⏱️  Benchmarking {size} endpoints...")
+            current['results'][str(size)] = run_size(size, Path(tmp), repeat, requests_per_run, validate_limit)
+            for name, stats in current['results'][str(size)].items():
+                click.echo(f"   {name:<40} {stats['median'] * 1000:10.2f} ms  {stats['ops_per_sec']:12.1f} ops/s")
+
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(current, f, indent=2)
+    click.echo(f"✅ Results written to {output}")
+
+    if baseline:
+        with open(baseline, 'r', encoding='utf-8') as f:
+            baseline_data = json.load(f)
+        rows = compare(current, baseline_data, threshold)
+        regressions = [row for row in rows if row['regression']]
+        click.echo(f"\n📊 Comparison with {baseline}:")
+        for row in rows:
+            marker = "❌" if row['regression'] else "✅"
+            click.echo(f"   {marker} [{row['size']}] {row['benchmark']:<40} {row['ratio']:.2f}x")
+        if regressions:
+            click.echo(f"\n❌ {len(regressions)} benchmark(s) regressed by more than {threshold:.0%}", err=True)
+            sys.exit(1)
+
+    startup = current['results']['startup']['cli.startup[--help]']['median']
+    if startup > startup_target:
+        click.echo(f"\n❌ CLI startup took {startup * 1000:.0f} ms, above the {startup_target * 1000:.0f} ms target", err=True)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Synthetic OpenAPI specs and test cases for benchmarking.
+"""
+
+from typing import Dict, List, Any
+
+from api_tester.models.schemas import APISpec, TestCase, TestResult, TestStatus
+from api_tester.core.schema_utils import SchemaSampler, json_media_schema
+
+
+def build_spec(num_endpoints: int, ref_depth: int = 4, ref_fanout: int = 3) -> Dict[str, Any]:
+    """Build an OpenAPI document with ``num_endpoints`` operations.
+
+    Every resource gets a collection and an item path. Resource schemas
+    reference a shared tree of component schemas ``ref_depth`` levels deep
+    with ``ref_fanout`` references per level, so $ref resolution cost grows
+    with the graph rather than with the number of operations alone.
+    """
+    schemas: Dict[str, Any] = {}
+    for level in range(ref_depth, 0, -1):
+        for index in range(ref_fanout):
+            properties: Dict[str, Any] = {
+                'id': {'type': 'integer', 'minimum': 1},
+                'label': {'type': 'string', 'maxLength': 32}
+            }
+            if level < ref_depth:
+                for child in range(ref_fanout):
+                    properties[f'child{child}'] = {'$ref': f'#/components/schemas/Node{level + 1}_{child}'}
+            schemas[f'Node{level}_{index}'] = {
+                'type': 'object',
+                'required': ['id'],
+                'properties': properties
+            }
+
+    paths: Dict[str, Any] = {}
+    operations = 0
+    resource = 0
+    while operations < num_endpoints:
+        name = f'Resource{resource}'
+        schemas[name] = {
+            'type': 'object',
+            'required': ['id', 'name'],
+            'properties': {
+                'id': {'type': 'integer', 'minimum': 1},
+                'name': {'type': 'string', 'minLength': 1, 'maxLength': 64},
+                'status': {'type': 'string', 'enum': ['active', 'inactive']},
+                'node': {'$ref': f'#/components/schemas/Node1_{resource % ref_fanout}'}
+            }
+        }
+        ref = {'$ref': f'#/components/schemas/{name}'}
+        collection = f'/resources{resource}'
+        item = f'/resources{resource}/{{resourceId}}'
+        candidates = [
+            (collection, 'get', {
+                'parameters': [
+                    {'name': 'limit', 'in': 'query', 'schema': {'type': 'integer', 'minimum': 1, 'maximum': 100}},
+                    {'name': 'status', 'in': 'query', 'schema': {'type': 'string', 'enum': ['active', 'inactive']}}
+                ],
+                'responses': {'200': {'description': 'List', 'content': {'application/json': {'schema': {'type': 'array', 'items': ref}}}}}
+            }),
+            (collection, 'post', {
+                'requestBody': {'required': True, 'content': {'application/json': {'schema': ref}}},
+                'responses': {'201': {'description': 'Created', 'content': {'application/json': {'schema': ref}}}}
+            }),
+            (item, 'get', {
+                'parameters': [{'name': 'resourceId', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}}],
+                'responses': {'200': {'description': 'Item', 'content': {'application/json': {'schema': ref}}}}
+            }),
+            (item, 'delete', {
+                'parameters': [{'name': 'resourceId', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}}],
+                'responses': {'204': {'description': 'Deleted'}}
+            })
+        ]
+        for path, method, operation in candidates:
+            if operations >= num_endpoints:
+                break
+            paths.setdefault(path, {})[method] = {'summary': f'{method.upper()} {path}', **operation}
+            operations += 1
+        resource += 1
+
+    return {
+        'openapi': '3.0.0',
+        'info': {'title': f'Synthetic API ({num_endpoints} endpoints)', 'version': '1.0.0'},
+        'servers': [{'url': 'http://127.0.0.1:8000'}],
+        'paths': paths,
+        'components': {'schemas': schemas}
+    }
+
+
+def build_test_cases(api_spec: APISpec, spec_data: Dict[str, Any], seed: int = 0) -> List[TestCase]:
+    """Build one schema-valid test case per endpoint without calling the LLM."""
+    sampler = SchemaSampler(spec_data, seed=seed)
+    test_cases = []
+    for endpoint in api_spec.endpoints:
+        input_data: Dict[str, Any] = {'query_params': {}, 'path_params': {}, 'headers': {}, 'body': {}}
+        for param in endpoint.parameters:
+            value = sampler.sample(param.param_schema or {'type': 'string'})
+            if param.location.value == 'query':
+                input_data['query_params'][param.name] = value
+            elif param.location.value == 'path':
+                input_data['path_params'][param.name] = value
+            elif param.location.value == 'header':
+                input_data['headers'][param.name] = value
+        if endpoint.request_body:
+            schema = json_media_schema(endpoint.request_body.get('content', {}))
+            input_data['body'] = sampler.sample(schema) if schema else {}
+        test_cases.append(TestCase(
+            endpoint=endpoint,
+            name="Benchmark Test Case",
+            description=f"Synthetic case for {endpoint.method.value.upper()} {endpoint.path}",
+            input_data=input_data,
+            expected_status=200,
+            test_type="valid",
+            tags=["valid", "benchmark"]
+        ))
+    return test_cases
+
+
+def build_test_results(test_cases: List[TestCase], spec_data: Dict[str, Any], seed: int = 0) -> List[TestResult]:
+    """Build passed results whose bodies conform to each endpoint's success schema."""
+    sampler = SchemaSampler(spec_data, seed=seed)
+    results = []
+    for index, test_case in enumerate(test_cases):
+        responses = test_case.endpoint.responses
+        status = next((code for code in sorted(responses) if code.startswith('2')), '200')
+        schema = json_media_schema(responses.get(status, {}).get('content', {}))
+        results.append(TestResult(
+            test_case=test_case,
+            status=TestStatus.PASSED,
+            response_status=int(status),
+            response_body=sampler.sample(schema) if schema else None,
+            response_headers={'content-type': 'application/json'},
+            execution_time=0.001 + (index % 97) / 1000,
+            timings={'ttfb': 0.001, 'transfer': 0.0005, 'total': 0.0015}
+        ))
+    return results
@@ -5,29 +5,180 @@ Command-line interface for AI-Powered API Auto-Tester.
 
 import click
 import time
-import yaml
 import json
 from pathlib import Path
 
-from api_tester import OpenAPIParser, TestCaseGenerator, TestExecutor, ResponseValidator, TestReporter
-from api_tester.models.schemas import TestReport
+# Commands import what they use from api_tester inside their bodies, so that
+# --help and light commands do not pay for openai, jsonschema, jinja2 and
+# requests. `python -m benchmarks.run` checks the startup time.
+
+# Same as api_tester.core.checkpoint.DEFAULT_RUNS_DIR (not imported, see above)
+DEFAULT_RUNS_DIR = ".runs"
 
 
 @click.group()
-def cli():
+@click.option('--profile', 'profile_path', type=click.Path(), help='Write per-stage timers and counters to a JSON trace file')
+@click.option('--cprofile', 'cprofile_path', type=click.Path(), help='Write a cProfile dump of the whole run (view with snakeviz or pstats)')
+@click.option('--trace-file', type=click.Path(), help='Export spans to an OTLP/JSON file')
+@click.option('--metrics-port', type=int, help='Serve Prometheus metrics on http://127.0.0.1:<port>/metrics during the run')
+@click.option('--metrics-file', type=click.Path(), help='Write Prometheus metrics to a text file when the run ends')
+@click.pass_context
+def cli(ctx, profile_path, cprofile_path, trace_file, metrics_port, metrics_file):
     """AI-Powered API Auto-Tester CLI"""
-    pass
+    if trace_file:
+        from api_tester.core.telemetry import enable_tracing
+        
+        tracer = enable_tracing()
+        
+        def export_spans():
+            tracer.export_otlp(trace_file)
+            click.echo(f"🛰️  {len(tracer.spans)} spans exported to {trace_file}", err=True)
+        
+        ctx.call_on_close(export_spans)
+    
+    if metrics_port is not None or metrics_file:
+        from api_tester.core.telemetry import enable_metrics
+        
+        registry = enable_metrics()
+        if metrics_port is not None:
+            click.echo(f"📈 Serving metrics at {registry.serve(metrics_port)}", err=True)
+            ctx.call_on_close(registry.shutdown)
+        if metrics_file:
+            ctx.call_on_close(lambda: registry.write_prometheus(metrics_file))
+    
+    if profile_path:
+        from api_tester.core.profiling import enable_profiling
+        
+        profiler = enable_profiling()
+        
+        def write_trace():
+            profiler.write_trace(profile_path)
+            click.echo(f"⏱️  Profile trace written to {profile_path}", err=True)
+        
+        ctx.call_on_close(write_trace)
+    
+    if cprofile_path:
+        import cProfile
+        
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+        
+        def write_cprofile():
+            cprofiler.disable()
+            cprofiler.dump_stats(cprofile_path)
+            click.echo(f"⏱️  cProfile dump written to {cprofile_path}", err=True)
+        
+        ctx.call_on_close(write_cprofile)
+
+
+def set_base_url(api_spec, base_url):
+    """Override the spec's base URL with --base-url, validated as the HttpUrl field it is."""
+    from pydantic import HttpUrl, TypeAdapter, ValidationError
+    
+    try:
+        api_spec.base_url = TypeAdapter(HttpUrl).validate_python(base_url)
+    except ValidationError as e:
+        raise click.BadParameter(f"{base_url!r} is not a valid URL: {e.errors()[0]['msg']}", param_hint="'--base-url'")
+
+
+def echo_llm_usage(usage):
+    """Print LLM token, time and cost totals, and whether the budget ran out."""
+    summary = usage.summary(include_calls=False)
+    if not summary['calls'] and not summary['skipped_by_budget']:
+        return
+    cost = f"${summary['cost_usd']:.4f}" if summary['cost_usd'] is not None else "unknown cost"
+    click.echo(f"   LLM: {summary['calls']} calls, {summary['prompt_tokens']} prompt + "
+               f"{summary['completion_tokens']} completion tokens, {summary['llm_seconds']:.1f}s, {cost}")
+    if summary['budget']['exhausted']:
+        click.echo(f"   ⚠️  LLM budget exhausted ({summary['budget']['exhausted']}): "
+                   f"{summary['skipped_by_budget']} test cases used the offline fallback")
+
+
+def stopped_early_metadata(runner, results):
+    """Describe an early stop for the report metadata: the limit, and what was not run."""
+    from api_tester.core.metrics import endpoint_key
+    
+    return {
+        'max_failures': runner.max_failures,
+        'failures': runner.failures,
+        'test_cases_not_run': len([r for r in results if r.status.value == 'skipped']),
+        # Never generated, so their test cases cannot be counted
+        'endpoints_not_run': [endpoint_key(endpoint) for endpoint in runner.not_run]
+    }
+
+
+def echo_stopped_early(runner, results):
+    """Print why the run stopped before executing every test case."""
+    if not runner.stopped:
+        return
+    skipped = len([r for r in results if r.status.value == 'skipped'])
+    not_run = [f"{skipped} test cases"] if skipped else []
+    if runner.not_run:
+        not_run.append(f"{len(runner.not_run)} endpoints (test cases not generated)")
+    click.echo(f"   🛑 Stopped early after {runner.failures} failures (limit {runner.max_failures})"
+               + (f"; not run: {', '.join(not_run)}" if not_run else ""))
 
 
 @cli.command()
 @click.option('--spec', '-s', required=True, help='Path to OpenAPI specification file (JSON/YAML)')
 @click.option('--base-url', '-u', help='Base URL for API requests')
 @click.option('--model', '-m', default='gpt-3.5-turbo', help='OpenAI model to use')
-@click.option('--output', '-o', default='html', help='Report format (html, json, markdown)')
-def test(spec, base_url, model, output):
+@click.option('--output', '-o', default='html', help='Report format (html, json, markdown, jsonl, csv, parquet)')
+@click.option('--compress', type=click.Choice(['gzip', 'zstd']), help='Compress json, jsonl and csv reports (zstd requires zstandard)')
+@click.option('--latency-budgets', type=click.Path(exists=True), help='YAML/JSON file with per-endpoint latency budgets (ms)')
+@click.option('--max-latency-ms', type=float, help='Default latency budget in milliseconds')
+@click.option('--record', 'record_path', type=click.Path(), help='Record all HTTP traffic to a cassette file')
+@click.option('--replay', 'replay_path', type=click.Path(exists=True), help='Replay HTTP traffic from a cassette file instead of the network')
+@click.option('--shard', help='Run only shard i of N (e.g. 2/4); endpoints are split by a hash of method and path')
+@click.option('--resume', 'resume_id', help='Resume an interrupted run, skipping already generated cases and completed results')
+@click.option('--runs-dir', default=DEFAULT_RUNS_DIR, show_default=True, help='Directory where run checkpoints are stored')
+@click.option('--changed-only', is_flag=True, help='Only regenerate and run endpoints changed since the last completed run of this spec')
+@click.option('--no-dedupe', is_flag=True, help='Send every test case even if an identical request was already sent')
+@click.option('--dedupe-unsafe', is_flag=True, help='Also send identical POST, PUT, PATCH and DELETE requests only once')
+@click.option('--http2', is_flag=True, help='Send requests over multiplexed HTTP/2 connections (requires httpx[http2])')
+@click.option('--chain', is_flag=True, help='Run producers before consumers and feed IDs from responses into path parameters')
+@click.option('--parallel', default=4, show_default=True, type=int, help='Independent chains run concurrently (with --chain)')
+@click.option('--max-prompt-tokens', default=1500, show_default=True, type=int, help='Token budget per generation prompt; nested schemas are collapsed to fit')
+@click.option('--llm-max-tokens', type=int, help='Stop calling the LLM after this many tokens and use the offline fallback')
+@click.option('--llm-max-cost', type=float, help='Stop calling the LLM once the estimated cost reaches this many USD')
+@click.option('--llm-max-seconds', type=float, help='Stop calling the LLM after this many seconds spent waiting on it')
+@click.option('--prioritize', is_flag=True, help='Run recently failing, flaky and slow tests first, based on earlier runs of this spec')
+@click.option('--fail-fast', is_flag=True, help='Stop the run at the first failed or errored test')
+@click.option('--max-failures', type=click.IntRange(min=1), help='Stop the run after this many failed or errored tests')
+def test(spec, base_url, model, output, latency_budgets, max_latency_ms, record_path, replay_path, shard, resume_id, runs_dir, changed_only, no_dedupe, dedupe_unsafe, http2, chain, parallel, max_prompt_tokens,
+         llm_max_tokens, llm_max_cost, llm_max_seconds, prioritize, fail_fast, max_failures, compress):
     """Run API tests using OpenAPI specification."""
     
+    from api_tester.core.sharding import parse_shard
+    
+    if record_path and replay_path:
+        raise click.UsageError("--record and --replay cannot be used together")
     try:
+        shard_index, shard_total = parse_shard(shard) if shard else (None, None)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--shard')
+    
+    cassette = None
+    checkpoint = None
+    executor = None
+    previous = None
+    previous_elapsed = 0.0
+    try:
+        import yaml
+        from api_tester import OpenAPIParser, TestCaseGenerator, TestExecutor, ResponseValidator, TestReporter
+        from api_tester.models.schemas import TestReport
+        from api_tester.core.validator import load_latency_budgets
+        from api_tester.core.cassette import Cassette
+        from api_tester.core.sharding import select_shard
+        from api_tester.core.checkpoint import RunCheckpoint
+        from api_tester.core.runner import TestRunner
+        from api_tester.core.scheduler import Scheduler, TestHistory
+        from api_tester.core.fingerprint import fingerprint_endpoints, diff_fingerprints
+        from api_tester.core.metrics import endpoint_key
+        from api_tester.core.llm_usage import UsageTracker
+        
+        run_start = time.perf_counter()
+        
         # Load the complete OpenAPI spec for validation
         spec_path = Path(spec)
         with open(spec_path, 'r', encoding='utf-8') as f:
@@ -44,60 +195,110 @@ def test(spec, base_url, model, output):
         api_spec = parser.parse_file(spec)
         click.echo(f"✅ Found {len(api_spec.endpoints)} endpoints")
         
+        endpoints = api_spec.endpoints
+        if shard:
+            endpoints = select_shard(endpoints, shard_index, shard_total)
+            click.echo(f"🧩 Shard {shard}: {len(endpoints)} endpoints")
+        
         # Set base URL
         if base_url:
-            api_spec.base_url = base_url
+            set_base_url(api_spec, base_url)
         elif api_spec.base_url:
             base_url = str(api_spec.base_url)
         else:
             base_url = click.prompt("Enter base URL for API requests")
         
         # Initialize components
-        generator = TestCaseGenerator(model=model)
-        executor = TestExecutor(base_url=base_url)
+        if record_path:
+            cassette = Cassette(record_path, mode="record")
+            click.echo(f"📼 Recording HTTP traffic to {record_path}")
+        elif replay_path:
+            cassette = Cassette(replay_path, mode="replay")
+            click.echo(f"📼 Replaying {cassette.entry_count} recorded responses from {replay_path}")
+        
+        if resume_id:
+            checkpoint = RunCheckpoint.resume(resume_id, runs_dir)
+            click.echo(f"♻️  Resuming run {checkpoint.run_id} ({checkpoint.completed_results} results checkpointed)")
+            if checkpoint.metadata.get('spec') not in (None, str(spec_path)):
+                click.echo(f"⚠️  Run {resume_id} was started with spec {checkpoint.metadata['spec']}", err=True)
+        else:
+            checkpoint = RunCheckpoint(directory=runs_dir)
+            click.echo(f"🆔 Run ID: {checkpoint.run_id} (resume with --resume {checkpoint.run_id})")
+        previous_elapsed = checkpoint.metadata.get('elapsed', 0.0)
+        
+        fingerprints = fingerprint_endpoints(endpoints, complete_api_spec)
+        if changed_only:
+            previous = RunCheckpoint.find_previous(runs_dir, spec=str(spec_path), exclude=checkpoint.run_id)
+            if previous is None:
+                click.echo("⚠️  No previous completed run of this spec found, testing all endpoints")
+            else:
+                diff = diff_fingerprints(previous.metadata['fingerprints'], fingerprints)
+                click.echo(f"🔎 Since run {previous.run_id}: {len(diff['changed'])} changed, "
+                           f"{len(diff['added'])} new, {len(diff['removed'])} removed, {len(diff['unchanged'])} unchanged endpoints")
+                unchanged = set(diff['unchanged'])
+                carried = 0
+                for endpoint in endpoints:
+                    if endpoint_key(endpoint) in unchanged and checkpoint.get_test_cases(endpoint) is None:
+                        carried += checkpoint.copy_endpoint(previous, endpoint)
+                click.echo(f"⏭️  Carrying forward results for {carried} unchanged endpoints")
+        checkpoint.update_metadata(spec=str(spec_path), base_url=base_url, shard=shard, status='running',
+                                   fingerprints=fingerprints)
+        
+        usage = UsageTracker(model, max_tokens=llm_max_tokens, max_cost=llm_max_cost, max_seconds=llm_max_seconds)
+        generator = TestCaseGenerator(model=model, spec_data=parser.spec_data, max_prompt_tokens=max_prompt_tokens, usage=usage)
+        if generator.is_offline:
+            click.echo("⚠️  OPENAI_API_KEY is not set, test cases come from the offline fallback generator")
+        executor = TestExecutor(base_url=base_url, cassette=cassette, dedupe=not no_dedupe, http2=http2,
+                                dedupe_unsafe=dedupe_unsafe)
         executor.set_api_key("special-key", header_name="api_key")
-        validator = ResponseValidator()
+        budgets = load_latency_budgets(latency_budgets) if latency_budgets else {'default': None, 'endpoints': {}}
+        validator = ResponseValidator(
+            latency_budgets=budgets['endpoints'],
+            default_latency_ms=max_latency_ms if max_latency_ms is not None else budgets['default']
+        )
         reporter = TestReporter()
         
-        all_test_cases = []
-        all_test_results = []
+        scheduler = None
+        if prioritize:
+            history = TestHistory.load(runs_dir, spec=str(spec_path), exclude=checkpoint.run_id)
+            scheduler = Scheduler(history)
+            click.echo(f"🎯 Prioritizing tests using {len(history)} earlier runs")
         
-        # Generate and execute tests for each endpoint
-        for endpoint in api_spec.endpoints:
-            click.echo(f"\n🧠 Generating test cases for {endpoint.method.value.upper()} {endpoint.path}...")
-            
-            # Generate test cases
-            test_cases = generator.generate_test_cases(endpoint)
-            all_test_cases.extend(test_cases)
-            click.echo(f"✅ Generated {len(test_cases)} test cases")
-            
-            # Execute test cases
-            click.echo("🚀 Executing test cases...")
-            test_results = executor.execute_test_cases(test_cases)
-            
-            # Validate responses
-            click.echo("🔍 Validating responses...")
-            for result in test_results:
-                # Pass the complete OpenAPI spec for proper schema resolution
-                validated_result = validator.validate_response(result, complete_api_spec)
-                all_test_results.append(validated_result)
-            
-            # Show progress
-            passed = len([r for r in test_results if r.status.value == 'passed'])
-            failed = len([r for r in test_results if r.status.value == 'failed'])
-            errors = len([r for r in test_results if r.status.value == 'error'])
-            click.echo(f"📊 Results: {passed} passed, {failed} failed, {errors} errors")
+        # Generate, execute and validate tests for each endpoint
+        runner = TestRunner(
+            generator, executor, validator, complete_api_spec,
+            checkpoint=checkpoint, cassette=cassette, progress=click.echo,
+            chain=chain, parallel=parallel, scheduler=scheduler,
+            max_failures=max_failures or (1 if fail_fast else None)
+        )
+        all_test_results = runner.run(endpoints)
+        elapsed = previous_elapsed + time.perf_counter() - run_start
+        # A stopped run is not a complete baseline for --changed-only, but can be resumed
+        checkpoint.update_metadata(status='stopped' if runner.stopped else 'completed', elapsed=elapsed)
         
         # Generate report
         click.echo("\n📝 Generating test report...")
-        start_time = time.time()
         test_report = TestReport(
             api_spec=api_spec,
             test_results=all_test_results,
-            execution_time=time.time() - start_time
+            execution_time=elapsed,
+            metadata={'run_id': checkpoint.run_id}
         )
+        if changed_only and previous is not None:
+            test_report.metadata['changed_since'] = previous.run_id
+        connection_stats = executor.connection_stats()
+        if connection_stats:
+            test_report.metadata['connections'] = connection_stats
+        test_report.metadata['llm_usage'] = usage.summary()
+        if runner.stopped:
+            test_report.metadata['stopped_early'] = stopped_early_metadata(runner, all_test_results)
+        
+        report_name = None
+        if shard:
+            test_report.metadata['shard'] = shard
+            report_name = f"test_report_{time.strftime('%Y%m%d_%H%M%S')}_shard{shard_index}of{shard_total}"
         
-        report_path = reporter.generate_report(test_report, output)
+        report_path = reporter.generate_report(test_report, output, name=report_name, compression=compress)
         click.echo(f"✅ Report generated: {report_path}")
         
         # Show summary
@@ -106,6 +307,188 @@ def test(spec, base_url, model, output):
         click.echo(f"   Passed: {test_report.passed_tests}")
         click.echo(f"   Failed: {test_report.failed_tests}")
         click.echo(f"   Errors: {test_report.error_tests}")
+        if test_report.skipped_tests:
+            click.echo(f"   Skipped: {test_report.skipped_tests}")
+        click.echo(f"   Success Rate: {test_report.success_rate:.1f}%")
+        budget_failures = len([r for r in all_test_results if r.latency_budget_exceeded])
+        if budget_failures:
+            click.echo(f"   Latency Budget Failures: {budget_failures}")
+        echo_stopped_early(runner, all_test_results)
+        echo_llm_usage(usage)
+        if connection_stats:
+            click.echo(f"   Connections: {connection_stats.get('connections_opened', 0)} opened for "
+                       f"{connection_stats.get('requests', 0)} requests (reuse {connection_stats['reuse_ratio']:.0%}, "
+                       f"HTTP/2: {connection_stats.get('requests_http2', 0)}, "
+                       f"TLS resumed: {connection_stats.get('tls_sessions_resumed', 0)}/{connection_stats.get('tls_handshakes', 0)})")
+        
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+    finally:
+        if executor:
+            executor.close()
+        if cassette:
+            cassette.close()
+        if checkpoint:
+            if checkpoint.metadata.get('status') == 'running':
+                checkpoint.update_metadata(status='interrupted', elapsed=previous_elapsed + time.perf_counter() - run_start)
+            checkpoint.close()
+
+
+@cli.command()
+@click.option('--cases', '-c', required=True, type=click.Path(exists=True), help='Test cases file (JSON array or JSONL, optionally .gz) from generate or import')
+@click.option('--spec', '-s', type=click.Path(exists=True), help='OpenAPI specification used to resolve schemas and the base URL')
+@click.option('--base-url', '-u', help='Base URL for API requests')
+@click.option('--output', '-o', default='html', help='Report format (html, json, markdown, jsonl, csv, parquet)')
+@click.option('--compress', type=click.Choice(['gzip', 'zstd']), help='Compress json, jsonl and csv reports (zstd requires zstandard)')
+@click.option('--batch-size', default=100, show_default=True, type=int, help='Number of test cases loaded and executed at a time')
+@click.option('--http2', is_flag=True, help='Send requests over multiplexed HTTP/2 connections (requires httpx[http2])')
+@click.option('--fail-fast', is_flag=True, help='Stop the run at the first failed or errored test')
+@click.option('--max-failures', type=click.IntRange(min=1), help='Stop the run after this many failed or errored tests')
+def run(cases, spec, base_url, output, batch_size, http2, fail_fast, max_failures, compress):
+    """Execute saved test cases without generating new ones."""
+    
+    executor = None
+    try:
+        from api_tester import OpenAPIParser, TestExecutor, ResponseValidator, TestReporter
+        from api_tester.core.runner import TestRunner
+        from api_tester.core.streaming import iter_test_cases
+        from api_tester.models.schemas import APISpec, TestReport
+        
+        run_start = time.perf_counter()
+        spec_data = {}
+        api_spec = APISpec(title="Saved test cases", version="1.0.0")
+        if spec:
+            click.echo("🔍 Parsing OpenAPI specification...")
+            parser = OpenAPIParser()
+            api_spec = parser.parse_file(spec)
+            spec_data = parser.spec_data
+        
+        if base_url:
+            set_base_url(api_spec, base_url)
+        elif api_spec.base_url:
+            base_url = str(api_spec.base_url)
+        else:
+            raise click.UsageError("--base-url is required when the spec has no servers")
+        
+        executor = TestExecutor(base_url=base_url, http2=http2)
+        executor.set_api_key("special-key", header_name="api_key")
+        runner = TestRunner(None, executor, ResponseValidator(), spec_data, progress=click.echo,
+                            max_failures=max_failures or (1 if fail_fast else None))
+        
+        click.echo(f"📂 Running test cases from {cases}...")
+        all_test_results = runner.run_test_cases(iter_test_cases(cases), batch_size=batch_size)
+        
+        click.echo("\n📝 Generating test report...")
+        test_report = TestReport(
+            api_spec=api_spec,
+            test_results=all_test_results,
+            execution_time=time.perf_counter() - run_start,
+            metadata={'cases_file': str(cases)}
+        )
+        if runner.stopped:
+            test_report.metadata['stopped_early'] = stopped_early_metadata(runner, all_test_results)
+        report_path = TestReporter().generate_report(test_report, output, compression=compress)
+        click.echo(f"✅ Report generated: {report_path}")
+        
+        click.echo(f"\n📊 Final Summary:")
+        click.echo(f"   Total Tests: {test_report.total_tests}")
+        click.echo(f"   Passed: {test_report.passed_tests}")
+        click.echo(f"   Failed: {test_report.failed_tests}")
+        click.echo(f"   Errors: {test_report.error_tests}")
+        if test_report.skipped_tests:
+            click.echo(f"   Skipped: {test_report.skipped_tests}")
+        click.echo(f"   Success Rate: {test_report.success_rate:.1f}%")
+        echo_stopped_early(runner, all_test_results)
+        
+    except click.UsageError:
+        raise
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+    finally:
+        if executor:
+            executor.close()
+
+
+@cli.command()
+@click.option('--spec', '-s', required=True, type=click.Path(exists=True), help='Path to OpenAPI specification file')
+@click.option('--base-url', '-u', help='Base URL for API requests')
+@click.option('--cases', '-c', type=click.Path(exists=True), help='Seed test cases (JSON array or JSONL); default: sampled from the spec')
+@click.option('--duration', default=30.0, show_default=True, type=float, help='Seconds to fuzz for')
+@click.option('--max-cases', type=int, help='Stop after sending this many mutated cases')
+@click.option('--workers', default=8, show_default=True, type=int, help='Concurrent requests in flight')
+@click.option('--seed', type=int, help='Random seed for reproducible mutations')
+@click.option('--output-dir', '-o', default='fuzz_results', show_default=True, help='Directory for corpus.jsonl and crashes.jsonl')
+def fuzz(spec, base_url, cases, duration, max_cases, workers, seed, output_dir):
+    """Mutate test cases and keep the inputs that trigger new API behaviour."""
+    
+    try:
+        from api_tester import OpenAPIParser
+        from api_tester.core.fuzzer import Fuzzer, seed_test_cases
+        from api_tester.core.streaming import iter_test_cases
+        
+        click.echo("🔍 Parsing OpenAPI specification...")
+        parser = OpenAPIParser()
+        api_spec = parser.parse_file(spec)
+        
+        base_url = base_url or (str(api_spec.base_url) if api_spec.base_url else None)
+        if not base_url:
+            raise click.UsageError("--base-url is required when the spec has no servers")
+        
+        seeds = list(iter_test_cases(cases)) if cases else seed_test_cases(api_spec.endpoints, parser.spec_data, seed=seed)
+        click.echo(f"🐛 Fuzzing {base_url} from {len(seeds)} seeds with {workers} workers...")
+        fuzzer = Fuzzer(base_url, parser.spec_data, seeds, workers=workers, seed=seed,
+                        headers={'api_key': 'special-key'}, progress=click.echo)
+        stats = fuzzer.run(duration=duration, max_cases=max_cases)
+        
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        for name, test_cases in (('corpus.jsonl', [tc for tc, _ in fuzzer.corpus]), ('crashes.jsonl', fuzzer.crashes)):
+            with open(output_path / name, 'w', encoding='utf-8') as f:
+                for test_case in test_cases:
+                    f.write(json.dumps(test_case.model_dump(mode='json')) + '\n')
+        
+        click.echo(f"\n📊 Fuzzing Summary:")
+        click.echo(f"   Cases: {stats['cases']} in {stats['elapsed']:.1f}s ({stats['rate']:.0f}/s)")
+        click.echo(f"   Distinct signatures: {stats['signatures']}")
+        click.echo(f"   Corpus: {stats['corpus']} inputs -> {output_path / 'corpus.jsonl'}")
+        click.echo(f"   Crashes: {stats['crashes']} -> {output_path / 'crashes.jsonl'}")
+        click.echo(f"📝 Replay with: python cli.py run --cases {output_path / 'crashes.jsonl'} --spec {spec}")
+        
+    except click.UsageError:
+        raise
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.command()
+@click.argument('reports', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--output', '-o', default='html', help='Report format (html, json, markdown, jsonl, csv, parquet)')
+@click.option('--compress', type=click.Choice(['gzip', 'zstd']), help='Compress json, jsonl and csv reports (zstd requires zstandard)')
+def merge(reports, output, compress):
+    """Merge per-shard JSON or JSONL reports into a single report."""
+    
+    try:
+        from api_tester import TestReporter
+        from api_tester.core.sharding import merge_reports
+        
+        reporter = TestReporter()
+        
+        click.echo(f"🧩 Merging {len(reports)} reports...")
+        test_report = merge_reports([reporter.load_report(path) for path in reports])
+        
+        report_path = reporter.generate_report(test_report, output, compression=compress)
+        click.echo(f"✅ Report generated: {report_path}")
+        
+        click.echo(f"\n📊 Merged Summary:")
+        click.echo(f"   Total Tests: {test_report.total_tests}")
+        click.echo(f"   Passed: {test_report.passed_tests}")
+        click.echo(f"   Failed: {test_report.failed_tests}")
+        click.echo(f"   Errors: {test_report.error_tests}")
+        if test_report.skipped_tests:
+            click.echo(f"   Skipped: {test_report.skipped_tests}")
         click.echo(f"   Success Rate: {test_report.success_rate:.1f}%")
         
     except Exception as e:
@@ -113,20 +496,108 @@ def test(spec, base_url, model, output):
         raise click.Abort()
 
 
+@cli.command()
+@click.argument('run_a')
+@click.argument('run_b')
+@click.option('--runs-dir', default=DEFAULT_RUNS_DIR, show_default=True, help='Directory where run checkpoints are stored')
+@click.option('--alpha', default=0.05, show_default=True, type=float, help='Significance level for latency changes (false discovery rate across endpoints)')
+@click.option('--min-change', default=0.10, show_default=True, type=float, help='Smallest median latency change reported (0.10 = 10%)')
+@click.option('--min-delta-ms', default=1.0, show_default=True, type=float, help='Smallest absolute median latency change reported')
+@click.option('--min-samples', default=5, show_default=True, type=int, help='Samples per endpoint and run needed to test a latency change')
+@click.option('--limit', default=20, show_default=True, type=int, help='Maximum test cases listed per category (0 for no limit)')
+@click.option('--output', '-o', type=click.Path(), help='Also write the full diff as JSON to this file')
+@click.option('--fail-on-regression', is_flag=True, help='Exit with status 1 on new failures or significantly slower endpoints')
+def diff(run_a, run_b, runs_dir, alpha, min_change, min_delta_ms, min_samples, limit, output, fail_on_regression):
+    """Compare two runs: new failures, fixed cases and latency per endpoint.
+    
+    RUN_A and RUN_B are run IDs (from --runs-dir), run directories, or
+    json, jsonl or csv reports.
+    """
+    
+    regressed = False
+    try:
+        from api_tester.core.comparison import iter_rows, diff_runs
+        
+        click.echo(f"🔍 Comparing {run_a} with {run_b}...")
+        result = diff_runs(iter_rows(run_a, runs_dir), iter_rows(run_b, runs_dir),
+                           alpha=alpha, min_change=min_change, min_delta_ms=min_delta_ms, min_samples=min_samples)
+        slower = [row for row in result['latency'] if row['verdict'] == 'slower']
+        faster = [row for row in result['latency'] if row['verdict'] == 'faster']
+        
+        click.echo(f"\n📊 Diff Summary:")
+        click.echo(f"   Results: {result['a']['results']} → {result['b']['results']} "
+                   f"({result['matched']} matched, {len(result['added'])} added, {len(result['removed'])} removed)")
+        click.echo(f"   Failures: {result['a']['failed']} → {result['b']['failed']}")
+        click.echo(f"   New Failures: {len(result['new_failures'])}")
+        click.echo(f"   Fixed: {len(result['fixed'])}")
+        click.echo(f"   Still Failing: {len(result['still_failing'])}")
+        click.echo(f"   Endpoints: {len(slower)} slower, {len(faster)} faster, "
+                   f"{len(result['latency']) - len(slower) - len(faster)} unchanged or too few samples")
+        
+        for title, changes in (("❌ New failures", result['new_failures']), ("✅ Fixed", result['fixed'])):
+            if changes:
+                click.echo(f"\n{title}:")
+                for change in changes[:limit or None]:
+                    click.echo(f"   {change['endpoint']} · {change['test_case']} ({change['status_a']} → {change['status_b']})")
+                if limit and len(changes) > limit:
+                    click.echo(f"   ... and {len(changes) - limit} more")
+        
+        if slower or faster:
+            click.echo(f"\n⏱️  Latency changes (median ms):")
+            for row in slower + faster:
+                marker = "🔺" if row['verdict'] == 'slower' else "🔻"
+                click.echo(f"   {marker} {row['endpoint']}: {row['median_ms_a']:.1f} → {row['median_ms_b']:.1f} "
+                           f"({row['change']:+.0%}, p={row['p_adjusted']:.3g}, n={row['samples_a']}/{row['samples_b']})")
+        
+        if output:
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2)
+            click.echo(f"\n✅ Diff written to {output}")
+        
+        regressed = bool(result['new_failures'] or slower)
+        
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+    
+    if fail_on_regression and regressed:
+        raise SystemExit(1)
+
+
 @cli.command()
 @click.option('--spec', '-s', required=True, help='Path to OpenAPI specification file')
 @click.option('--output', '-o', default='test_cases.json', help='Output file for test cases')
-def generate(spec, output):
+@click.option('--model', '-m', default='gpt-3.5-turbo', help='OpenAI model to use')
+@click.option('--bulk', type=click.Choice(['pairwise', 'product']), help='Generate boundary combinations from parameter schemas instead of using the LLM')
+@click.option('--max-cases', default=1000, show_default=True, type=int, help='Maximum combinations per endpoint (with --bulk)')
+@click.option('--seed', type=int, help='Random seed for reproducible combinations (with --bulk)')
+@click.option('--max-prompt-tokens', default=1500, show_default=True, type=int, help='Token budget per generation prompt; nested schemas are collapsed to fit')
+@click.option('--llm-max-tokens', type=int, help='Stop calling the LLM after this many tokens and use the offline fallback')
+@click.option('--llm-max-cost', type=float, help='Stop calling the LLM once the estimated cost reaches this many USD')
+@click.option('--llm-max-seconds', type=float, help='Stop calling the LLM after this many seconds spent waiting on it')
+def generate(spec, output, model, bulk, max_cases, seed, max_prompt_tokens, llm_max_tokens, llm_max_cost, llm_max_seconds):
     """Generate test cases without executing them."""
     
     try:
+        from api_tester import OpenAPIParser
+        
         # Parse OpenAPI spec
         click.echo("🔍 Parsing OpenAPI specification...")
         parser = OpenAPIParser()
         api_spec = parser.parse_file(spec)
         
         # Generate test cases
-        generator = TestCaseGenerator()
+        if bulk:
+            from api_tester.core.combinatorial import BulkGenerator
+            generator = BulkGenerator(parser.spec_data, strategy=bulk, max_cases=max_cases, seed=seed)
+        else:
+            from api_tester import TestCaseGenerator
+            from api_tester.core.llm_usage import UsageTracker
+            usage = UsageTracker(model, max_tokens=llm_max_tokens, max_cost=llm_max_cost, max_seconds=llm_max_seconds)
+            generator = TestCaseGenerator(model=model, spec_data=parser.spec_data, max_prompt_tokens=max_prompt_tokens,
+                                          usage=usage)
+            if generator.is_offline:
+                click.echo("⚠️  OPENAI_API_KEY is not set, test cases come from the offline fallback generator")
         all_test_cases = []
         
         for endpoint in api_spec.endpoints:
@@ -140,6 +611,50 @@ def generate(spec, output):
             json.dump(all_test_cases, f, indent=2, default=str)
         
         click.echo(f"✅ Generated {len(all_test_cases)} test cases: {output}")
+        if not bulk:
+            echo_llm_usage(generator.usage)
+        
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.command(name='import')
+@click.argument('capture', type=click.Path(exists=True))
+@click.option('--spec', '-s', required=True, help='Path to OpenAPI specification file')
+@click.option('--format', 'capture_format', type=click.Choice(['har', 'jsonl']), help='Capture format (default: from the file extension)')
+@click.option('--output', '-o', default='test_cases.json', help='Output file for test cases')
+@click.option('--max-per-endpoint', default=50, show_default=True, type=int, help='Maximum distinct test cases kept per endpoint (0 for no limit)')
+def import_traffic(capture, spec, capture_format, output, max_per_endpoint):
+    """Build test cases from captured traffic (HAR file or JSONL access log)."""
+    
+    try:
+        from urllib.parse import urlsplit
+        from api_tester import OpenAPIParser
+        from api_tester.core.importer import TrafficImporter, iter_traffic
+        
+        click.echo("🔍 Parsing OpenAPI specification...")
+        parser = OpenAPIParser()
+        api_spec = parser.parse_file(spec)
+        
+        importer = TrafficImporter(
+            api_spec.endpoints,
+            base_path=urlsplit(parser.base_url or '').path,
+            max_per_endpoint=max_per_endpoint or None
+        )
+        
+        click.echo(f"📥 Importing traffic from {capture}...")
+        # Test cases are written as they are produced, so the capture is never held in memory
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write('[')
+            for count, test_case in enumerate(importer.import_requests(iter_traffic(capture, capture_format))):
+                f.write(',\n' if count else '\n')
+                f.write(json.dumps(test_case.model_dump(mode='json')))
+            f.write('\n]\n')
+        
+        stats = importer.stats
+        click.echo(f"✅ Imported {stats['imported']} test cases from {stats['requests']} requests: {output}")
+        click.echo(f"   Duplicates: {stats['duplicates']}, unmatched: {stats['unmatched']}, over per-endpoint limit: {stats['over_cap']}")
         
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
@@ -149,14 +664,19 @@ def generate(spec, output):
 @cli.command()
 @click.option('--url', '-u', required=True, help='Base URL of the API to discover')
 @click.option('--output', '-o', default='auto_generated_api.yaml', help='Output file for generated spec')
-def discover(url, output):
+@click.option('--wordlist', '-w', type=click.Path(exists=True), help='File with candidate paths to probe, one per line')
+@click.option('--concurrency', '-c', default=16, show_default=True, type=int, help='Maximum number of probes in flight')
+@click.option('--rate-limit', type=float, help='Maximum requests per second')
+@click.option('--crawl-limit', default=200, show_default=True, type=int, help='Maximum GET requests for crawling JSON responses (0 disables crawling)')
+def discover(url, output, wordlist, concurrency, rate_limit, crawl_limit):
     """Auto-generate OpenAPI specification from API URL."""
     
     try:
         from api_tester.core.spec_generator import generate_spec_from_url
         
         click.echo(f"🔍 Discovering API endpoints at {url}...")
-        spec_file = generate_spec_from_url(url, output)
+        spec_file = generate_spec_from_url(url, output, wordlist=wordlist, max_workers=concurrency,
+                                           rate_limit=rate_limit, crawl_limit=crawl_limit)
         click.echo(f"✅ Generated OpenAPI spec: {spec_file}")
         click.echo(f"📝 You can now test the API with: python cli.py test --spec {spec_file}")
         
@@ -165,5 +685,42 @@ def discover(url, output):
         raise click.Abort()
 
 
+@cli.command()
+@click.option('--spec', '-s', required=True, help='Path to OpenAPI specification file')
+@click.option('--host', default='127.0.0.1', help='Host to bind')
+@click.option('--port', '-p', default=8000, type=int, help='Port to listen on')
+@click.option('--latency-ms', default=0.0, type=float, help='Artificial latency added to every response')
+@click.option('--latency-jitter-ms', default=0.0, type=float, help='Random extra latency, uniformly distributed')
+@click.option('--error-rate', default=0.0, type=float, help='Fraction of requests answered with an injected error (0-1)')
+@click.option('--error-status', default=500, type=int, help='Status code used for injected errors')
+@click.option('--seed', type=int, help='Random seed for deterministic responses')
+def mock(spec, host, port, latency_ms, latency_jitter_ms, error_rate, error_status, seed):
+    """Serve schema-valid mock responses for every endpoint in a spec."""
+    
+    try:
+        import asyncio
+        from api_tester import OpenAPIParser
+        from api_tester.core.mock_server import MockServer
+        
+        parser = OpenAPIParser()
+        api_spec = parser.parse_file(spec)
+        
+        server = MockServer(
+            parser.spec_data, api_spec.endpoints,
+            host=host, port=port,
+            latency_ms=latency_ms, latency_jitter_ms=latency_jitter_ms,
+            error_rate=error_rate, error_status=error_status, seed=seed
+        )
+        click.echo(f"🎭 Mocking {len(api_spec.endpoints)} endpoints at {server.url}")
+        click.echo(f"📝 Test against it with: python cli.py test --spec {spec} --base-url {server.url}")
+        asyncio.run(server.serve_forever())
+        
+    except KeyboardInterrupt:
+        click.echo("\n👋 Mock server stopped")
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+
+
 if __name__ == '__main__':
     cli() 
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+HTTP/1.1 (requests) and HTTP/2 (httpx) transports must give the executor identical results.
+
+The mock server is started as the CLI starts it and only speaks HTTP/1.1,
+so HTTP/1.1 runs talk to it directly. HTTP/2 runs go through a small h2c
+(prior knowledge) front end that relays every stream to the mock server
+as a real HTTP/1.1 request, so the same test cases must come back with the
+same statuses and bodies over either transport.
+"""
+
+import http.client
+import socketserver
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+
+h2_connection = pytest.importorskip("h2.connection")
+pytest.importorskip("httpx")
+
+import h2.config
+import h2.events
+
+# Aliased so pytest does not try to collect the Test* classes
+from api_tester.core.executor import TestExecutor as Executor
+from api_tester.core.generator import TestCaseGenerator as CaseGenerator
+from api_tester.core.mock_server import MockServer
+from api_tester.core.parser import OpenAPIParser
+from api_tester.models.schemas import TestCase as Case
+
+SPEC_PATH = Path(__file__).resolve().parent.parent / "examples" / "petstore.yaml"
+
+
+class _H2RelayHandler(socketserver.BaseRequestHandler):
+    """Serve one h2c connection, forwarding each stream to the HTTP/1.1 upstream."""
+
+    def handle(self):
+        self.server.connections += 1
+        upstream = http.client.HTTPConnection(*self.server.upstream, timeout=10)
+        try:
+            self._serve(upstream)
+        finally:
+            upstream.close()
+
+    def _serve(self, upstream: http.client.HTTPConnection):
+        conn = h2_connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding='utf-8'))
+        conn.initiate_connection()
+        self.request.sendall(conn.data_to_send())
+        streams = {}
+        while True:
+            data = self.request.recv(65535)
+            if not data:
+                return
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    streams[event.stream_id] = (dict(event.headers), bytearray())
+                elif isinstance(event, h2.events.DataReceived):
+                    streams[event.stream_id][1].extend(event.data)
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers, body = streams.pop(event.stream_id)
+                    request_headers = {name: value for name, value in headers.items() if not name.startswith(':')}
+                    upstream.request(headers[':method'], headers[':path'], body=bytes(body), headers=request_headers)
+                    response = upstream.getresponse()
+                    payload = response.read()
+                    response_headers = [(':status', str(response.status)), ('content-length', str(len(payload)))]
+                    if response.getheader('Content-Type'):
+                        response_headers.append(('content-type', response.getheader('Content-Type')))
+                    conn.send_headers(event.stream_id, response_headers, end_stream=not payload)
+                    # The mock's bodies fit in the default flow-control window
+                    for start in range(0, len(payload), conn.max_outbound_frame_size):
+                        chunk = payload[start:start + conn.max_outbound_frame_size]
+                        conn.send_data(event.stream_id, chunk, end_stream=start + len(chunk) >= len(payload))
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    self.request.sendall(conn.data_to_send())
+                    return
+            self.request.sendall(conn.data_to_send())
+
+
+class _H2RelayServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, upstream_url: str):
+        super().__init__(('127.0.0.1', 0), _H2RelayHandler)
+        parts = urlsplit(upstream_url)
+        self.upstream = (parts.hostname, parts.port)
+        self.connections = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture(scope="module")
+def petstore():
+    parser = OpenAPIParser()
+    api_spec = parser.parse_file(str(SPEC_PATH))
+    return parser.spec_data, api_spec.endpoints
+
+
+@pytest.fixture(scope="module")
+def mock_url(petstore):
+    spec_data, endpoints = petstore
+    # No base path and one body variant per endpoint, so every response is reproducible
+    server = MockServer(dict(spec_data, servers=[]), endpoints, port=0, seed=1, variants=1)
+    yield server.start_in_thread()
+    server.stop()
+
+
+@pytest.fixture(scope="module")
+def relay(mock_url):
+    relay = _H2RelayServer(mock_url)
+    thread = threading.Thread(target=relay.serve_forever, daemon=True)
+    thread.start()
+    yield relay
+    relay.shutdown()
+    relay.server_close()
+
+
+@pytest.fixture(scope="module")
+def test_cases(petstore, monkeypatch_module):
+    spec_data, endpoints = petstore
+    monkeypatch_module.delenv('OPENAI_API_KEY', raising=False)
+    generator = CaseGenerator(spec_data=spec_data)
+    cases = [case for endpoint in endpoints for case in generator.generate_test_cases(endpoint)]
+    # A path the spec does not declare
+    cases.append(Case(name="Unknown path", description="", endpoint=endpoints[0].model_copy(
+        update={'path': '/does-not-exist'}), input_data={}, expected_status=404, test_type="invalid"))
+    return cases
+
+
+@pytest.fixture(scope="module")
+def monkeypatch_module():
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
+
+
+def _execute(base_url, test_cases, http2):
+    executor = Executor(base_url=base_url, request_delay=0, dedupe=False, http2=http2)
+    try:
+        return executor.execute_test_cases(test_cases), executor.connection_stats()
+    finally:
+        executor.close()
+
+
+def test_http2_matches_http1(mock_url, relay, test_cases):
+    http1_results, _ = _execute(mock_url, test_cases, http2=False)
+    http2_results, stats = _execute(relay.url, test_cases, http2=True)
+
+    assert relay.connections > 0
+    assert stats['requests'] == stats['requests_http2'] == len(test_cases)
+    assert len({result.response_status for result in http1_results}) > 1
+
+    for http1, http2 in zip(http1_results, http2_results, strict=True):
+        assert http2.error_message is None, http2.error_message
+        assert http2.status == http1.status, http1.test_case.name
+        assert http2.response_status == http1.response_status, http1.test_case.name
+        assert http2.response_body == http1.response_body, http1.test_case.name
+        assert http2.response_headers.get('content-type') == http1.response_headers.get('Content-Type')